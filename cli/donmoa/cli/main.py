@@ -2,17 +2,32 @@
 CLI 인터페이스
 """
 
+import json
 import click
 from pathlib import Path
+from typing import Optional
 from rich.console import Console
 from rich.table import Table
 import requests
 from datetime import datetime
 
+from ..core.csv_exporter import find_latest_export_dir
 from ..core.donmoa import Donmoa
+from ..core.outbox import UploadOutbox
+from ..core.uploader import SnapshotUploader
 from ..utils.config import config_manager
+from ..utils.logger import configure_logging, flush_logs
 
-console = Console()
+
+class _Console(Console):
+    """로그 대기열을 비운 뒤 출력해 로그와 결과 출력 순서를 유지하는 콘솔"""
+
+    def print(self, *args, **kwargs):
+        flush_logs()
+        super().print(*args, **kwargs)
+
+
+console = _Console()
 
 
 @click.group()
@@ -23,11 +38,19 @@ def cli(config):
         config_manager.config_path = Path(config)
         config_manager.reload()
 
+    configure_logging(
+        level=config_manager.get("logging.level", "INFO"),
+        log_file=config_manager.get("logging.file"),
+        console_output=config_manager.get("logging.console", True),
+        json_format=config_manager.get("logging.json", False),
+    )
+
 
 @cli.command()
 @click.option('--input-dir', '-i', help='입력 파일 디렉토리')
 @click.option('--output-dir', '-o', help='출력 디렉토리')
-def collect(input_dir, output_dir):
+@click.option('--resume', is_flag=True, help='중단된 최근 실행의 체크포인트에서 이어서 실행')
+def collect(input_dir, output_dir, resume):
     """데이터를 수집하고 CSV로 내보냅니다"""
     donmoa = Donmoa()
 
@@ -38,16 +61,128 @@ def collect(input_dir, output_dir):
         output_dir = config_manager.get("export.output_dir", "data/export")
 
     # 워크플로우 실행
-    result = donmoa.run_full_workflow(input_dir, Path(output_dir) if output_dir else None)
+    result = donmoa.run_full_workflow(input_dir, Path(output_dir) if output_dir else None, resume=resume)
 
     if result['status'] == 'success':
         console.print(f"[green]SUCCESS: {result['total_records']}개 레코드 처리[/green]")
         for file_type, file_path in result['exported_files'].items():
             console.print(f"  {file_type}: {file_path}")
+        for name, reason in result['collection_summary'].get('failed', {}).items():
+            console.print(f"[yellow]⚠️ {name}: 수집 제외 - {reason}[/yellow]")
+        _print_portfolio_summary(result.get('portfolio_summary') or [])
+        if config_manager.get("performance.memory_tracking", False) or config_manager.get("performance.memory_budget_mb"):
+            _print_memory_report(result.get('memory') or [])
+        entry = UploadOutbox().get(result['upload_key']) if result.get('upload_key') else None
+        if entry and entry['status'] == 'pending':
+            console.print("[cyan]업로드 대기열에 추가됨 (donmoa drain으로 전송)[/cyan]")
     else:
         console.print(f"[red]ERROR: {result['message']}[/red]")
 
 
+def _print_portfolio_summary(records) -> None:
+    """계좌별/자산군별 합계와 통화별 총액을 표로 출력합니다."""
+    if not records:
+        return
+
+    table = Table(title="포트폴리오 요약")
+    table.add_column("구분", style="cyan")
+    table.add_column("항목")
+    table.add_column("통화")
+    table.add_column("현금", justify="right")
+    table.add_column("포지션", justify="right")
+    table.add_column("합계", justify="right", style="bold")
+
+    from ..utils.money import format_amount
+
+    labels = {"total": "전체", "account": "계좌", "asset_class": "자산군"}
+    for record in records:
+        if record["group"] not in labels:
+            continue
+        table.add_row(
+            labels[record["group"]], str(record["key"]), record["currency"],
+            *[format_amount(record[column], record["currency"]) for column in ("cash", "positions", "total")]
+        )
+    console.print(table)
+
+
+def _print_memory_report(stages) -> None:
+    """단계(Provider별 수집, 내보내기 등)별 메모리 사용량을 표로 출력합니다."""
+    if not stages:
+        return
+
+    def mb(value) -> str:
+        return "-" if value is None else f"{value:,.1f}"
+
+    budget = config_manager.get("performance.memory_budget_mb")
+    table = Table(title=f"메모리 사용량 (MB{f', 예산 {budget:,}' if budget else ''})")
+    table.add_column("단계", style="cyan", no_wrap=True)
+    table.add_column("RSS 이후", justify="right")
+    table.add_column("증감", justify="right")
+    table.add_column("최대 RSS", justify="right")
+    table.add_column("할당 최고", justify="right")
+    table.add_column("시간(초)", justify="right")
+    table.add_column("절약 모드")
+
+    for stage in stages:
+        delta = stage.get("rss_delta")
+        table.add_row(
+            stage["stage"], mb(stage.get("rss_after")),
+            "-" if delta is None else f"{delta:+,.1f}",
+            mb(stage.get("rss_peak")), mb(stage.get("traced_peak")),
+            f"{stage['seconds']:.2f}", "예" if stage.get("low_memory") else ""
+        )
+    console.print(table)
+
+
+@cli.command()
+@click.option('--input-dir', '-i', help='입력 파일 디렉토리 (날짜 폴더를 직접 지정 가능)')
+@click.option('--all', 'all_folders', is_flag=True, help='모든 날짜 폴더를 순서대로 처리')
+@click.option('--no-upload', is_flag=True, help='업로드 단계를 건너뜀')
+@click.option('--notes', '-n', help='스냅샷 노트')
+@click.option('--resume', is_flag=True, help='완료된 폴더는 건너뛰고 중단된 폴더는 체크포인트에서 이어서 실행')
+def sync(input_dir, all_folders, no_upload, notes, resume):
+    """수집, 내보내기, 업로드를 하나의 비동기 파이프라인으로 실행합니다"""
+    from ..core.sync_pipeline import SyncPipeline
+    from ..utils.date_utils import extract_date_from_folder_name, get_all_date_folders
+
+    if not input_dir:
+        input_dir = config_manager.get("input_dir", "data/input")
+    input_path = Path(input_dir)
+
+    if extract_date_from_folder_name(input_path):
+        folders = [input_path]
+    else:
+        date_folders = [folder for _, folder in get_all_date_folders(input_path)]
+        folders = date_folders if all_folders else date_folders[-1:]
+
+    if not folders:
+        console.print(f"[red]ERROR: 날짜 폴더를 찾을 수 없습니다: {input_dir}[/red]")
+        return
+
+    result = SyncPipeline(upload=not no_upload, resume=resume).run(folders, notes)
+
+    table = Table(title="Donmoa 동기화 결과")
+    table.add_column("날짜", style="cyan")
+    table.add_column("상태")
+    table.add_column("레코드", justify="right")
+    table.add_column("업로드")
+    table.add_column("export 디렉토리")
+
+    for item in result["folders"]:
+        table.add_row(
+            item.get("date") or item["folder"],
+            item["status"] if item["status"] != "error" else f"[red]{item.get('message', 'error')}[/red]",
+            str(item.get("total_records", "-")),
+            item.get("upload", "-"),
+            item.get("export_dir") or "-",
+        )
+
+    console.print(table)
+    for item in result["folders"]:
+        for name, reason in (item.get("failed_providers") or {}).items():
+            console.print(f"[yellow]⚠️ {item.get('date') or item['folder']} {name}: 수집 제외 - {reason}[/yellow]")
+
+
 @cli.command()
 @click.option('--input-dir', '-i', help='입력 파일 디렉토리')
 def status(input_dir):
@@ -118,6 +253,58 @@ def template(input_dir):
         console.print(f"[red]ERROR: 템플릿 생성 실패: {result['message']}[/red]")
 
 
+@cli.command()
+@click.option('--start', '-s', help='시작 날짜 (YYYY-MM-DD)')
+@click.option('--end', '-e', help='종료 날짜 (YYYY-MM-DD)')
+@click.option('--by', '-b', 'group_by', type=click.Choice(['net-worth', 'account', 'ticker']),
+              default='net-worth', help='시계열 기준 (순자산/계좌별 현금/종목별 매입금액, 포지션은 매입금액 기준)')
+@click.option('--base', 'base_currency', help='이 통화로 환산 (예: KRW, USD, 로컬 환율 필요)')
+@click.option('--rebuild', is_flag=True, help='이력 캐시를 처음부터 다시 생성')
+def history(start, end, group_by, base_currency, rebuild):
+    """과거 스냅샷의 시계열을 조회합니다"""
+    from ..core.history import HistoryEngine
+    from ..utils.money import currency_digits
+
+    for value in (start, end):
+        if value:
+            try:
+                datetime.strptime(value, "%Y-%m-%d")
+            except ValueError:
+                console.print(f"[red]ERROR: 올바른 날짜 형식이 아닙니다: {value} (YYYY-MM-DD)[/red]")
+                return
+
+    engine = HistoryEngine()
+    if rebuild:
+        engine.rebuild()
+    else:
+        engine.refresh()
+
+    if group_by == 'net-worth':
+        frame = engine.net_worth(start, end, base_currency).to_frame()
+    elif group_by == 'account':
+        frame = engine.cash_by_account(start, end, base_currency)
+    else:
+        frame = engine.position_cost_by_ticker(start, end, base_currency)
+
+    if frame.empty:
+        console.print("[yellow]조회 기간에 해당하는 스냅샷이 없습니다.[/yellow]")
+        return
+
+    title = f"Donmoa 이력 ({group_by}, {base_currency.upper()})" if base_currency else f"Donmoa 이력 ({group_by})"
+    caption = "포지션은 매입금액(수량 × 평균단가) 기준" if group_by != 'account' else None
+    table = Table(title=title, caption=caption)
+    table.add_column("날짜", style="cyan")
+    for column in frame.columns:
+        table.add_column(str(column), justify="right")
+
+    # 환산하지 않으면 여러 통화가 섞인 합계이므로 정수로 표시
+    digits = currency_digits(base_currency) if base_currency else 0
+    for index, row in frame.iterrows():
+        table.add_row(index.strftime("%Y-%m-%d"), *[f"{value:,.{digits}f}" for value in row])
+
+    console.print(table)
+
+
 @cli.command()
 @click.option('--export-dir', '-e', help='내보낸 CSV가 있는 디렉토리')
 @click.option('--date', '-d', help='스냅샷 날짜 (YYYY-MM-DD)')
@@ -149,9 +336,9 @@ def upload(export_dir, date, notes):
         # 최근 export 디렉토리 찾기
         export_base = Path(config_manager.get("export.output_dir", "data/export"))
         if export_base.exists():
-            subdirs = sorted([d for d in export_base.iterdir() if d.is_dir()], reverse=True)
-            if subdirs:
-                export_dir = str(subdirs[0])
+            latest_dir = find_latest_export_dir(export_base)
+            if latest_dir:
+                export_dir = str(latest_dir)
                 console.print(f"[yellow]최근 export 디렉토리 사용: {export_dir}[/yellow]")
             else:
                 console.print("[red]ERROR: export 디렉토리를 찾을 수 없습니다.[/red]")
@@ -166,51 +353,26 @@ def upload(export_dir, date, notes):
         return
 
     # CSV 파일 확인
-    cash_file = export_path / "cash.csv"
-    positions_file = export_path / "positions.csv"
-    transactions_file = export_path / "transactions.csv"
-
-    files = {}
-    if cash_file.exists():
-        files['cash_file'] = ('cash.csv', open(cash_file, 'rb'), 'text/csv')
-    if positions_file.exists():
-        files['positions_file'] = ('positions.csv', open(positions_file, 'rb'), 'text/csv')
-    if transactions_file.exists():
-        files['transactions_file'] = ('transactions.csv', open(transactions_file, 'rb'), 'text/csv')
+    uploader = SnapshotUploader(api_url, api_token)
+    files = uploader.find_files(export_path)
 
     if not files:
         console.print(f"[red]ERROR: CSV 파일을 찾을 수 없습니다: {export_dir}[/red]")
         return
 
     console.print(f"[cyan]업로드할 파일:[/cyan]")
-    for key in files.keys():
+    for key in files:
         console.print(f"  - {key.replace('_file', '')}.csv")
 
     # API 요청
     try:
         console.print(f"[cyan]API로 업로드 중...[/cyan]")
 
-        data = {'snapshot_date': date}
-        if notes:
-            data['notes'] = notes
-
-        headers = {
-            'Authorization': f'Bearer {api_token}'
-        }
-
-        response = requests.post(
-            f"{api_url}/v1/snapshots/upload",
-            files=files,
-            data=data,
-            headers=headers,
-            timeout=60
-        )
-
-        # 파일 핸들 닫기
-        for _, file_tuple in files.items():
-            file_tuple[1].close()
+        # 대기열(drain)과 같은 멱등성 키를 보내 재시도해도 스냅샷이 중복 생성되지 않도록 함
+        idempotency_key = UploadOutbox.idempotency_key(export_path, date)
+        response = uploader.post(export_path, date, notes, extra_headers={"Idempotency-Key": idempotency_key})
 
-        if response.status_code == 200:
+        if SnapshotUploader.is_success(response):
             result = response.json()
             console.print(f"[green]SUCCESS: 스냅샷 업로드 완료 (ID: {result['snapshot_id']})[/green]")
             console.print(f"  파싱된 행 수:")
@@ -241,11 +403,338 @@ def upload(export_dir, date, notes):
 
     except requests.exceptions.Timeout:
         console.print("[red]ERROR: API 요청 시간 초과[/red]")
+        _enqueue_failed_upload(export_path, date, notes)
     except requests.exceptions.ConnectionError:
         console.print(f"[red]ERROR: API 서버에 연결할 수 없습니다: {api_url}[/red]")
+        _enqueue_failed_upload(export_path, date, notes)
     except Exception as e:
         console.print(f"[red]ERROR: {str(e)}[/red]")
 
 
+@cli.command()
+@click.option('--export-dir', '-e', help='export 디렉토리 (기본값: 최근 export)')
+@click.option('--base', 'base_currency', help='평가 통화 (기본값: fx.base_currency)')
+@click.option('--threshold', type=float, help='밴드 허용 오차 (예: 0.05, 설정의 band 규칙 대신 사용)')
+@click.option('--scenarios', type=int, default=0, help='무작위 수익률 what-if 시나리오 수')
+@click.option('--volatility', type=float, default=0.15, help='시나리오 수익률 표준편차')
+@click.option('--shock', 'shocks', multiple=True, help='자산군 수익률 충격 (예: equity=-0.2, 여러 번 지정 가능)')
+@click.option('--seed', type=int, help='시나리오 난수 시드')
+def rebalance(export_dir, base_currency, threshold, scenarios, volatility, shocks, seed):
+    """현재 비중을 목표 비중과 비교하고 밴드 규칙에 따른 거래를 제안합니다"""
+    import time
+    from ..core.rebalance import RebalanceEngine, random_shocks
+    from ..utils.money import format_amount
+
+    if export_dir:
+        export_path = Path(export_dir)
+    else:
+        export_path = find_latest_export_dir(Path(config_manager.get("export.output_dir", "data/export")))
+    if export_path is None or not export_path.is_dir():
+        console.print("[red]ERROR: export 디렉토리를 찾을 수 없습니다. 먼저 collect를 실행하세요.[/red]")
+        return
+
+    fixed = {}
+    for shock in shocks:
+        name, _, value = shock.partition("=")
+        try:
+            fixed[name.strip()] = float(value)
+        except ValueError:
+            console.print(f"[red]ERROR: 올바른 충격 형식이 아닙니다: {shock} (예: equity=-0.2)[/red]")
+            return
+
+    engine = RebalanceEngine()
+    if threshold is not None:
+        engine.threshold = threshold
+
+    try:
+        holdings = engine.load_holdings(export_path, base_currency)
+        proposal, plan = engine.propose(holdings)
+    except ValueError as e:
+        console.print(f"[red]ERROR: {e}[/red]")
+        return
+
+    table = Table(title=f"리밸런싱 제안 ({holdings.as_of}, {holdings.base_currency}, 밴드 ±{plan.threshold:.1%})")
+    table.add_column("범위", style="cyan")
+    table.add_column("자산군")
+    table.add_column("평가액", justify="right")
+    table.add_column("현재", justify="right")
+    table.add_column("목표", justify="right")
+    table.add_column("차이", justify="right")
+    table.add_column("제안 거래", justify="right")
+
+    for row in proposal.itertuples(index=False):
+        drift = f"{row.drift:+.1%}"
+        if abs(row.drift) > plan.threshold:
+            drift = f"[red]{drift}[/red]"
+        if row.trade > 0:
+            trade = f"[green]매수 {format_amount(row.trade, holdings.base_currency)}[/green]"
+        elif row.trade < 0:
+            trade = f"[red]매도 {format_amount(-row.trade, holdings.base_currency)}[/red]"
+        else:
+            trade = "-"
+        table.add_row(row.scope, row.asset_class, format_amount(row.value, holdings.base_currency), f"{row.weight:.1%}",
+                      f"{row.target:.1%}", drift, trade)
+    console.print(table)
+
+    if not proposal["breached"].any():
+        console.print("[green]모든 자산군이 밴드 안에 있습니다.[/green]")
+
+    if scenarios or fixed:
+        started = time.perf_counter()
+        scenario_shocks = random_shocks(holdings.asset_classes, scenarios, volatility, seed, fixed)
+        stats = engine.simulate(holdings, scenario_shocks)
+        elapsed = time.perf_counter() - started
+
+        console.print(
+            f"\n[bold]What-if 시나리오 {stats['scenarios']:,}개[/bold] ({elapsed:.2f}초): "
+            f"리밸런싱 발생 {stats['any_trigger_rate']:.1%}, "
+            f"평균 거래 {format_amount(stats['turnover_mean'], holdings.base_currency)} / "
+            f"95% {format_amount(stats['turnover_p95'], holdings.base_currency)} {holdings.base_currency}"
+        )
+        for bucket, rate in stats["trigger_rate"].items():
+            console.print(f"  {bucket}: {rate:.1%}")
+
+
+def _resolve_export_dir(name: str) -> Optional[Path]:
+    """경로, export 디렉토리 이름 또는 'latest'를 export 디렉토리로 바꿉니다."""
+    export_base = Path(config_manager.get("export.output_dir", "data/export"))
+    if name.lower() == "latest":
+        return find_latest_export_dir(export_base)
+    for candidate in (Path(name), export_base / name):
+        if candidate.is_dir():
+            return candidate
+    return None
+
+
+@cli.command()
+@click.argument('before')
+@click.argument('after', default='latest')
+@click.option('--type', '-t', 'types', multiple=True, type=click.Choice(['cash', 'positions', 'transactions']),
+              help='비교할 데이터 타입 (여러 번 지정 가능, 기본값 전체)')
+@click.option('--format', '-f', 'file_format', type=click.Choice(['table', 'csv', 'json']), default='table',
+              help='출력 형식')
+@click.option('--output', '-o', type=click.Path(dir_okay=False), help='csv/json 저장 경로 (없으면 화면 출력)')
+def diff(before, after, types, file_format, output):
+    """두 export 디렉토리(경로, 디렉토리 이름 또는 latest)의 변경 내역을 비교합니다"""
+    from ..core.snapshot_diff import diff_exports
+    from ..utils.money import format_amount
+
+    paths = []
+    for name in (before, after):
+        path = _resolve_export_dir(name)
+        if path is None:
+            console.print(f"[red]ERROR: export 디렉토리를 찾을 수 없습니다: {name}[/red]")
+            return
+        paths.append(path)
+
+    result = diff_exports(paths[0], paths[1], list(types) or None)
+
+    if file_format != 'table':
+        if output:
+            result.write(Path(output), file_format)
+            console.print(f"[green]SUCCESS: {len(result.records)}건 저장: {output}[/green]")
+        elif file_format == 'json':
+            click.echo(json.dumps({"counts": result.counts, "changes": result.records}, ensure_ascii=False, indent=2))
+        else:
+            click.echo(result.to_frame().to_csv(index=False), nl=False)
+        return
+
+    if not result.records:
+        console.print(f"[green]변경 없음: {paths[0].name} → {paths[1].name}[/green]")
+        return
+
+    table = Table(title=f"변경 내역: {paths[0].name} → {paths[1].name}")
+    table.add_column("타입", style="cyan")
+    table.add_column("변경")
+    table.add_column("계좌")
+    table.add_column("항목")
+    table.add_column("수량", justify="right")
+    table.add_column("이전", justify="right")
+    table.add_column("이후", justify="right")
+    table.add_column("차이", justify="right")
+
+    def amount(value, currency) -> str:
+        return "-" if value is None else format_amount(value, currency)
+
+    styles = {"added": "[green]추가[/green]", "removed": "[red]삭제[/red]", "changed": "[yellow]변경[/yellow]"}
+    for record in result.records:
+        if record["type"] == "transactions":
+            item = f"{record['date']} {record['name']}"
+        else:
+            item = " ".join(filter(None, [record["key"], record["name"]]))
+        quantity = ""
+        if record["type"] == "positions":
+            quantity = f"{record['quantity_delta']:+,.4g}"
+        table.add_row(
+            record["type"], styles[record["change"]], record["account"], item, quantity,
+            amount(record["amount_before"], record["currency"]), amount(record["amount_after"], record["currency"]),
+            f"{format_amount(record['amount_delta'], record['currency'], sign=True)} {record['currency'] or ''}"
+        )
+    console.print(table)
+
+    for data_type, counts in result.counts.items():
+        if any(counts.values()):
+            console.print(f"  {data_type}: 추가 {counts['added']}, 삭제 {counts['removed']}, 변경 {counts['changed']}")
+
+
+@cli.group()
+def instruments():
+    """종목 마스터 캐시를 관리합니다"""
+
+
+@instruments.command('import')
+@click.argument('csv_file', type=click.Path(exists=True, dir_okay=False))
+def instruments_import(csv_file):
+    """종목 마스터 CSV(symbol, name, currency, isin, asset_class)를 가져옵니다"""
+    from ..core.instrument_cache import InstrumentCache
+
+    cache = InstrumentCache()
+    try:
+        changed = cache.import_csv(Path(csv_file))
+    except ValueError as e:
+        console.print(f"[red]ERROR: {e}[/red]")
+        return
+    console.print(f"[green]SUCCESS: {changed}건 갱신 (전체 {len(cache)}건)[/green]")
+
+
+@instruments.command('lookup')
+@click.argument('queries', nargs=-1, required=True)
+@click.option('--currency', help='통화 코드 (예: KRW, USD)')
+def instruments_lookup(queries, currency):
+    """티커, ISIN 또는 종목명으로 캐시를 조회합니다"""
+    from ..core.instrument_cache import InstrumentCache
+
+    cache = InstrumentCache()
+    table = Table(title="종목 조회")
+    for column in ("조회어", "symbol", "name", "currency", "isin", "asset_class", "출처"):
+        table.add_column(column)
+
+    for query in queries:
+        entry = cache.resolve(query, query, currency)
+        if entry is None:
+            table.add_row(query, "[red]없음[/red]", "", "", "", "", "")
+        else:
+            table.add_row(
+                query, entry["symbol"], entry["name"], entry["currency"],
+                entry.get("isin") or "-", entry["asset_class"], entry["source"]
+            )
+    console.print(table)
+
+
+@instruments.command('refresh')
+@click.option('--force', is_flag=True, help='최근 찾지 못한 종목도 다시 조회')
+def instruments_refresh(force):
+    """로컬에서 추정한 종목을 서버 종목 검색 API로 갱신합니다"""
+    from ..core.instrument_cache import InstrumentCache
+
+    if not config_manager.get("api.url"):
+        console.print("[red]ERROR: API URL이 설정되지 않았습니다.[/red]")
+        return
+    changed = InstrumentCache().refresh_local(force=force)
+    console.print(f"[green]SUCCESS: {changed}건 갱신[/green]")
+
+
+@cli.group()
+def fx():
+    """로컬 환율 저장소를 관리합니다"""
+
+
+@fx.command('import')
+@click.argument('csv_file', type=click.Path(exists=True, dir_okay=False))
+def fx_import(csv_file):
+    """환율 CSV(date, currency, rate[, base_currency])를 가져옵니다"""
+    from ..core.fx_rates import FxRateStore
+
+    try:
+        changed = FxRateStore().import_csv(Path(csv_file))
+    except ValueError as e:
+        console.print(f"[red]ERROR: {e}[/red]")
+        return
+    console.print(f"[green]SUCCESS: {changed}행 갱신[/green]")
+
+
+@fx.command('status')
+def fx_status():
+    """통화별 환율 보유 기간을 보여줍니다"""
+    from ..core.fx_rates import FxRateStore
+
+    coverage = FxRateStore().coverage()
+    if coverage.empty:
+        console.print("[yellow]저장된 환율이 없습니다. 'donmoa fx import <CSV>'로 가져오세요.[/yellow]")
+        return
+
+    table = Table(title="로컬 환율")
+    for column in ("기준", "통화", "시작", "종료", "일수"):
+        table.add_column(column)
+    for row in coverage.itertuples(index=False):
+        table.add_row(row.base_currency, row.quote_currency, row.first_date, row.last_date, str(row.days))
+    console.print(table)
+
+
+def _enqueue_failed_upload(export_path: Path, date: str, notes) -> None:
+    """연결 실패한 업로드를 대기열에 넣어 drain에서 재시도하게 합니다."""
+    if not config_manager.get("outbox.enabled", True):
+        return
+    if UploadOutbox().enqueue(export_path, date, notes):
+        console.print("[yellow]업로드 대기열에 추가했습니다. 연결되면 donmoa drain으로 전송하세요.[/yellow]")
+
+
+@cli.command()
+@click.option('--watch', '-w', is_flag=True, help='대기열이 빌 때까지 백오프 시각에 맞춰 계속 전송')
+@click.option('--force', '-f', is_flag=True, help='백오프 대기 시각을 무시하고 모든 대기 항목 전송')
+@click.option('--retry-failed', is_flag=True, help='실패(failed) 항목을 다시 대기 상태로 돌림')
+def drain(watch, force, retry_failed):
+    """업로드 대기열의 스냅샷을 API로 전송합니다"""
+    import time
+
+    outbox = UploadOutbox()
+    if not outbox.uploader.is_configured():
+        console.print("[red]ERROR: API URL 또는 토큰이 설정되지 않았습니다.[/red]")
+        return
+
+    if retry_failed:
+        console.print(f"[yellow]실패 항목 {outbox.retry_failed()}건을 다시 대기열에 넣었습니다.[/yellow]")
+
+    totals = {"sent": 0, "retry": 0, "failed": 0, "skipped": 0}
+    poll_interval = float(config_manager.get("outbox.poll_interval_seconds", 30))
+
+    try:
+        while True:
+            result = outbox.drain(force=force)
+            for key, value in result.items():
+                totals[key] += value
+
+            if not watch or not outbox.pending():
+                break
+            if result["sent"] and not result["retry"]:
+                continue  # 다음 배치 바로 전송
+
+            next_at = outbox.next_attempt_at()
+            wait = poll_interval
+            if next_at:
+                wait = min(max((datetime.fromisoformat(next_at) - datetime.now()).total_seconds(), 1), poll_interval)
+            time.sleep(wait)
+            force = False
+    except KeyboardInterrupt:
+        console.print("[yellow]전송을 중단했습니다.[/yellow]")
+
+    counts = outbox.counts()
+    table = Table(title="업로드 대기열")
+    table.add_column("전송", justify="right", style="green")
+    table.add_column("재시도 예정", justify="right", style="yellow")
+    table.add_column("실패", justify="right", style="red")
+    table.add_column("대기", justify="right")
+    table.add_row(
+        str(totals["sent"]), str(totals["retry"]), str(totals["failed"]), str(counts.get("pending", 0))
+    )
+    console.print(table)
+
+    for item in outbox.pending():
+        console.print(
+            f"  {item['snapshot_date']}  시도 {item['attempts']}회, 다음 시도 {item['next_attempt_at'][:19]}"
+            + (f"  ({item['last_error'][:80]})" if item['last_error'] else "")
+        )
+
+
 if __name__ == '__main__':
     cli()
@@ -5,5 +5,8 @@
 from .csv_exporter import CSVExporter
 from .data_collector import DataCollector
 from .donmoa import Donmoa
+from .history import HistoryEngine
+from .history_store import HistoryStore
+from .outbox import UploadOutbox
 
-__all__ = ["Donmoa", "DataCollector", "CSVExporter"]
+__all__ = ["Donmoa", "DataCollector", "CSVExporter", "HistoryStore", "HistoryEngine", "UploadOutbox"]
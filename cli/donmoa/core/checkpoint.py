@@ -0,0 +1,218 @@
+"""
+워크플로우 체크포인트
+
+날짜 폴더별 실행(run)마다 Provider 수집 결과와 완료된 단계(export, history)를
+기록해 두고, 실행이 중간에 실패하면 `--resume`으로 완료된 부분을 재사용합니다.
+
+    <checkpoint.dir>/<날짜>/<run_id>/manifest.json
+    <checkpoint.dir>/<날짜>/<run_id>/provider_<이름>.pkl   Provider 수집 결과
+    <checkpoint.dir>/<날짜>/<run_id>/stage_export.pkl      수집 데이터와 내보낸 데이터 (중복 제거 후)
+
+Provider 결과는 스키마 객체 그대로(타입 유지) pickle로 저장합니다. 입력 파일 목록
+(이름, 크기, 수정 시각)과 계좌 매핑/Provider 설정의 지문이 같을 때만 재사용하므로,
+입력 파일을 고친 Provider는 다시 파싱됩니다.
+
+내보내기까지 끝난 실행은 거래가 이미 중복 제거 인덱스에 기록되었으므로, 재개할 때
+Provider 대신 그때 수집한 데이터를 그대로 사용합니다. 실행이 끝나면 pickle 파일은 지우고
+manifest만 남겨, 여러 폴더를 채우는 작업에서 이미 끝난 폴더를 건너뛸 수 있게 합니다.
+"""
+
+import hashlib
+import json
+import pickle
+import shutil
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from ..utils.logger import logger
+from ..utils.config import config_manager
+from ..utils.input_index import input_index
+
+MANIFEST_FILE = "manifest.json"
+
+# manifest 상태
+RUNNING = "running"
+PARTIAL = "partial"
+COMPLETED = "completed"
+
+
+def provider_fingerprint(provider: Any, input_dir: Path) -> str:
+    """Provider 입력 파일과 매핑/설정으로 결과가 같은지 판단하는 지문"""
+    files = input_index.find_files(input_dir, provider.get_supported_names())
+    payload = {
+        "files": sorted([file.name, file.size, file.mtime, file.member] for file in files),
+        "account_mapping": provider.account_mapping,
+        "config": provider.provider_config,
+    }
+    text = json.dumps(payload, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class CheckpointRun:
+    """날짜 폴더 하나의 실행 체크포인트"""
+
+    def __init__(self, path: Path, manifest: Dict[str, Any]):
+        self.path = path
+        self.manifest = manifest
+
+    @property
+    def run_id(self) -> str:
+        return self.manifest["run_id"]
+
+    @property
+    def completed(self) -> bool:
+        return self.manifest.get("status") == COMPLETED
+
+    def load_provider(self, name: str, fingerprint: str) -> Optional[Dict[str, List[Any]]]:
+        """지문이 같은 Provider 결과를 반환합니다. 없으면 None"""
+        entry = self.manifest["providers"].get(name)
+        if not entry or entry.get("fingerprint") != fingerprint:
+            return None
+        return self._load(entry["file"])
+
+    def save_provider(self, name: str, fingerprint: str, data: Dict[str, List[Any]]) -> None:
+        """Provider 결과를 저장합니다."""
+        file_name = self._dump(f"provider_{name}.pkl", data)
+        self.manifest["providers"][name] = {
+            "fingerprint": fingerprint,
+            "file": file_name,
+            "records": {data_type: len(records) for data_type, records in data.items()},
+            "saved_at": datetime.now().isoformat(),
+        }
+        self.manifest["failed_providers"].pop(name, None)
+        self._write()
+
+    def record_failure(self, name: str, reason: str) -> None:
+        """Provider 실패를 기록합니다. 실패가 남아 있으면 실행은 완료되지 않습니다."""
+        self.manifest["failed_providers"][name] = reason
+        self._write()
+
+    def stage(self, name: str) -> Optional[Dict[str, Any]]:
+        """완료된 단계의 결과 (완료되지 않았으면 None)"""
+        return self.manifest["stages"].get(name)
+
+    def stage_data(self, name: str) -> Optional[Dict[str, List[Any]]]:
+        """완료된 단계와 함께 저장한 데이터 (없으면 None)"""
+        stage = self.stage(name)
+        if not stage or not stage.get("file"):
+            return None
+        return self._load(stage["file"])
+
+    def complete_stage(
+        self,
+        name: str,
+        result: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, List[Any]]] = None
+    ) -> None:
+        """단계를 완료로 기록합니다. data가 있으면 재개할 때 쓰도록 함께 저장합니다."""
+        stage = dict(result or {}, completed_at=datetime.now().isoformat())
+        if data is not None:
+            stage["file"] = self._dump(f"stage_{name}.pkl", data)
+        self.manifest["stages"][name] = stage
+        self._write()
+
+    def finish(self) -> None:
+        """
+        실행을 마칩니다.
+
+        모든 Provider가 성공했으면 완료로 기록하고 pickle 파일을 지웁니다. 실패한 Provider가
+        있으면 부분 완료로 두고, 재개할 때 실패한 Provider만 다시 수집해 전체 데이터로
+        내보내도록 성공한 Provider 결과는 남기고 단계 기록은 지웁니다.
+        """
+        if self.manifest["failed_providers"]:
+            for path in self.path.glob("stage_*.pkl"):
+                path.unlink(missing_ok=True)
+            self.manifest["stages"] = {}
+            self.manifest["status"] = PARTIAL
+        else:
+            for path in self.path.glob("*.pkl"):
+                path.unlink(missing_ok=True)
+            self.manifest["status"] = COMPLETED
+        self._write()
+
+    def _dump(self, file_name: str, data: Any) -> str:
+        tmp_path = self.path / f"{file_name}.tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        tmp_path.replace(self.path / file_name)
+        return file_name
+
+    def _load(self, file_name: str) -> Optional[Any]:
+        try:
+            with open(self.path / file_name, "rb") as f:
+                return pickle.load(f)
+        except Exception as e:
+            logger.warning(f"체크포인트 읽기 실패 ({self.path / file_name}): {e}")
+            return None
+
+    def _write(self) -> None:
+        self.manifest["updated_at"] = datetime.now().isoformat()
+        tmp_path = self.path / f"{MANIFEST_FILE}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.manifest, f, ensure_ascii=False, indent=2)
+        tmp_path.replace(self.path / MANIFEST_FILE)
+
+
+class CheckpointStore:
+    """날짜 폴더별 실행 체크포인트 저장소"""
+
+    def __init__(self, root: Optional[Path] = None):
+        if root is None:
+            root = Path(config_manager.get("checkpoint.dir", "data/checkpoints"))
+        self.root = Path(root)
+
+    def open_run(self, snapshot_date: str, folder: Path, resume: bool = False) -> CheckpointRun:
+        """
+        날짜 폴더의 실행을 엽니다.
+
+        resume이면 가장 최근 실행이 완료되지 않았을 때 그 실행을 이어서 사용하고,
+        아니면 새 실행을 만듭니다. 오래된 실행은 checkpoint.keep_runs개만 남깁니다.
+        """
+        if resume:
+            latest = self.latest_run(snapshot_date)
+            if latest is not None and not latest.completed:
+                logger.info(f"♻️ 체크포인트에서 재개합니다: {snapshot_date} ({latest.run_id})")
+                return latest
+            logger.info(f"재개할 체크포인트가 없어 새로 실행합니다: {snapshot_date}")
+
+        run_id = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        path = self.root / snapshot_date / run_id
+        path.mkdir(parents=True, exist_ok=True)
+
+        now = datetime.now().isoformat()
+        run = CheckpointRun(path, {
+            "run_id": run_id,
+            "snapshot_date": snapshot_date,
+            "folder": str(folder),
+            "status": RUNNING,
+            "created_at": now,
+            "providers": {},
+            "failed_providers": {},
+            "stages": {},
+        })
+        run._write()
+        self._prune(snapshot_date)
+        return run
+
+    def latest_run(self, snapshot_date: str) -> Optional[CheckpointRun]:
+        """날짜의 가장 최근 실행 (없으면 None)"""
+        for path in sorted(self._run_dirs(snapshot_date), reverse=True):
+            try:
+                with open(path / MANIFEST_FILE, "r", encoding="utf-8") as f:
+                    return CheckpointRun(path, json.load(f))
+            except Exception as e:
+                logger.warning(f"체크포인트 manifest 읽기 실패 ({path}): {e}")
+        return None
+
+    def _run_dirs(self, snapshot_date: str) -> List[Path]:
+        date_dir = self.root / snapshot_date
+        if not date_dir.is_dir():
+            return []
+        return [path for path in date_dir.iterdir() if (path / MANIFEST_FILE).exists()]
+
+    def _prune(self, snapshot_date: str) -> None:
+        """날짜별로 최근 checkpoint.keep_runs개 실행만 남깁니다."""
+        keep = max(1, int(config_manager.get("checkpoint.keep_runs", 3)))
+        for path in sorted(self._run_dirs(snapshot_date), reverse=True)[keep:]:
+            shutil.rmtree(path, ignore_errors=True)
@@ -2,9 +2,14 @@
 CSV 내보내기 클래스
 """
 
+import hashlib
+import json
+import os
+import re
+import shutil
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 import pandas as pd
 
@@ -12,6 +17,135 @@ from ..utils.logger import logger
 from ..utils.config import config_manager
 
 
+OBJECTS_DIR = "objects"
+LATEST_FILE = "LATEST"
+MANIFEST_FILE = "manifest.json"
+
+# 내용 해시에서 제외하는 컬럼 (실행마다 달라지는 값)
+VOLATILE_COLUMNS = ["collected_at"]
+
+# 정수 고정소수점 컬럼 (값이 없는 행이 있어도 "1050.0"이 아닌 정수로 기록)
+FIXED_POINT_COLUMNS = ["amount_minor", "qty_nano", "price_nano"]
+
+# 값이 없을 수 있는 정수 ID 컬럼
+INTEGER_ID_COLUMNS = ["instrument_id"]
+
+# 포트폴리오 요약 파일 이름 (업로드 대상 아님)
+SUMMARY_FILE = "summary"
+
+# 파티션 거래 export (export.partition_by): <실행 디렉토리>/transactions/<키>=<값>/.../part-0.csv
+PARTITION_DIR = "transactions"
+PARTITION_FILE = "part-0.csv"
+# 파티션별 행 수와 날짜 범위를 담은 사이드카 인덱스 (밑줄로 시작해 Hive 방식 리더가 무시)
+PARTITION_INDEX_FILE = "_index.json"
+# 값이 없는 행의 파티션 이름 (Hive 관례)
+DEFAULT_PARTITION = "__HIVE_DEFAULT_PARTITION__"
+# date 컬럼에서 만드는 파티션 키 → 날짜 문자열 앞자리 길이
+DERIVED_PARTITION_KEYS = {"year": 4, "month": 7}
+
+# 파티션 디렉토리 이름에서 이스케이프할 문자 (Hive와 같이 %XX로 표기)
+_PARTITION_ESCAPE_RE = re.compile(r'[\x00-\x1f"#%\'*/:=?\\\x7f{}\[\]^<>|]')
+
+
+def find_latest_export_dir(export_base: Path) -> Optional[Path]:
+    """
+    가장 최근 export 디렉토리를 반환합니다.
+
+    LATEST 포인터가 있으면 바로 사용하고, 없으면 타임스탬프 디렉토리를 정렬해 찾습니다.
+    """
+    latest_file = export_base / LATEST_FILE
+    if latest_file.exists():
+        latest_dir = export_base / latest_file.read_text(encoding="utf-8").strip()
+        if latest_dir.is_dir():
+            return latest_dir
+
+    subdirs = sorted(
+        (d for d in export_base.iterdir() if d.is_dir() and d.name != OBJECTS_DIR),
+        reverse=True
+    ) if export_base.exists() else []
+    return subdirs[0] if subdirs else None
+
+
+def read_partition_index(export_path: Path) -> Optional[Dict[str, Any]]:
+    """export 디렉토리의 파티션 인덱스를 읽습니다. 없으면 None"""
+    index_path = Path(export_path) / PARTITION_DIR / PARTITION_INDEX_FILE
+    if not index_path.exists():
+        return None
+    with open(index_path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def read_transactions(
+    export_path: Path,
+    filters: Optional[Dict[str, Iterable[str]]] = None,
+    start: Optional[str] = None,
+    end: Optional[str] = None
+) -> pd.DataFrame:
+    """
+    export의 거래를 필요한 부분만 읽습니다.
+
+    파티션 인덱스가 있으면 파티션 값(filters)과 날짜 범위(start~end)가 겹치는 파티션
+    파일만 읽고, 없으면 transactions.csv 전체를 읽어 같은 조건으로 거릅니다.
+
+    Args:
+        export_path: export 디렉토리
+        filters: 파티션 키(또는 컬럼) → 허용 값 목록 (예: {"account": ["주거래계좌"], "month": ["2025-01"]})
+        start: 시작 날짜 (YYYY-MM-DD, 포함)
+        end: 종료 날짜 (YYYY-MM-DD, 포함)
+
+    Returns:
+        거래 DataFrame (모든 값은 문자열)
+    """
+    export_path = Path(export_path)
+    filters = {key: {str(value) for value in values} for key, values in (filters or {}).items()}
+    index = read_partition_index(export_path)
+
+    if index is None:
+        path = export_path / "transactions.csv"
+        df = pd.read_csv(path, dtype=str, keep_default_na=False) if path.exists() else pd.DataFrame()
+    else:
+        frames = []
+        for partition in index["partitions"]:
+            values = partition["values"]
+            if any(key in values and values[key] not in allowed for key, allowed in filters.items()):
+                continue
+            if start and partition["max_date"] and partition["max_date"][:10] < start:
+                continue
+            if end and partition["min_date"] and partition["min_date"][:10] > end:
+                continue
+            frame = pd.read_csv(export_path / PARTITION_DIR / partition["path"], dtype=str, keep_default_na=False)
+            # 파일에서 뺀 파티션 컬럼을 디렉토리 값으로 복원
+            for key, value in values.items():
+                if key not in DERIVED_PARTITION_KEYS:
+                    frame[key] = "" if value == DEFAULT_PARTITION else value
+            frames.append(frame)
+        df = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=index.get("columns", []))
+
+    if df.empty:
+        return df
+
+    # 파티션 안의 행(또는 인덱스가 없을 때 전체 행)에 같은 조건 적용
+    mask = pd.Series(True, index=df.index)
+    dates = df["date"].str.slice(0, 10) if "date" in df.columns else None
+    for key, allowed in filters.items():
+        if key in DERIVED_PARTITION_KEYS and dates is not None:
+            mask &= dates.str.slice(0, DERIVED_PARTITION_KEYS[key]).isin(allowed)
+        elif key in df.columns:
+            mask &= df[key].isin(allowed)
+    if dates is not None and start:
+        mask &= dates >= start
+    if dates is not None and end:
+        mask &= dates <= end
+    return df[mask].reset_index(drop=True)
+
+
+def _partition_name(value: str) -> str:
+    """파티션 값을 디렉토리 이름에 쓸 수 있게 이스케이프합니다."""
+    if value == "":
+        return DEFAULT_PARTITION
+    return _PARTITION_ESCAPE_RE.sub(lambda match: f"%{ord(match.group()):02X}", value)
+
+
 class CSVExporter:
     """CSV 내보내기 클래스"""
 
@@ -22,6 +156,9 @@ class CSVExporter:
 
         self.output_dir = output_dir
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.content_addressed = config_manager.get("export.content_addressed", True)
+        # 직전 실행을 그대로 재사용한 디렉토리 (내용 주소 방식, 이후 파일을 쓰지 않음)
+        self.reused_dir: Optional[Path] = None
 
     def export_to_csv(
         self,
@@ -36,10 +173,11 @@ class CSVExporter:
         if timestamp is None:
             timestamp = datetime.now()
 
+        if self.content_addressed:
+            return self._export_content_addressed(integrated_data, timestamp)
+
         # 타임스탬프 디렉토리 생성
-        timestamp_str = timestamp.strftime("%Y%m%d_%H%M%S")
-        output_path = self.output_dir / timestamp_str
-        output_path.mkdir(exist_ok=True)
+        output_path = self._create_run_dir(timestamp)
 
         exported_files = {}
 
@@ -50,9 +188,278 @@ class CSVExporter:
                 file_path = output_path / filename
 
                 # DataFrame으로 변환하여 저장
-                df = pd.DataFrame(records)
+                df = self._to_frame(records)
                 df.to_csv(file_path, index=False, encoding='utf-8')
                 exported_files[data_type] = file_path
                 logger.info(f"{data_type} CSV 저장: {len(records)}행")
+
+                if data_type == "transactions":
+                    self.export_partitions(df, output_path)
+
+        self._update_latest(output_path)
+        logger.info("")
+        return exported_files
+
+    def export_summary(self, summary: pd.DataFrame, output_path: Path) -> Dict[str, Path]:
+        """
+        포트폴리오 요약을 export 디렉토리에 저장합니다.
+
+        형식은 export.summary_formats (csv, parquet)를 따르며, parquet는 pyarrow가
+        설치된 경우에만 저장합니다. 내용 주소 방식에서 직전 실행을 재사용한 디렉토리에는
+        쓰지 않고 이미 있는 요약 파일을 반환합니다.
+
+        Returns:
+            형식 → 파일 경로
+        """
+        formats = config_manager.get("export.summary_formats", ["csv"]) or []
+        if self.reused_dir is not None and Path(output_path) == self.reused_dir:
+            existing = {fmt: output_path / f"{SUMMARY_FILE}.{fmt}" for fmt in formats}
+            return {fmt: path for fmt, path in existing.items() if path.exists()}
+
+        written = {}
+        encoding = config_manager.get("export.encoding", "utf-8")
+        for file_format in formats:
+            file_path = output_path / f"{SUMMARY_FILE}.{file_format}"
+            tmp_path = file_path.with_suffix(f".{file_format}.tmp")
+            try:
+                if file_format == "csv":
+                    summary.to_csv(tmp_path, index=False, encoding=encoding)
+                elif file_format == "parquet":
+                    summary.to_parquet(tmp_path, index=False)
+                else:
+                    logger.warning(f"지원하지 않는 요약 형식입니다: {file_format}")
+                    continue
+            except ImportError as e:
+                logger.warning(f"요약 {file_format} 저장 건너뜀 (의존성 없음): {e}")
+                continue
+            tmp_path.replace(file_path)
+            written[file_format] = file_path
+
+        if written:
+            logger.info(f"요약 저장: {', '.join(path.name for path in written.values())} ({len(summary)}행)")
+            self._record_derived(output_path, written.values())
+        return written
+
+    def export_partitions(self, df: pd.DataFrame, output_path: Path) -> Optional[Path]:
+        """
+        거래를 export.partition_by 키별 Hive 방식 디렉토리로 나눠 저장합니다.
+
+        키는 거래 컬럼(account, currency 등) 또는 date에서 만드는 year/month입니다.
+        실제 컬럼인 키는 디렉토리 이름에 값이 있으므로 파일에서 뺍니다. 파티션별 행 수와
+        최소/최대 날짜는 transactions/_index.json에 기록해, 읽는 쪽이 파일을 열지 않고
+        필요한 파티션만 고를 수 있게 합니다 (read_transactions).
+
+        Returns:
+            파티션 인덱스 경로 (partition_by가 없거나 거래가 없으면 None)
+        """
+        keys = list(config_manager.get("export.partition_by") or [])
+        if not keys or df.empty:
+            return None
+
+        unknown = [key for key in keys if key not in DERIVED_PARTITION_KEYS and key not in df.columns]
+        if unknown:
+            logger.warning(f"⚠️ 거래에 없는 파티션 키라 파티션 저장을 건너뜁니다: {', '.join(unknown)}")
+            return None
+
+        dates = df["date"].fillna("").astype(str) if "date" in df.columns else pd.Series("", index=df.index)
+        labels = pd.DataFrame({
+            key: (
+                dates.str.slice(0, DERIVED_PARTITION_KEYS[key]) if key in DERIVED_PARTITION_KEYS
+                else df[key].fillna("").astype(str)
+            )
+            for key in keys
+        })
+        body = df.drop(columns=[key for key in keys if key in df.columns])
+
+        root = output_path / PARTITION_DIR
+        partitions = []
+        for values, rows in labels.groupby(keys, sort=True).indices.items():
+            values = values if isinstance(values, tuple) else (values,)
+            relative = Path(*(f"{key}={_partition_name(value)}" for key, value in zip(keys, values)))
+            (root / relative).mkdir(parents=True, exist_ok=True)
+            body.iloc[rows].to_csv(root / relative / PARTITION_FILE, index=False, encoding="utf-8")
+
+            part_dates = dates.iloc[rows]
+            part_dates = part_dates[part_dates != ""]
+            partitions.append({
+                "path": (relative / PARTITION_FILE).as_posix(),
+                "values": {key: value or DEFAULT_PARTITION for key, value in zip(keys, values)},
+                "rows": len(rows),
+                "min_date": part_dates.min() if len(part_dates) else None,
+                "max_date": part_dates.max() if len(part_dates) else None,
+            })
+
+        index = {
+            "partition_by": keys,
+            "columns": list(df.columns),
+            "rows": len(df),
+            "partitions": partitions,
+        }
+        index_path = root / PARTITION_INDEX_FILE
+        tmp_path = index_path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(index, f, ensure_ascii=False, indent=2)
+        tmp_path.replace(index_path)
+
+        logger.info(f"transactions 파티션 저장: {len(partitions)}개 ({', '.join(keys)})")
+        self._record_derived(output_path, [index_path, *(root / part["path"] for part in partitions)])
+        return index_path
+
+    def _export_content_addressed(
+        self,
+        integrated_data: Dict[str, List[Dict[str, Any]]],
+        timestamp: datetime
+    ) -> Dict[str, Path]:
+        """
+        내용 주소 방식으로 내보냅니다.
+
+        CSV 본문은 objects/ 아래에 해시 이름으로 한 번만 저장되고, 실행 디렉토리에는
+        manifest.json과 객체를 가리키는 하드 링크만 생성됩니다. 직전 실행과 내용과 파티션
+        키(export.partition_by)가 모두 같고 직전 실행의 파일이 남아 있으면 새 디렉토리를 만들지 않고 직전 결과를
+        그대로 반환하며, 재사용한 디렉토리에는 아무것도 쓰지 않습니다.
+
+        거래 중복 제거(dedup.transactions)가 켜져 있으면 첫 재실행은 거래가 빠져 내용이
+        달라지므로 새 디렉토리를 만들고, 그 다음 재실행부터 재사용됩니다. 이때도 현금/포지션
+        객체는 공유되므로 저장 공간은 늘지 않습니다.
+
+        파생 파일(거래 파티션, 요약)은 객체 저장소 밖의 일반 파일이며, manifest의
+        "derived"에 실행 디렉토리 기준 경로로 기록합니다.
+        """
+        objects = {}
+        transactions = None
+        for data_type, records in integrated_data.items():
+            if records:
+                df = self._to_frame(records)
+                objects[data_type] = (self._store_object(df), len(records))
+                if data_type == "transactions":
+                    transactions = df
+
+        partition_by = list(config_manager.get("export.partition_by") or []) if transactions is not None else []
+        manifest = {
+            "created_at": timestamp.isoformat(),
+            "files": {
+                data_type: {"object": digest, "rows": rows}
+                for data_type, (digest, rows) in objects.items()
+            },
+            "partition_by": partition_by,
+            "derived": [],
+        }
+
+        self.reused_dir = None
+        latest_dir = find_latest_export_dir(self.output_dir)
+        if latest_dir:
+            latest = self._read_manifest(latest_dir)
+            reusable = (
+                latest.get("files") == manifest["files"]
+                and latest.get("partition_by", []) == partition_by
+                # 실행 디렉토리의 링크가 지워졌으면 재사용하지 않고 새로 만듦
+                and all((latest_dir / f"{data_type}.csv").exists() for data_type in objects)
+            )
+            if reusable:
+                logger.info(f"직전 내보내기와 내용이 같아 재사용합니다: {latest_dir.name}")
+                logger.info("")
+                self.reused_dir = latest_dir
+                return {data_type: latest_dir / f"{data_type}.csv" for data_type in objects}
+
+        output_path = self._create_run_dir(timestamp)
+
+        exported_files = {}
+        for data_type, (digest, rows) in objects.items():
+            file_path = output_path / f"{data_type}.csv"
+            self._link_object(digest, file_path)
+            exported_files[data_type] = file_path
+            logger.info(f"{data_type} CSV 저장: {rows}행")
+
+        self._write_manifest(output_path, manifest)
+
+        if transactions is not None:
+            self.export_partitions(transactions, output_path)
+
+        self._update_latest(output_path)
         logger.info("")
         return exported_files
+
+    def _create_run_dir(self, timestamp: datetime) -> Path:
+        """타임스탬프 디렉토리를 만듭니다. 같은 초에 여러 번 내보내면 접미사를 붙입니다."""
+        timestamp_str = timestamp.strftime("%Y%m%d_%H%M%S")
+        output_path = self.output_dir / timestamp_str
+        suffix = 1
+        while True:
+            try:
+                output_path.mkdir(parents=True)
+                return output_path
+            except FileExistsError:
+                output_path = self.output_dir / f"{timestamp_str}_{suffix}"
+                suffix += 1
+
+    @staticmethod
+    def _to_frame(records: List[Dict[str, Any]]) -> pd.DataFrame:
+        """레코드를 DataFrame으로 변환합니다. 고정소수점/ID 컬럼은 nullable 정수로 유지합니다."""
+        df = pd.DataFrame(records)
+        for column in FIXED_POINT_COLUMNS + INTEGER_ID_COLUMNS:
+            if column in df.columns:
+                df[column] = df[column].astype("Int64")
+        return df
+
+    def _store_object(self, df: pd.DataFrame) -> str:
+        """DataFrame을 CSV 객체로 저장하고 내용 해시를 반환합니다. 이미 있으면 쓰지 않습니다."""
+        stable = df.drop(columns=VOLATILE_COLUMNS, errors="ignore")
+        digest = hashlib.sha256(stable.to_csv(index=False).encode("utf-8")).hexdigest()
+
+        object_path = self._object_path(digest)
+        if not object_path.exists():
+            object_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = object_path.with_suffix(".tmp")
+            df.to_csv(tmp_path, index=False, encoding="utf-8")
+            tmp_path.replace(object_path)
+
+        return digest
+
+    def _link_object(self, digest: str, file_path: Path) -> None:
+        """객체를 실행 디렉토리에 하드 링크합니다. 링크가 불가능하면 복사합니다."""
+        object_path = self._object_path(digest)
+        try:
+            os.link(object_path, file_path)
+        except OSError:
+            shutil.copyfile(object_path, file_path)
+
+    def _object_path(self, digest: str) -> Path:
+        return self.output_dir / OBJECTS_DIR / digest[:2] / f"{digest}.csv"
+
+    def _update_latest(self, output_path: Path) -> None:
+        """LATEST 포인터를 원자적으로 갱신합니다."""
+        latest_file = self.output_dir / LATEST_FILE
+        tmp_path = latest_file.with_suffix(".tmp")
+        tmp_path.write_text(output_path.name, encoding="utf-8")
+        tmp_path.replace(latest_file)
+
+    def _record_derived(self, output_path: Path, paths: Iterable[Path]) -> None:
+        """내용 주소 방식 실행 디렉토리의 manifest에 파생 파일 경로를 추가합니다."""
+        manifest = self._read_manifest(output_path) if self.content_addressed else {}
+        if not manifest:
+            return
+        derived = manifest.setdefault("derived", [])
+        for path in paths:
+            relative = Path(path).relative_to(output_path).as_posix()
+            if relative not in derived:
+                derived.append(relative)
+        self._write_manifest(output_path, manifest)
+
+    @staticmethod
+    def _write_manifest(run_dir: Path, manifest: Dict[str, Any]) -> None:
+        manifest_path = run_dir / MANIFEST_FILE
+        tmp_path = manifest_path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+        tmp_path.replace(manifest_path)
+
+    @staticmethod
+    def _read_manifest(run_dir: Path) -> Dict[str, Any]:
+        manifest_path = run_dir / MANIFEST_FILE
+        if not manifest_path.exists():
+            return {}
+        try:
+            with open(manifest_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except Exception:
+            return {}
@@ -4,11 +4,23 @@
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
+import pandas as pd
+
 from ..providers.base import BaseProvider
+from ..providers.registry import ProviderSpec, select_providers
 from ..utils.logger import logger
 from ..utils.config import config_manager
 from ..utils.date_utils import get_all_date_folders
+from ..utils.input_index import input_index
+from ..utils.memory import memory_monitor
+from ..utils.money import format_amount
 from ..schemas import CashSchema, PositionSchema, TransactionSchema
+from .checkpoint import CheckpointRun, CheckpointStore, provider_fingerprint
+from .instrument_cache import InstrumentCache
+from .isolation import fork_context, run_isolated
+from .portfolio_summary import build_summary
+from .reconcile import ReconcileReport, reconcile_providers
+from .transaction_index import TransactionIndex, fingerprint_field
 
 
 class DataCollector:
@@ -19,6 +31,16 @@ class DataCollector:
     def __init__(self):
         self.account_mappings: Dict[str, Dict[str, str]] = {}
         self.providers: List[BaseProvider] = []
+        self.provider_specs: List[ProviderSpec] = []
+        self.snapshot_date: Optional[str] = None
+        self._transaction_index: Optional[TransactionIndex] = None
+        self._instrument_cache: Optional[InstrumentCache] = None
+        # 마지막 수집에서 실패(시간 초과, 메모리 한도 초과 등)한 Provider → 사유
+        self.failed_providers: Dict[str, str] = {}
+        # True면 날짜 폴더의 완료되지 않은 최근 실행 체크포인트를 이어서 사용
+        self.resume = False
+        self.checkpoint_run: Optional[CheckpointRun] = None
+        self._isolation_warned = False
 
     def add_provider(self, provider: BaseProvider) -> None:
         """Provider를 추가합니다."""
@@ -30,15 +52,29 @@ class DataCollector:
 
         logger.info(f"Provider 추가: {provider.name}")
 
+    def register_provider_spec(self, spec: ProviderSpec) -> None:
+        """Provider 등록 정보를 추가합니다. 인스턴스는 수집 시점에 필요한 것만 생성됩니다."""
+        self.provider_specs = [s for s in self.provider_specs if s.name != spec.name]
+        self.provider_specs.append(spec)
+
+    def list_provider_names(self) -> List[str]:
+        """등록 정보와 생성된 Provider를 합친 이름 목록을 반환합니다."""
+        names = [spec.name for spec in self.provider_specs]
+        names.extend(p.name for p in self.providers if p.name not in names)
+        return names
+
     def remove_provider(self, provider_name: str) -> None:
         """Provider를 제거합니다."""
         self.providers = [p for p in self.providers if p.name != provider_name]
+        self.provider_specs = [s for s in self.provider_specs if s.name != provider_name]
         self.account_mappings.pop(provider_name, None)
         logger.info(f"Provider 제거: {provider_name}")
 
     def collect(self, input_dir: Path, provider: Optional[str] = None) -> Dict[str, List[Dict[str, Any]]]:
         """데이터를 수집합니다."""
         provider = provider or 'all'
+        self.failed_providers = {}
+        input_index.refresh()
 
         # 입력 디렉토리가 직접 날짜 폴더인지 확인
         from ..utils.date_utils import extract_date_from_folder_name
@@ -58,8 +94,21 @@ class DataCollector:
             latest_date, latest_folder = date_folders[-1]
             logger.info(f"가장 최근 날짜 폴더 선택: {latest_date} ({latest_folder})")
             target_folder = latest_folder
+            folder_date = latest_date
+        self.snapshot_date = folder_date
         logger.info("")
 
+        self.checkpoint_run = self._open_checkpoint(folder_date, target_folder)
+        if self.checkpoint_run is not None:
+            # 내보내기까지 끝난 실행은 그때 수집한 데이터를 그대로 사용 (거래가 이미 인덱스에 기록됨)
+            exported = self.checkpoint_run.stage_data("export")
+            if exported is not None:
+                logger.info(f"♻️ 내보내기까지 완료된 체크포인트 데이터를 사용합니다 ({self.checkpoint_run.run_id})")
+                return exported["collected"]
+
+        self._load_providers(target_folder, None if provider == 'all' else provider)
+        input_index.save()
+
         if provider == 'all':
             return self._collect_all_providers(target_folder)
         else:
@@ -69,8 +118,8 @@ class DataCollector:
         """수집 요약 정보를 반환합니다."""
 
         total_providers = len(self.providers)
-        successful_providers = len([p for p in self.providers if p.name in collected_data])
-        failed_providers = total_providers - successful_providers
+        failed_providers = len([p for p in self.providers if p.name in self.failed_providers])
+        successful_providers = total_providers - failed_providers
 
         total_records = sum(
             len(records)
@@ -92,15 +141,138 @@ class DataCollector:
 
         logger.info(f"✅ Provider {successful_providers}/{total_providers}개 성공, 총 {total_records}개 레코드 📊")
         logger.info(f"💵 현금: {data_type_counts['cash']}건, 📈 포지션: {data_type_counts['positions']}건, 💳 거래: {data_type_counts['transactions']}건")
+        for name, reason in self.failed_providers.items():
+            logger.warning(f"⚠️ {name}: 수집 제외 - {reason}")
 
         return {
             "total_providers": total_providers,
             "successful_providers": successful_providers,
             "failed_providers": failed_providers,
             "success_rate": (successful_providers / total_providers * 100) if total_providers > 0 else 0,
-            "total_records": total_records
+            "total_records": total_records,
+            "failed": dict(self.failed_providers)
         }
 
+    def summarize_portfolio(self, collected_data: Dict[str, List[Dict[str, Any]]]) -> pd.DataFrame:
+        """계좌/분류/통화/자산군별 현금·포지션 합계를 계산하고 통화별 총액을 로그로 출력합니다."""
+        summary = build_summary(collected_data)
+
+        for row in summary[summary["group"] == "total"].itertuples(index=False):
+            logger.info(
+                f"💰 {row.currency} 총액: {format_amount(row.total, row.currency)} "
+                f"(현금 {format_amount(row.cash, row.currency)}, "
+                f"포지션 {format_amount(row.positions, row.currency)})"
+            )
+        return summary
+
+    def commit_transactions(self, collected_data: Dict[str, List[Any]]) -> None:
+        """내보내기에 성공한 거래를 중복 제거 인덱스에 기록합니다."""
+        transaction_index = self._get_transaction_index()
+        if transaction_index is None:
+            return
+
+        try:
+            added = transaction_index.add(collected_data.get('transactions') or [])
+            logger.info(f"거래 인덱스 기록: {added}건")
+        except Exception as e:
+            logger.warning(f"거래 인덱스 기록 실패: {e}")
+
+    def _get_transaction_index(self) -> Optional[TransactionIndex]:
+        """설정에서 중복 제거가 켜져 있으면 거래 인덱스를 반환합니다."""
+        if not config_manager.get("dedup.transactions", True):
+            return None
+        if self._transaction_index is None:
+            self._transaction_index = TransactionIndex()
+        return self._transaction_index
+
+    def dedup_transactions(self, data: Dict[str, List[Any]]) -> Dict[str, List[Any]]:
+        """
+        이미 내보낸 거래와 배치 내 중복 거래를 제외한 내보내기용 데이터를 반환합니다.
+
+        원본 data는 바꾸지 않습니다. 중복 제거는 내보내기/업로드 대상에만 적용하고,
+        스냅샷 이력에는 수집한 거래 전체를 저장하기 위함입니다.
+        """
+        transaction_index = self._get_transaction_index()
+        if transaction_index is None or not data.get('transactions'):
+            return data
+
+        try:
+            return dict(data, transactions=transaction_index.filter_new(data['transactions']))
+        except Exception as e:
+            logger.warning(f"거래 중복 제거 실패: {e}")
+            return data
+
+    def resolve_instruments(self, data: Dict[str, List[Any]]) -> None:
+        """포지션 종목을 로컬 종목 마스터 캐시로 해석합니다."""
+        if not config_manager.get("instruments.enabled", True) or not data.get('positions'):
+            return
+
+        try:
+            if self._instrument_cache is None:
+                self._instrument_cache = InstrumentCache()
+            resolved = self._instrument_cache.resolve_positions(
+                data['positions'],
+                remote_lookup=config_manager.get("instruments.remote_lookup", False)
+            )
+            logger.info(f"종목 해석: {resolved}/{len(data['positions'])}건")
+        except Exception as e:
+            logger.warning(f"종목 해석 실패: {e}")
+
+    def reconcile(self, data: Dict[str, List[Any]]) -> Optional[ReconcileReport]:
+        """
+        Provider 우선순위에 따라 현금/포지션의 중복 행을 제외합니다.
+
+        같은 Provider의 여러 입력 파일에 같은 계좌가 있으면 먼저 읽은 파일만 남기고 경고합니다.
+        """
+        if not config_manager.get("reconcile.enabled", True):
+            return None
+
+        report = reconcile_providers(data, config_manager.get("reconcile.provider_precedence", []))
+        if not report.total:
+            return report
+
+        for data_type, by_provider in report.counts.items():
+            detail = ", ".join(f"{provider} {count}건" for provider, count in by_provider.items())
+            logger.info(f"🔀 {data_type} 중복 제외: {detail}")
+
+        for provider, pairs in report.file_conflicts.items():
+            for dropped_file, kept_file in pairs:
+                logger.warning(
+                    f"⚠️ {provider}: {dropped_file}와 {kept_file}에 같은 계좌가 있어 {kept_file} 값만 사용합니다"
+                )
+
+        # 앞의 몇 건만 상세 표시
+        limit = config_manager.get("reconcile.log_details", 5)
+        for data_type, records in report.dropped.items():
+            for record, (provider, source_file) in list(zip(records, report.kept_by[data_type]))[:limit]:
+                target = fingerprint_field(record, "currency") if data_type == "cash" else (
+                    fingerprint_field(record, "ticker") or fingerprint_field(record, "name")
+                )
+                logger.debug(
+                    "  - %s %s: %s(%s) 제외, %s(%s) 유지",
+                    fingerprint_field(record, "account"), target,
+                    fingerprint_field(record, "provider"), fingerprint_field(record, "source_file"),
+                    provider, source_file
+                )
+        return report
+
+    def _load_providers(self, target_folder: Path, provider_name: Optional[str] = None) -> None:
+        """대상 폴더의 파일과 패턴이 일치하는 Provider만 import하고 생성합니다."""
+        loaded = {p.name for p in self.providers}
+        pending = [spec for spec in self.provider_specs if spec.name not in loaded]
+
+        if provider_name:
+            specs = [spec for spec in pending if spec.name == provider_name]
+        else:
+            file_names = [file.name for file in input_index.list_files(target_folder)]
+            specs = select_providers(pending, file_names)
+
+        for spec in specs:
+            try:
+                self.add_provider(spec.create(config_manager.config))
+            except Exception as e:
+                logger.error(f"❌ {spec.name}: Provider 생성 실패 - {e}")
+
     def _set_account_mappings(self) -> None:
         """설정에서 계좌 매핑 정보를 로드합니다."""
         try:
@@ -131,11 +303,12 @@ class DataCollector:
         for provider in self.providers:
             try:
                 logger.info(f"<🔍 {provider.name}: 데이터 수집 시작>")
-                provider_data = provider.collect_all(input_dir)
-
-                collected_data[provider.name] = provider_data
+                provider_data = self._run_provider(provider, input_dir)
+                if provider_data is not None:
+                    collected_data[provider.name] = provider_data
             except Exception as e:
                 logger.error(f"❌ {provider.name}: {e}")
+                self._mark_failed(provider.name, str(e))
 
         # 데이터 통합
         integrated_data = {data_type: [] for data_type in self.DATA_TYPES}
@@ -148,6 +321,11 @@ class DataCollector:
 
         # 폴더 날짜를 스키마에 설정
         self._set_date_for_schemas(integrated_data, input_dir)
+        self.resolve_instruments(integrated_data)
+
+        # 여러 Provider나 한 Provider의 여러 파일에 겹친 계좌의 현금/포지션 조정
+        # (종목 해석 후라 티커 표기가 통일됨)
+        self.reconcile(integrated_data)
 
         # 통합 결과 로그
         logger.info("데이터 통합 완료")
@@ -169,19 +347,95 @@ class DataCollector:
             return {data_type: [] for data_type in self.DATA_TYPES}
 
         try:
-            provider_data = target_provider.collect_all(input_dir)
+            provider_data = self._run_provider(target_provider, input_dir)
             if provider_data:
                 # 폴더 날짜를 스키마에 설정
                 self._set_date_for_schemas(provider_data, input_dir)
+                self.resolve_instruments(provider_data)
+                self.reconcile(provider_data)
                 logger.info(f"✅ {provider_name}: {len(provider_data)}개 데이터 타입 수집")
                 return provider_data
             else:
                 logger.warning(f"⚠️ {provider_name}: 데이터 없음")
         except Exception as e:
             logger.error(f"❌ {provider_name}: {e}")
+            self._mark_failed(provider_name, str(e))
 
         return {data_type: [] for data_type in self.DATA_TYPES}
 
+    def _mark_failed(self, provider_name: str, reason: str) -> None:
+        """실패한 Provider를 기록합니다. 체크포인트 실행에도 남겨 재개할 때 다시 수집합니다."""
+        self.failed_providers[provider_name] = reason
+        if self.checkpoint_run is not None:
+            try:
+                self.checkpoint_run.record_failure(provider_name, reason)
+            except Exception as e:
+                logger.warning(f"{provider_name}: 체크포인트 실패 기록 실패 - {e}")
+
+    def _open_checkpoint(self, snapshot_date: str, folder: Path) -> Optional[CheckpointRun]:
+        """설정에서 체크포인트가 켜져 있으면 날짜 폴더의 실행을 엽니다."""
+        if not config_manager.get("checkpoint.enabled", True):
+            return None
+        try:
+            return CheckpointStore().open_run(snapshot_date, folder, resume=self.resume)
+        except Exception as e:
+            logger.warning(f"체크포인트 열기 실패, 체크포인트 없이 진행합니다: {e}")
+            return None
+
+    def _run_provider(self, provider: BaseProvider, input_dir: Path) -> Optional[Dict[str, List[Any]]]:
+        """Provider 하나를 수집합니다. 체크포인트에 같은 입력의 결과가 있으면 재사용합니다."""
+        run = self.checkpoint_run
+        if run is None:
+            return self._collect_provider(provider, input_dir)
+
+        fingerprint = provider_fingerprint(provider, input_dir)
+        cached = run.load_provider(provider.name, fingerprint)
+        if cached is not None:
+            logger.info(f"♻️ {provider.name}: 체크포인트 결과 재사용 ({run.run_id})")
+            return cached
+
+        provider_data = self._collect_provider(provider, input_dir)
+        if provider_data is not None:
+            try:
+                run.save_provider(provider.name, fingerprint, provider_data)
+            except Exception as e:
+                logger.warning(f"{provider.name}: 체크포인트 저장 실패 - {e}")
+        return provider_data
+
+    def _collect_provider(self, provider: BaseProvider, input_dir: Path) -> Optional[Dict[str, List[Any]]]:
+        """
+        Provider 하나를 수집합니다.
+
+        performance.isolate_providers가 켜져 있으면 fork한 워커 프로세스에서 시간 한도
+        (performance.provider_timeout, 기본 300초)와 메모리 한도(performance.provider_memory_mb)
+        안에서 실행합니다. 실패하면 사유를 failed_providers에 기록하고 None을 반환해,
+        나머지 Provider 결과만 내보냅니다. fork를 지원하지 않는 플랫폼에서는 프로세스 안에서
+        수집합니다.
+        """
+        isolate = config_manager.get("performance.isolate_providers", True)
+        if isolate and fork_context() is None:
+            if not self._isolation_warned:
+                logger.warning("⚠️ fork를 지원하지 않는 플랫폼이라 Provider 격리 없이 수집합니다")
+                self._isolation_warned = True
+            isolate = False
+
+        if not isolate:
+            with memory_monitor.stage(f"provider:{provider.name}"):
+                return provider.collect_all(input_dir)
+
+        result = run_isolated(
+            provider, input_dir,
+            timeout=float(config_manager.get("performance.provider_timeout", 300)),
+            memory_mb=config_manager.get("performance.provider_memory_mb")
+        )
+        if result.memory is not None:
+            memory_monitor.record(result.memory)
+        if not result.ok:
+            logger.error(f"❌ {provider.name}: {result.message} - 이 Provider를 제외하고 계속합니다")
+            self._mark_failed(provider.name, result.message)
+            return None
+        return result.data
+
     def _set_date_for_schemas(self, data: Dict[str, List[Any]], input_dir: Path) -> None:
         """폴더 이름에서 추출한 날짜를 스키마의 date 필드에 설정합니다."""
         from ..utils.date_utils import extract_date_from_folder_name
@@ -202,4 +456,4 @@ class DataCollector:
             for record in records:
                 if hasattr(record, 'date'):
                     record.date = folder_date
-                    logger.debug(f"{data_type} 레코드 date 설정: {folder_date}")
+            logger.debug("%s 레코드 %d건 date 설정: %s", data_type, len(records), folder_date)
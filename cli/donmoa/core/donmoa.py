@@ -6,11 +6,18 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
+import pandas as pd
+
 from ..providers.base import BaseProvider
+from ..providers.registry import discover_providers
 from ..utils.logger import logger
 from ..utils.config import config_manager
+from ..utils.memory import memory_monitor
+from .checkpoint import CheckpointRun
 from .data_collector import DataCollector
 from .csv_exporter import CSVExporter
+from .history_store import HistoryStore
+from .outbox import UploadOutbox
 
 
 class Donmoa:
@@ -26,21 +33,52 @@ class Donmoa:
         self._register_default_providers()
         logger.info("")
 
-    def run_full_workflow(self, input_dir: str = "data/input", output_dir: Optional[Path] = None) -> Dict[str, Any]:
-        """전체 워크플로우를 실행합니다."""
+    def run_full_workflow(
+        self,
+        input_dir: str = "data/input",
+        output_dir: Optional[Path] = None,
+        resume: bool = False
+    ) -> Dict[str, Any]:
+        """
+        전체 워크플로우를 실행합니다.
+
+        resume이면 날짜 폴더의 완료되지 않은 최근 실행 체크포인트에서 완료된 Provider 결과와
+        단계를 재사용하고 나머지만 다시 수행합니다.
+        """
         logger.info("="*50)
         logger.info("🚀 Donmoa 워크플로우 시작")
         logger.info("="*50)
 
+        memory_monitor.reset()
+        self.data_collector.resume = resume
         try:
-            # 1. 데이터 수집 (통합된 데이터)
+            # 1. 데이터 수집 (통합된 데이터, Provider별 메모리는 수집 단계에서 기록)
             collected_data = self.collect(input_dir)
 
             if not collected_data:
                 return {"status": "error", "message": "수집된 데이터가 없습니다"}
 
+            run = self.data_collector.checkpoint_run
+
             # 2. CSV 내보내기
-            exported_files = self.export_to_csv(collected_data, output_dir)
+            with memory_monitor.stage("export"):
+                exported_files = self.export_stage(collected_data, output_dir, run)
+
+            # 3. 스냅샷 이력 저장
+            with memory_monitor.stage("history"):
+                self.history_stage(collected_data, run=run)
+
+            # 4. 포트폴리오 요약
+            with memory_monitor.stage("summary"):
+                portfolio_summary = self.data_collector.summarize_portfolio(collected_data)
+                summary_files = {}
+                if exported_files:
+                    summary_files = self.export_summary(portfolio_summary, next(iter(exported_files.values())).parent)
+
+            # 5. 업로드 대기열 등록 (drain 명령어로 전송)
+            upload_key = None
+            if exported_files:
+                upload_key = self.enqueue_upload(next(iter(exported_files.values())).parent)
 
             # 결과 요약
             summary = self.data_collector.get_collection_summary(collected_data)
@@ -51,9 +89,16 @@ class Donmoa:
                 "providers": self.list_providers(),
                 "total_records": total_records,
                 "exported_files": {k: str(v) for k, v in exported_files.items()},
-                "collection_summary": summary
+                "upload_key": upload_key,
+                "collection_summary": summary,
+                "portfolio_summary": portfolio_summary.to_dict("records"),
+                "summary_files": {k: str(v) for k, v in summary_files.items()},
+                "memory": memory_monitor.report()
             }
 
+            if run is not None:
+                run.finish()
+
             logger.info(f"✅ 워크플로우 완료: {total_records}개 레코드, {len(exported_files)}개 파일")
             return result
 
@@ -65,7 +110,7 @@ class Donmoa:
         """현재 상태를 반환합니다."""
         return {
             "providers": {
-                "total": len(self.data_collector.providers),
+                "total": len(self.list_providers()),
                 "names": self.list_providers()
             },
             "configuration": {
@@ -107,27 +152,107 @@ class Donmoa:
 
         return self.csv_exporter.export_to_csv(data)
 
-    def _register_default_providers(self) -> None:
-        """설정에서 기본 Provider들을 등록합니다."""
+    def export_stage(
+        self,
+        data: Dict[str, List[Any]],
+        output_dir: Optional[Path] = None,
+        run: Optional[CheckpointRun] = None
+    ) -> Dict[str, Path]:
+        """
+        거래 중복 제거(dedup), CSV 내보내기, 거래 인덱스 기록을 한 단계로 수행하고 체크포인트에 기록합니다.
+
+        중복 제거는 내보내는 데이터에만 적용하며 data는 바꾸지 않습니다. 이후 이력 저장 단계는
+        수집한 거래 전체를 받아야, 이미 내보낸 날짜를 다시 실행해도 이력의 거래가 지워지지 않습니다.
+        체크포인트에 이미 완료된 단계면 내보낸 파일을 그대로 사용하고, 파일이 없어졌으면
+        그때 내보낸 데이터로 다시 씁니다. (거래가 이미 인덱스에 있으므로 다시 중복 제거하지 않음)
+        """
+        stage = run.stage("export") if run is not None else None
+        if stage is not None:
+            files = {data_type: Path(path) for data_type, path in stage.get("files", {}).items()}
+            if all(path.exists() for path in files.values()):
+                logger.info(f"♻️ 내보내기 단계 재사용 ({run.run_id})")
+                return files
+            stage_data = run.stage_data("export")
+            return self.export_to_csv(stage_data["exported"] if stage_data else data, output_dir)
+
+        exported_data = self.data_collector.dedup_transactions(data)
+        exported_files = self.export_to_csv(exported_data, output_dir)
+        self.data_collector.commit_transactions(exported_data)
+        if run is not None:
+            run.complete_stage(
+                "export",
+                {"files": {data_type: str(path) for data_type, path in exported_files.items()}},
+                data={"collected": data, "exported": exported_data}
+            )
+        return exported_files
+
+    def history_stage(
+        self,
+        data: Dict[str, List[Any]],
+        snapshot_date: Optional[str] = None,
+        run: Optional[CheckpointRun] = None
+    ) -> None:
+        """스냅샷 이력을 저장하고 체크포인트에 기록합니다. 이미 완료된 단계면 건너뜁니다."""
+        if run is not None and run.stage("history") is not None:
+            logger.info(f"♻️ 이력 저장 단계 건너뜀 ({run.run_id})")
+            return
+        if self.save_history(data, snapshot_date) and run is not None:
+            run.complete_stage("history")
+
+    def export_summary(self, portfolio_summary: pd.DataFrame, export_path: Path) -> Dict[str, Path]:
+        """포트폴리오 요약을 export 디렉토리에 저장합니다."""
+        if not config_manager.get("export.summary", True) or portfolio_summary.empty:
+            return {}
         try:
-            # 전체 설정을 Provider들에게 전달
-            full_config = config_manager.config
+            return self.csv_exporter.export_summary(portfolio_summary, export_path)
+        except Exception as e:
+            logger.warning(f"포트폴리오 요약 저장 실패: {e}")
+            return {}
 
-            # 도미노 Provider 등록
-            from ..providers.domino import DominoProvider
-            domino_provider = DominoProvider("domino", full_config)
-            self.add_provider(domino_provider)
+    def save_history(
+        self,
+        collected_data: Dict[str, List[Dict[str, Any]]],
+        snapshot_date: Optional[str] = None
+    ) -> bool:
+        """수집 데이터를 스냅샷 이력 저장소에 기록합니다. 실패하면 False를 반환합니다."""
+        if not config_manager.get("history.enabled", True):
+            return True
 
-            # 뱅크샐러드 Provider 등록
-            from ..providers.banksalad import BanksaladProvider
-            banksalad_provider = BanksaladProvider("banksalad", full_config)
-            self.add_provider(banksalad_provider)
+        snapshot_date = (
+            snapshot_date or self.data_collector.snapshot_date or datetime.now().strftime("%Y-%m-%d")
+        )
+        try:
+            HistoryStore().save_snapshot(snapshot_date, collected_data)
+            return True
+        except Exception as e:
+            logger.warning(f"스냅샷 이력 저장 실패: {e}")
+            return False
 
-            # 수동 입력 Provider 등록
-            from ..providers.manual import ManualProvider
-            manual_provider = ManualProvider("manual", full_config)
-            self.add_provider(manual_provider)
+    def enqueue_upload(
+        self,
+        export_path: Path,
+        snapshot_date: Optional[str] = None,
+        notes: Optional[str] = None
+    ) -> Optional[str]:
+        """export 디렉토리를 업로드 대기열에 추가하고 멱등성 키를 반환합니다."""
+        if not config_manager.get("outbox.enabled", True):
+            return None
 
+        snapshot_date = (
+            snapshot_date or self.data_collector.snapshot_date or datetime.now().strftime("%Y-%m-%d")
+        )
+        try:
+            return UploadOutbox().enqueue(export_path, snapshot_date, notes)
+        except Exception as e:
+            logger.warning(f"업로드 대기열 등록 실패: {e}")
+            return None
+
+    def _register_default_providers(self) -> None:
+        """내장 및 엔트리 포인트 Provider 등록 정보를 등록합니다."""
+        try:
+            for spec in discover_providers():
+                self.data_collector.register_provider_spec(spec)
+                logger.info(f"Provider 등록: {spec.name} ({', '.join(spec.patterns())})")
         except Exception as e:
             logger.warning(f"기본 Provider 등록 실패: {e}")
 
@@ -141,4 +266,4 @@ class Donmoa:
 
     def list_providers(self) -> List[str]:
         """등록된 Provider 목록을 반환합니다."""
-        return [p.name for p in self.data_collector.providers]
+        return self.data_collector.list_provider_names()
@@ -0,0 +1,215 @@
+"""
+로컬 환율 저장소
+
+서버 fx_rates_daily 테이블(migration 002)과 같은 구조로 일별 환율을 SQLite에 보관하고,
+(통화, 날짜) 정렬 키 배열 하나로 as-of 조회를 합니다. 환율 규칙도 서버와 같이
+"1 quote = rate base"입니다.
+
+조회는 행 반복 없이 np.searchsorted 한 번으로 수행합니다. 통화 코드를 상위 32비트,
+날짜(일수)를 하위 32비트에 넣은 키를 정렬해 두면, 각 행의 키보다 작거나 같은 마지막
+키가 그 통화의 해당 날짜 이전 가장 최근 환율입니다.
+"""
+
+import sqlite3
+from contextlib import closing
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from ..utils.logger import logger
+from ..utils.config import config_manager
+
+
+SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS fx_rates_daily (
+  base_currency TEXT NOT NULL,
+  quote_currency TEXT NOT NULL,
+  rate_date TEXT NOT NULL,
+  rate REAL NOT NULL CHECK (rate > 0),
+  updated_at TEXT NOT NULL,
+  PRIMARY KEY (base_currency, quote_currency, rate_date),
+  CHECK (base_currency <> quote_currency)
+) WITHOUT ROWID;
+"""
+
+# 환율 CSV 필수 컬럼 (base_currency는 선택, 없으면 fx.base_currency)
+REQUIRED_COLUMNS = ["date", "currency", "rate"]
+
+# 통화 별칭 → ISO 코드
+CURRENCY_ALIASES = {"원": "KRW", "달러": "USD", "엔": "JPY", "유로": "EUR"}
+
+
+def normalize_currency(value: object) -> str:
+    """통화 표기를 ISO 코드로 정규화합니다."""
+    text = str(value or "").strip()
+    return CURRENCY_ALIASES.get(text, text.upper())
+
+
+class FxRateStore:
+    """일별 환율 저장소"""
+
+    def __init__(self, db_path: Optional[Path] = None):
+        if db_path is None:
+            db_path = Path(config_manager.get("fx.db_path", "data/history/fx_rates.db"))
+
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.base_currency = normalize_currency(config_manager.get("fx.base_currency", "KRW"))
+
+        with closing(sqlite3.connect(self.db_path)) as conn:
+            conn.executescript(SCHEMA_SQL)
+
+        # 조회용 배열 (처음 조회할 때 만들고, 가져오기 후 다시 만듦)
+        self._keys: Optional[np.ndarray] = None
+        self._rates: Optional[np.ndarray] = None
+        self._codes: Dict[str, int] = {}
+
+    def import_csv(self, path: Path) -> int:
+        """
+        환율 CSV(date, currency, rate[, base_currency])를 가져옵니다.
+
+        rate는 "1 currency = rate base_currency"입니다. 값이 같은 행은 다시 쓰지 않습니다.
+
+        Returns:
+            새로 쓰거나 바뀐 행 수
+        """
+        df = pd.read_csv(path, dtype=str, keep_default_na=False)
+        missing = [column for column in REQUIRED_COLUMNS if column not in df.columns]
+        if missing:
+            raise ValueError(f"환율 CSV에 필수 컬럼이 없습니다: {', '.join(missing)}")
+
+        base = df["base_currency"] if "base_currency" in df.columns else pd.Series(self.base_currency, index=df.index)
+        frame = pd.DataFrame({
+            "base": base.map(normalize_currency),
+            "quote": df["currency"].map(normalize_currency),
+            "date": pd.to_datetime(df["date"].str.strip().str.slice(0, 10), format="%Y-%m-%d", errors="coerce"),
+            "rate": pd.to_numeric(df["rate"].str.replace(",", "", regex=False), errors="coerce"),
+        })
+
+        valid = (
+            frame["date"].notna()
+            & (frame["rate"] > 0)
+            & frame["base"].str.fullmatch(r"[A-Z]{3}")
+            & frame["quote"].str.fullmatch(r"[A-Z]{3}")
+            & (frame["base"] != frame["quote"])
+        )
+        skipped = int((~valid).sum())
+        if skipped:
+            logger.warning(f"⚠️ 환율 CSV에서 형식이 잘못된 {skipped}행을 건너뜁니다: {path}")
+
+        frame = frame[valid]
+        now = datetime.now().isoformat()
+        rows = list(zip(
+            frame["base"],
+            frame["quote"],
+            frame["date"].dt.strftime("%Y-%m-%d"),
+            frame["rate"].astype(float),
+            [now] * len(frame)
+        ))
+
+        with closing(sqlite3.connect(self.db_path)) as conn:
+            with conn:
+                before = conn.total_changes
+                conn.executemany(
+                    "INSERT INTO fx_rates_daily (base_currency, quote_currency, rate_date, rate, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?) "
+                    "ON CONFLICT (base_currency, quote_currency, rate_date) DO UPDATE SET "
+                    "rate = excluded.rate, updated_at = excluded.updated_at "
+                    "WHERE rate != excluded.rate",
+                    rows
+                )
+                changed = conn.total_changes - before
+
+        self._keys = None
+        logger.info(f"환율 가져오기: {len(rows)}행 중 {changed}행 갱신")
+        return changed
+
+    def coverage(self) -> pd.DataFrame:
+        """통화별 환율 기간과 행 수를 반환합니다."""
+        with closing(sqlite3.connect(self.db_path)) as conn:
+            return pd.read_sql_query(
+                "SELECT base_currency, quote_currency, MIN(rate_date) AS first_date, "
+                "MAX(rate_date) AS last_date, COUNT(*) AS days "
+                "FROM fx_rates_daily GROUP BY base_currency, quote_currency "
+                "ORDER BY base_currency, quote_currency",
+                conn
+            )
+
+    def rates_asof(
+        self,
+        codes: np.ndarray,
+        labels: Sequence[str],
+        days: np.ndarray,
+        base_currency: Optional[str] = None
+    ) -> np.ndarray:
+        """
+        각 행의 (통화, 날짜)에 대해 그 날짜 이전 가장 최근 환율을 반환합니다.
+
+        저장된 기준 통화(fx.base_currency)가 아닌 통화로 환산할 때는 두 환율의 비율로
+        교차 환율을 계산합니다.
+
+        Args:
+            codes: 행별 통화 코드 (labels의 위치)
+            labels: 통화 코드 → 통화 표기
+            days: 행별 날짜 (1970-01-01 기준 일수)
+            base_currency: 환산할 통화 (기본값 fx.base_currency)
+
+        Returns:
+            행별 "1 통화 = rate base_currency" 배열, 환율이 없으면 NaN
+        """
+        base = normalize_currency(base_currency or self.base_currency)
+        labels = [normalize_currency(label) for label in labels]
+        codes = np.asarray(codes, dtype=np.int64)
+        days = np.asarray(days, dtype=np.int64)
+
+        rates = self._lookup(codes, labels, days)
+        if base != self.base_currency:
+            rates = rates / self._lookup(np.zeros(len(days), dtype=np.int64), [base], days)
+        if base in labels:
+            rates[codes == labels.index(base)] = 1.0
+        return rates
+
+    def _lookup(self, codes: np.ndarray, labels: Sequence[str], days: np.ndarray) -> np.ndarray:
+        """저장된 기준 통화로의 as-of 환율 (기준 통화 자신은 1)"""
+        if self._keys is None:
+            self._load()
+
+        # 호출 측 통화 코드 → 저장소 통화 코드 (없으면 -1, 기준 통화는 -2)
+        mapping = np.array(
+            [-2 if label == self.base_currency else self._codes.get(label, -1) for label in labels] or [-1],
+            dtype=np.int64
+        )
+        store_codes = mapping[codes]
+
+        rates = np.where(store_codes == -2, 1.0, np.nan)
+        known = store_codes >= 0
+        if self._keys.size and known.any():
+            query = (store_codes[known] << 32) | days[known]
+            idx = np.searchsorted(self._keys, query, side="right") - 1
+            # 이전 키가 같은 통화일 때만 유효 (다른 통화의 마지막 환율이 잡히지 않도록)
+            hit = (idx >= 0) & ((self._keys[np.maximum(idx, 0)] >> 32) == store_codes[known])
+            found = np.full(idx.size, np.nan)
+            found[hit] = self._rates[idx[hit]]
+            rates[known] = found
+        return rates
+
+    def _load(self) -> None:
+        """기준 통화의 환율을 (통화 코드, 일수) 정렬 키 배열로 읽습니다."""
+        with closing(sqlite3.connect(self.db_path)) as conn:
+            df = pd.read_sql_query(
+                "SELECT quote_currency, rate_date, rate FROM fx_rates_daily WHERE base_currency = ?",
+                conn,
+                params=(self.base_currency,)
+            )
+
+        codes, labels = pd.factorize(df["quote_currency"])
+        self._codes = {label: code for code, label in enumerate(labels)}
+
+        days = pd.to_datetime(df["rate_date"], format="%Y-%m-%d").values.astype("datetime64[D]").astype(np.int64)
+        keys = (codes.astype(np.int64) << 32) | days
+        order = np.argsort(keys, kind="stable")
+        self._keys = keys[order]
+        self._rates = df["rate"].to_numpy(np.float64)[order]
@@ -0,0 +1,388 @@
+"""
+스냅샷 이력 시계열 엔진
+
+HistoryStore의 스냅샷을 컬럼별 NumPy 배열(.npy)로 캐시하고,
+메모리 매핑으로 읽어 순자산/계좌별 현금/종목별 매입금액 시계열을 계산합니다.
+스냅샷에는 시세가 없으므로 포지션 값은 평가액이 아닌 매입금액(수량 × 평균단가)이며,
+순자산도 이 매입금액 기준입니다.
+캐시의 최신 날짜보다 새 스냅샷은 .npy 파일 끝에 행을 덧붙이고 헤더의 행 수만 고치며,
+같은 날짜 스냅샷이 교체(또는 삭제)되었거나 과거 날짜가 추가되었을 때만 컬럼 파일을
+다시 씁니다.
+계좌·종목·통화는 사전 인코딩(dictionary encoding)된 정수 코드로 저장됩니다.
+기준 통화를 지정하면 FxRateStore의 날짜별 as-of 환율로 값 컬럼 전체를 한 번에 환산합니다.
+"""
+
+import io
+import json
+from datetime import date as date_cls
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from ..utils.logger import logger
+from ..utils.config import config_manager
+from .fx_rates import FxRateStore
+from .history_store import HistoryStore
+
+
+EPOCH = date_cls(1970, 1, 1)
+
+# 통화가 비어 있는 행의 통화 (스키마 기본값)
+DEFAULT_CURRENCY = "KRW"
+
+# 테이블별 캐시 컬럼 (이름, dtype)
+CACHE_COLUMNS = {
+    "cash": [
+        ("snapshot_id", np.int64),
+        ("date", np.int32),
+        ("account", np.int32),
+        ("currency", np.int32),
+        ("value", np.float64),
+    ],
+    "positions": [
+        ("snapshot_id", np.int64),
+        ("date", np.int32),
+        ("account", np.int32),
+        ("ticker", np.int32),
+        ("currency", np.int32),
+        ("quantity", np.float64),
+        ("value", np.float64),
+    ],
+}
+
+
+def _to_days(dates: pd.Series) -> np.ndarray:
+    """YYYY-MM-DD 문자열을 1970-01-01 기준 일수로 변환합니다."""
+    parsed = pd.to_datetime(dates.str.slice(0, 10), format="%Y-%m-%d")
+    return parsed.values.astype("datetime64[D]").astype(np.int32)
+
+
+def _to_day(date_str: str) -> int:
+    """단일 날짜 문자열을 일수로 변환합니다."""
+    return (date_cls.fromisoformat(date_str[:10]) - EPOCH).days
+
+
+class HistoryEngine:
+    """메모리 매핑 컬럼 캐시 기반 시계열 엔진"""
+
+    def __init__(self, store: Optional[HistoryStore] = None, cache_dir: Optional[Path] = None):
+        if cache_dir is None:
+            cache_dir = Path(config_manager.get("history.cache_dir", "data/history/cache"))
+
+        self.store = store or HistoryStore()
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.meta = self._load_meta()
+        self._fx: Optional[FxRateStore] = None
+
+    # 캐시 관리
+    def refresh(self) -> int:
+        """
+        저장소의 새 스냅샷만 캐시에 반영합니다.
+
+        새 스냅샷이 모두 캐시의 최신 날짜 이후면 컬럼 파일 끝에 덧붙입니다. 교체되었거나
+        삭제된 스냅샷이 있거나 과거 날짜 스냅샷이 추가되면 날짜 정렬을 유지하도록
+        컬럼을 다시 씁니다.
+
+        Returns:
+            새로 반영된 스냅샷 수
+        """
+        snapshot_dates = {s["id"]: s["snapshot_date"] for s in self.store.list_snapshots()}
+        cached_ids = set(self.meta["snapshot_ids"])
+
+        stale_ids = cached_ids - set(snapshot_dates)
+        new_ids = sorted(set(snapshot_dates) - cached_ids)
+
+        if not stale_ids and not new_ids:
+            return 0
+
+        kept_ids = (cached_ids - stale_ids) | set(new_ids)
+        max_date = max((snapshot_dates[i] for i in cached_ids - stale_ids), default=None)
+        append = not stale_ids and (max_date is None or min(snapshot_dates[i] for i in new_ids) > max_date)
+
+        rows = self.meta.setdefault("rows", {})
+        for table in CACHE_COLUMNS:
+            new_columns = self._encode_snapshots(table, new_ids) if new_ids else None
+            if append and self._append_columns(table, new_columns):
+                continue
+
+            # 제거된 스냅샷과, 중간에 실패한 추가가 남긴 기록되지 않은 행을 함께 걸러냄
+            columns = self._read_columns(table, mmap=False)
+            if len(columns["snapshot_id"]):
+                keep = np.isin(columns["snapshot_id"], list(cached_ids - stale_ids))
+                columns = {name: values[keep] for name, values in columns.items()}
+            if new_columns is not None:
+                merged = {name: np.concatenate([columns[name], new_columns[name]]) for name in columns}
+                order = np.argsort(merged["date"], kind="stable")
+                columns = {name: values[order] for name, values in merged.items()}
+            self._write_columns(table, columns)
+            rows[table] = len(columns["snapshot_id"])
+
+        self.meta["snapshot_ids"] = sorted(kept_ids)
+        self._save_meta()
+
+        mode = "추가" if append else "재작성"
+        logger.info(f"이력 캐시 갱신({mode}): 신규 {len(new_ids)}건, 제거 {len(stale_ids)}건")
+        return len(new_ids)
+
+    def rebuild(self) -> int:
+        """캐시를 비우고 전체 스냅샷으로 다시 만듭니다."""
+        self._clear()
+        return self.refresh()
+
+    # 시계열 조회
+    def net_worth(
+        self,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        base_currency: Optional[str] = None
+    ) -> pd.Series:
+        """
+        날짜별 순자산(현금 + 포지션 매입금액)을 반환합니다.
+
+        base_currency를 지정하면 현금과 포지션을 합친 뒤 한 번에 환산합니다.
+        """
+        cash = self._range("cash", start_date, end_date)
+        positions = self._range("positions", start_date, end_date)
+
+        dates = np.concatenate([cash["date"], positions["date"]])
+        currencies = np.concatenate([cash["currency"], positions["currency"]])
+        values = np.concatenate([cash["value"], positions["value"]])
+        if not len(dates):
+            return pd.Series(dtype=np.float64, name="net_worth")
+
+        values = self._to_base(dates, currencies, values, base_currency)
+        unique_dates, inverse = np.unique(dates, return_inverse=True)
+        totals = np.bincount(inverse, weights=values, minlength=len(unique_dates))
+        return pd.Series(totals, index=self._to_index(unique_dates), name="net_worth")
+
+    def cash_by_account(
+        self,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        base_currency: Optional[str] = None
+    ) -> pd.DataFrame:
+        """날짜 × 계좌별 현금 잔액을 반환합니다."""
+        cash = self._range("cash", start_date, end_date)
+        values = self._to_base(cash["date"], cash["currency"], cash["value"], base_currency)
+        return self._pivot(cash["date"], cash["account"], values, self.meta["accounts"])
+
+    def position_cost_by_ticker(
+        self,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        base_currency: Optional[str] = None
+    ) -> pd.DataFrame:
+        """날짜 × 종목별 포지션 매입금액(수량 × 평균단가)을 반환합니다."""
+        positions = self._range("positions", start_date, end_date)
+        values = self._to_base(positions["date"], positions["currency"], positions["value"], base_currency)
+        return self._pivot(positions["date"], positions["ticker"], values, self.meta["tickers"])
+
+    # 내부 구현
+    def _range(self, table: str, start_date: Optional[str], end_date: Optional[str]) -> Dict[str, np.ndarray]:
+        """date로 정렬된 메모리 매핑 배열에서 기간에 해당하는 구간을 잘라냅니다."""
+        columns = self._read_columns(table, mmap=True)
+        dates = columns["date"]
+
+        lo = int(np.searchsorted(dates, _to_day(start_date), side="left")) if start_date else 0
+        hi = int(np.searchsorted(dates, _to_day(end_date), side="right")) if end_date else len(dates)
+        return {name: values[lo:hi] for name, values in columns.items()}
+
+    def _to_base(
+        self,
+        dates: np.ndarray,
+        currencies: np.ndarray,
+        values: np.ndarray,
+        base_currency: Optional[str]
+    ) -> np.ndarray:
+        """값을 날짜별 as-of 환율로 base_currency로 환산합니다. 환율이 없는 행은 0으로 제외합니다."""
+        if not base_currency or not len(values):
+            return values
+
+        if self._fx is None:
+            self._fx = FxRateStore()
+
+        labels = [label or DEFAULT_CURRENCY for label in self.meta["currencies"]]
+        rates = self._fx.rates_asof(currencies, labels, dates, base_currency)
+
+        missing = np.isnan(rates)
+        if missing.any():
+            names = ", ".join(sorted({labels[code] for code in np.unique(currencies[missing])}))
+            logger.warning(f"⚠️ 환율이 없어 {base_currency} 환산에서 제외된 행: {int(missing.sum())}건 ({names})")
+            rates = np.where(missing, 0.0, rates)
+        return values * rates
+
+    def _pivot(
+        self,
+        dates: np.ndarray,
+        codes: np.ndarray,
+        values: np.ndarray,
+        labels: List[str]
+    ) -> pd.DataFrame:
+        """(date, code) 그룹 합계를 날짜 × 라벨 표로 만듭니다."""
+        if not len(dates):
+            return pd.DataFrame()
+
+        unique_dates, date_idx = np.unique(dates, return_inverse=True)
+        used_codes, code_idx = np.unique(codes, return_inverse=True)
+
+        flat = date_idx * len(used_codes) + code_idx
+        totals = np.bincount(flat, weights=values, minlength=len(unique_dates) * len(used_codes))
+
+        return pd.DataFrame(
+            totals.reshape(len(unique_dates), len(used_codes)),
+            index=self._to_index(unique_dates),
+            columns=[labels[code] for code in used_codes]
+        )
+
+    def _encode_snapshots(self, table: str, snapshot_ids: List[int]) -> Optional[Dict[str, np.ndarray]]:
+        """스냅샷 행을 캐시 컬럼으로 인코딩하고 date 순으로 정렬합니다. 행이 없으면 None"""
+        df = self.store.get_snapshot_rows(table, snapshot_ids)
+        if df.empty:
+            return None
+
+        columns = {
+            "snapshot_id": df["snapshot_id"].to_numpy(np.int64),
+            "date": _to_days(df["date"]),
+            "account": self._encode("accounts", df["account"]),
+            "currency": self._encode("currencies", df["currency"]),
+        }
+        if table == "cash":
+            columns["value"] = df["balance"].to_numpy(np.float64)
+        else:
+            quantity = df["quantity"].to_numpy(np.float64)
+            columns["ticker"] = self._encode("tickers", df["ticker"])
+            columns["quantity"] = quantity
+            # 시세가 없으므로 매입금액(수량 × 평균단가)
+            columns["value"] = quantity * df["average_price"].fillna(0).to_numpy(np.float64)
+
+        order = np.argsort(columns["date"], kind="stable")
+        return {name: values[order] for name, values in columns.items()}
+
+    def _append_columns(self, table: str, new_columns: Optional[Dict[str, np.ndarray]]) -> bool:
+        """
+        캐시 컬럼 파일 끝에 행을 덧붙이고 헤더의 행 수만 고칩니다.
+
+        np.save가 헤더에 남겨 둔 여유 공간 안에서 행 수를 고치므로 기존 행은 다시 쓰지
+        않습니다. 컬럼 길이가 메타데이터와 다르거나(중간에 실패한 추가) 헤더 길이가
+        달라지면 아무것도 쓰지 않고 False를 반환해 다시 쓰게 합니다.
+        """
+        expected = self.meta.get("rows", {}).get(table)
+        headers = {}
+        for name, dtype in CACHE_COLUMNS[table]:
+            path = self._column_path(table, name)
+            if not path.exists():
+                return False
+            with open(path, "rb") as f:
+                version = np.lib.format.read_magic(f)
+                if version != (1, 0):
+                    return False
+                shape, fortran_order, file_dtype = np.lib.format.read_array_header_1_0(f)
+                offset = f.tell()
+            if fortran_order or file_dtype != np.dtype(dtype) or len(shape) != 1:
+                return False
+            if expected is None:
+                expected = shape[0]
+            if shape[0] != expected:
+                return False
+            headers[name] = (path, offset, shape[0])
+
+        added = 0 if new_columns is None else len(new_columns["snapshot_id"])
+        buffers = {}
+        for name, dtype in CACHE_COLUMNS[table]:
+            path, offset, count = headers[name]
+            header = io.BytesIO()
+            np.lib.format.write_array_header_1_0(header, {
+                "descr": np.lib.format.dtype_to_descr(np.dtype(dtype)),
+                "fortran_order": False,
+                "shape": (count + added,),
+            })
+            if len(header.getvalue()) != offset:
+                return False
+            buffers[name] = header.getvalue()
+
+        for name, dtype in CACHE_COLUMNS[table]:
+            path, offset, count = headers[name]
+            with open(path, "r+b") as f:
+                # 중간에 실패한 추가가 남긴 꼬리는 덮어씀 (헤더의 행 수까지만 유효)
+                f.seek(offset + count * np.dtype(dtype).itemsize)
+                if added:
+                    f.write(np.ascontiguousarray(new_columns[name], dtype=dtype).tobytes())
+                f.truncate()
+                f.seek(0)
+                f.write(buffers[name])
+
+        self.meta.setdefault("rows", {})[table] = expected + added
+        return True
+
+    def _encode(self, key: str, values: pd.Series) -> np.ndarray:
+        """문자열을 사전 인코딩하고, 처음 보는 값은 사전에 추가합니다."""
+        labels: List[str] = self.meta[key]
+        lookup = {label: code for code, label in enumerate(labels)}
+
+        for label in pd.unique(values.fillna("").astype(str)):
+            if label not in lookup:
+                lookup[label] = len(labels)
+                labels.append(label)
+
+        return values.fillna("").astype(str).map(lookup).to_numpy(np.int32)
+
+    def _read_columns(self, table: str, mmap: bool) -> Dict[str, np.ndarray]:
+        """캐시 컬럼을 읽습니다. 없으면 빈 배열을 반환합니다."""
+        columns = {}
+        for name, dtype in CACHE_COLUMNS[table]:
+            path = self._column_path(table, name)
+            if path.exists():
+                columns[name] = np.load(path, mmap_mode="r" if mmap else None)
+            else:
+                columns[name] = np.empty(0, dtype=dtype)
+        return columns
+
+    def _write_columns(self, table: str, columns: Dict[str, np.ndarray]) -> None:
+        """캐시 컬럼을 원자적으로 저장합니다."""
+        for name, dtype in CACHE_COLUMNS[table]:
+            path = self._column_path(table, name)
+            tmp_path = path.with_suffix(".tmp.npy")
+            np.save(tmp_path, np.ascontiguousarray(columns[name], dtype=dtype))
+            tmp_path.replace(path)
+
+    def _column_path(self, table: str, name: str) -> Path:
+        return self.cache_dir / f"{table}_{name}.npy"
+
+    def _clear(self) -> None:
+        """캐시 컬럼을 모두 지우고 메타데이터를 초기화합니다."""
+        for path in self.cache_dir.glob("*.npy"):
+            path.unlink()
+        self.meta = self._empty_meta()
+
+    def _load_meta(self) -> Dict[str, Any]:
+        meta_path = self.cache_dir / "meta.json"
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"이력 캐시 메타데이터 로드 실패, 캐시를 재생성합니다: {e}")
+
+        # 메타데이터 없이 남은 컬럼은 신뢰할 수 없으므로 비웁니다
+        self._clear()
+        return self.meta
+
+    def _save_meta(self) -> None:
+        meta_path = self.cache_dir / "meta.json"
+        tmp_path = meta_path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.meta, f, ensure_ascii=False)
+        tmp_path.replace(meta_path)
+
+    @staticmethod
+    def _empty_meta() -> Dict[str, Any]:
+        return {"snapshot_ids": [], "accounts": [], "tickers": [], "currencies": [], "rows": {}}
+
+    @staticmethod
+    def _to_index(days: np.ndarray) -> pd.DatetimeIndex:
+        return pd.DatetimeIndex(days.astype("datetime64[D]"), name="date")
+
@@ -0,0 +1,263 @@
+"""
+스냅샷 이력 저장소 (SQLite)
+
+packages/database/migrations/003_create_snapshots.sql 의
+snapshots / snapshot_cash / snapshot_positions / snapshot_transactions 구조를
+로컬 SQLite 파일로 옮겨 과거 스냅샷을 CSV 재파싱 없이 조회할 수 있게 합니다.
+"""
+
+import sqlite3
+from contextlib import closing
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import pandas as pd
+
+from ..utils.logger import logger
+from ..utils.config import config_manager
+
+
+SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS snapshots (
+  id INTEGER PRIMARY KEY AUTOINCREMENT,
+  snapshot_date TEXT NOT NULL,
+  source TEXT NOT NULL CHECK (source IN ('cli', 'manual', 'banksalad', 'domino', 'web')),
+  notes TEXT,
+  created_at TEXT NOT NULL
+);
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_snapshots_date ON snapshots(snapshot_date);
+
+CREATE TABLE IF NOT EXISTS snapshot_cash (
+  id INTEGER PRIMARY KEY AUTOINCREMENT,
+  snapshot_id INTEGER NOT NULL REFERENCES snapshots(id) ON DELETE CASCADE,
+  date TEXT NOT NULL,
+  category TEXT,
+  account TEXT NOT NULL,
+  currency TEXT NOT NULL,
+  balance REAL NOT NULL,
+  provider TEXT
+);
+
+CREATE INDEX IF NOT EXISTS idx_snapshot_cash_snapshot ON snapshot_cash(snapshot_id);
+CREATE INDEX IF NOT EXISTS idx_snapshot_cash_date_account ON snapshot_cash(date, account);
+
+CREATE TABLE IF NOT EXISTS snapshot_positions (
+  id INTEGER PRIMARY KEY AUTOINCREMENT,
+  snapshot_id INTEGER NOT NULL REFERENCES snapshots(id) ON DELETE CASCADE,
+  date TEXT NOT NULL,
+  account TEXT NOT NULL,
+  name TEXT,
+  ticker TEXT NOT NULL,
+  quantity REAL NOT NULL,
+  average_price REAL,
+  currency TEXT NOT NULL,
+  provider TEXT
+);
+
+CREATE INDEX IF NOT EXISTS idx_snapshot_positions_snapshot ON snapshot_positions(snapshot_id);
+CREATE INDEX IF NOT EXISTS idx_snapshot_positions_date_account ON snapshot_positions(date, account);
+CREATE INDEX IF NOT EXISTS idx_snapshot_positions_date_ticker ON snapshot_positions(date, ticker);
+
+CREATE TABLE IF NOT EXISTS snapshot_transactions (
+  id INTEGER PRIMARY KEY AUTOINCREMENT,
+  snapshot_id INTEGER NOT NULL REFERENCES snapshots(id) ON DELETE CASCADE,
+  date TEXT NOT NULL,
+  account TEXT NOT NULL,
+  transaction_type TEXT,
+  amount REAL,
+  category TEXT,
+  category_detail TEXT,
+  currency TEXT NOT NULL,
+  note TEXT,
+  provider TEXT
+);
+
+CREATE INDEX IF NOT EXISTS idx_snapshot_transactions_snapshot ON snapshot_transactions(snapshot_id);
+CREATE INDEX IF NOT EXISTS idx_snapshot_transactions_date_account ON snapshot_transactions(date, account);
+"""
+
+CASH_COLUMNS = ["date", "category", "account", "currency", "balance", "provider"]
+POSITION_COLUMNS = ["date", "account", "name", "ticker", "quantity", "average_price", "currency", "provider"]
+TRANSACTION_COLUMNS = [
+    "date", "account", "transaction_type", "amount", "category",
+    "category_detail", "currency", "note", "provider"
+]
+
+TABLE_COLUMNS = {
+    "cash": ("snapshot_cash", CASH_COLUMNS),
+    "positions": ("snapshot_positions", POSITION_COLUMNS),
+    "transactions": ("snapshot_transactions", TRANSACTION_COLUMNS),
+}
+
+
+class HistoryStore:
+    """스냅샷 이력 SQLite 저장소"""
+
+    def __init__(self, db_path: Optional[Path] = None):
+        if db_path is None:
+            db_path = Path(config_manager.get("history.db_path", "data/history/donmoa.db"))
+
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._init_schema()
+
+    def _connect(self) -> sqlite3.Connection:
+        """외래 키 제약이 켜진 연결을 반환합니다."""
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("PRAGMA foreign_keys = ON")
+        return conn
+
+    def _init_schema(self) -> None:
+        """테이블과 인덱스를 생성합니다."""
+        with closing(self._connect()) as conn:
+            conn.executescript(SCHEMA_SQL)
+
+    def save_snapshot(
+        self,
+        snapshot_date: str,
+        data: Dict[str, List[Any]],
+        source: str = "cli",
+        notes: Optional[str] = None
+    ) -> int:
+        """
+        수집 데이터를 하나의 스냅샷으로 저장합니다.
+
+        같은 날짜의 스냅샷이 있으면 교체합니다. 모든 행은 단일 트랜잭션 안에서
+        executemany로 일괄 삽입됩니다.
+
+        Args:
+            snapshot_date: 스냅샷 날짜 (YYYY-MM-DD)
+            data: DataCollector가 반환한 통합 데이터
+            source: 스냅샷 출처
+            notes: 스냅샷 노트
+
+        Returns:
+            생성된 스냅샷 ID
+        """
+        with closing(self._connect()) as conn:
+            with conn:
+                conn.execute("DELETE FROM snapshots WHERE snapshot_date = ?", (snapshot_date,))
+                cursor = conn.execute(
+                    "INSERT INTO snapshots (snapshot_date, source, notes, created_at) VALUES (?, ?, ?, ?)",
+                    (snapshot_date, source, notes, datetime.now().isoformat())
+                )
+                snapshot_id = cursor.lastrowid
+
+                for data_type, (table, columns) in TABLE_COLUMNS.items():
+                    records = data.get(data_type) or []
+                    if not records:
+                        continue
+
+                    rows = [
+                        (snapshot_id, *self._record_values(record, columns))
+                        for record in records
+                    ]
+                    placeholders = ", ".join("?" * (len(columns) + 1))
+                    conn.executemany(
+                        f"INSERT INTO {table} (snapshot_id, {', '.join(columns)}) VALUES ({placeholders})",
+                        rows
+                    )
+
+        logger.info(f"스냅샷 이력 저장 완료: {snapshot_date} (ID: {snapshot_id})")
+        return snapshot_id
+
+    def list_snapshots(self) -> List[Dict[str, Any]]:
+        """저장된 스냅샷 목록을 날짜순으로 반환합니다."""
+        with closing(self._connect()) as conn:
+            conn.row_factory = sqlite3.Row
+            rows = conn.execute(
+                "SELECT id, snapshot_date, source, notes, created_at FROM snapshots ORDER BY snapshot_date"
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def get_snapshot_rows(self, data_type: str, snapshot_ids: List[int]) -> pd.DataFrame:
+        """지정한 스냅샷들의 행을 snapshot_id와 함께 반환합니다."""
+        table, columns = TABLE_COLUMNS[data_type]
+        frames = []
+
+        with closing(self._connect()) as conn:
+            # SQLite 바인딩 변수 개수 제한을 피하기 위해 나누어 조회
+            for i in range(0, len(snapshot_ids), 500):
+                chunk = snapshot_ids[i:i + 500]
+                placeholders = ", ".join("?" * len(chunk))
+                frames.append(pd.read_sql_query(
+                    f"SELECT snapshot_id, {', '.join(columns)} FROM {table} "
+                    f"WHERE snapshot_id IN ({placeholders})",
+                    conn,
+                    params=chunk
+                ))
+
+        if not frames:
+            return pd.DataFrame(columns=["snapshot_id", *columns])
+        return pd.concat(frames, ignore_index=True)
+
+    def get_cash_history(
+        self,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        account: Optional[str] = None
+    ) -> pd.DataFrame:
+        """기간 내 현금 이력을 반환합니다."""
+        return self._query("snapshot_cash", CASH_COLUMNS, start_date, end_date, account=account)
+
+    def get_position_history(
+        self,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        account: Optional[str] = None,
+        ticker: Optional[str] = None
+    ) -> pd.DataFrame:
+        """기간 내 포지션 이력을 반환합니다."""
+        return self._query(
+            "snapshot_positions", POSITION_COLUMNS, start_date, end_date, account=account, ticker=ticker
+        )
+
+    def get_transactions(
+        self,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        account: Optional[str] = None
+    ) -> pd.DataFrame:
+        """기간 내 거래 이력을 반환합니다."""
+        return self._query("snapshot_transactions", TRANSACTION_COLUMNS, start_date, end_date, account=account)
+
+    def _query(
+        self,
+        table: str,
+        columns: List[str],
+        start_date: Optional[str],
+        end_date: Optional[str],
+        **filters: Optional[str]
+    ) -> pd.DataFrame:
+        """(date, account/ticker) 인덱스를 타는 기간 조회를 수행합니다."""
+        conditions = []
+        params: List[Any] = []
+
+        if start_date:
+            conditions.append("date >= ?")
+            params.append(start_date)
+        if end_date:
+            # 거래 date는 YYYY-MM-DDTHH:MM:SS 형식이므로 해당 일자 전체를 포함하도록 비교
+            conditions.append("date <= ?")
+            params.append(f"{end_date}T99")
+        for column, value in filters.items():
+            if value is not None:
+                conditions.append(f"{column} = ?")
+                params.append(value)
+
+        sql = f"SELECT {', '.join(columns)} FROM {table}"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY date"
+
+        with closing(self._connect()) as conn:
+            return pd.read_sql_query(sql, conn, params=params)
+
+    @staticmethod
+    def _record_values(record: Any, columns: List[str]) -> List[Any]:
+        """스키마 객체 또는 딕셔너리에서 컬럼 순서대로 값을 꺼냅니다."""
+        if hasattr(record, "to_dict"):
+            record = record.to_dict()
+        return [record.get(column) for column in columns]
@@ -0,0 +1,376 @@
+"""
+로컬 종목 마스터 캐시
+
+서버 instruments 테이블(migration 002, symbol + currency 고유)의 일부를 SQLite에
+보관하고, 포지션의 ticker/name을 업로드 전에 종목으로 해석합니다.
+
+조회는 메모리 해시 인덱스로 수행합니다.
+- (symbol, currency), symbol, ISIN: 정규화한 코드 그대로
+- 종목명: 공백/기호/법인 표기를 제거한 정규화 이름
+
+캐시는 증분으로 갱신됩니다. CSV 가져오기는 바뀐 행만 갱신하고, API 검색은 캐시에 없는
+종목만 조회하며 실패한 조회는 일정 기간 다시 묻지 않습니다. 끝까지 찾지 못한 종목은
+이름/티커와 추정 자산군으로 로컬 항목을 만들어 다음 실행부터 바로 찾습니다.
+"""
+
+import re
+import sqlite3
+import unicodedata
+from contextlib import closing
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import pandas as pd
+import requests
+
+from ..utils.logger import logger
+from ..utils.config import config_manager
+
+
+SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS instruments (
+  symbol TEXT NOT NULL,
+  currency TEXT NOT NULL,
+  isin TEXT,
+  name TEXT NOT NULL,
+  norm_name TEXT NOT NULL,
+  asset_class TEXT NOT NULL,
+  instrument_id INTEGER,
+  source TEXT NOT NULL CHECK (source IN ('api', 'import', 'local')),
+  updated_at TEXT NOT NULL,
+  PRIMARY KEY (symbol, currency)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS idx_instruments_isin ON instruments(isin) WHERE isin IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_instruments_norm_name ON instruments(norm_name);
+
+CREATE TABLE IF NOT EXISTS instrument_misses (
+  query TEXT PRIMARY KEY,
+  checked_at TEXT NOT NULL
+) WITHOUT ROWID;
+"""
+
+# migration 002 instruments.asset_class 열거값
+ASSET_CLASSES = ["equity", "bond", "fund", "crypto", "commodity", "fx", "cash", "other"]
+
+# 출처 우선순위: 낮은 출처는 높은 출처의 항목을 덮어쓰지 않음
+SOURCE_PRIORITY = {"local": 0, "import": 1, "api": 2}
+
+INSTRUMENT_COLUMNS = ["symbol", "currency", "isin", "name", "norm_name", "asset_class", "instrument_id", "source"]
+
+_ISIN_RE = re.compile(r"^[A-Z]{2}[A-Z0-9]{9}[0-9]$")
+# 국내 단축코드 앞의 'A' (예: A005930)
+_KR_CODE_RE = re.compile(r"^A?([0-9][0-9A-Z]{5})$")
+_NAME_NOISE_RE = re.compile(r"\(주\)|㈜|주식회사|보통주|[\s\W_]+")
+
+# 이름으로 자산군을 추정하는 규칙 (앞에서부터 먼저 일치하는 규칙 사용)
+_ASSET_CLASS_RULES: List[Tuple[str, re.Pattern]] = [
+    ("bond", re.compile(r"채권|국채|국고채|회사채|bond|treasury", re.I)),
+    ("commodity", re.compile(r"골드|금현물|원유|\b(gold|silver|oil|commodity)\b", re.I)),
+    ("fund", re.compile(
+        r"^(kodex|tiger|kbstar|rise|arirang|hanaro|sol|ace|kosef|plus|timefolio)(?![a-z])|etf|펀드|리츠|reit", re.I
+    )),
+    ("crypto", re.compile(r"^(btc|eth|xrp|usdt|비트코인|이더리움)$", re.I)),
+    ("cash", re.compile(r"\b(cma|mmf|rp)\b|예수금|현금", re.I)),
+]
+
+
+def normalize_symbol(ticker: Any) -> str:
+    """티커를 비교용으로 정규화합니다. (대문자, 공백 제거, 국내 코드 앞 'A' 제거)"""
+    if ticker is None or (isinstance(ticker, float) and pd.isna(ticker)):
+        return ""
+    symbol = unicodedata.normalize("NFKC", str(ticker)).strip().upper().replace(" ", "")
+    match = _KR_CODE_RE.match(symbol)
+    return match.group(1) if match else symbol
+
+
+def normalize_name(name: Any) -> str:
+    """종목명을 비교용으로 정규화합니다. (NFKC, 소문자, 공백/기호/법인 표기 제거)"""
+    if name is None or (isinstance(name, float) and pd.isna(name)):
+        return ""
+    text = unicodedata.normalize("NFKC", str(name)).casefold()
+    return _NAME_NOISE_RE.sub("", text)
+
+
+def infer_asset_class(name: str, symbol: str) -> str:
+    """종목명/티커로 자산군을 추정합니다. 알 수 없으면 equity입니다."""
+    for asset_class, pattern in _ASSET_CLASS_RULES:
+        if pattern.search(name or "") or (asset_class == "crypto" and pattern.search(symbol or "")):
+            return asset_class
+    return "equity"
+
+
+class InstrumentCache:
+    """종목 마스터 캐시"""
+
+    def __init__(self, db_path: Optional[Path] = None):
+        if db_path is None:
+            db_path = Path(config_manager.get("instruments.db_path", "data/history/instruments.db"))
+
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.miss_ttl = timedelta(days=float(config_manager.get("instruments.miss_ttl_days", 7)))
+
+        with closing(sqlite3.connect(self.db_path)) as conn:
+            conn.executescript(SCHEMA_SQL)
+
+        self._by_key: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._by_symbol: Dict[str, Dict[str, Any]] = {}
+        self._by_isin: Dict[str, Dict[str, Any]] = {}
+        self._by_name: Dict[str, Dict[str, Any]] = {}
+        self._load()
+
+    def __len__(self) -> int:
+        return len(self._by_key)
+
+    def _load(self) -> None:
+        """SQLite의 모든 항목으로 메모리 인덱스를 만듭니다."""
+        with closing(sqlite3.connect(self.db_path)) as conn:
+            conn.row_factory = sqlite3.Row
+            rows = conn.execute(f"SELECT {', '.join(INSTRUMENT_COLUMNS)} FROM instruments").fetchall()
+        for row in rows:
+            self._index(dict(row))
+
+    def _index(self, entry: Dict[str, Any]) -> None:
+        """항목을 메모리 인덱스에 추가합니다. 출처 우선순위가 높은 항목이 이깁니다."""
+        self._by_key[(entry["symbol"], entry["currency"])] = entry
+        for index, key in (
+            (self._by_symbol, entry["symbol"]),
+            (self._by_isin, entry.get("isin")),
+            (self._by_name, entry["norm_name"]),
+        ):
+            if not key:
+                continue
+            current = index.get(key)
+            if current is None or SOURCE_PRIORITY[entry["source"]] >= SOURCE_PRIORITY[current["source"]]:
+                index[key] = entry
+
+    def resolve(self, ticker: Any, name: Any = None, currency: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        티커/종목명을 종목으로 해석합니다.
+
+        ISIN → (symbol, currency) → symbol → 정규화 이름 순서로 찾습니다.
+        """
+        symbol = normalize_symbol(ticker)
+        if symbol:
+            if _ISIN_RE.match(symbol) and symbol in self._by_isin:
+                return self._by_isin[symbol]
+            entry = self._by_key.get((symbol, (currency or "").upper()))
+            if entry is not None:
+                return entry
+            entry = self._by_symbol.get(symbol)
+            if entry is not None:
+                return entry
+
+        norm_name = normalize_name(name)
+        if norm_name:
+            return self._by_name.get(norm_name)
+        return None
+
+    def upsert(self, entries: Iterable[Dict[str, Any]]) -> int:
+        """
+        항목들을 저장합니다. 내용이 같거나 출처 우선순위가 낮은 항목은 건너뜁니다.
+
+        Returns:
+            새로 쓰거나 바뀐 항목 수
+        """
+        now = datetime.now().isoformat()
+        changed = []
+        for entry in entries:
+            entry = self._normalize_entry(entry)
+            if entry is None:
+                continue
+            current = self._by_key.get((entry["symbol"], entry["currency"]))
+            if current is not None:
+                if SOURCE_PRIORITY[entry["source"]] < SOURCE_PRIORITY[current["source"]]:
+                    continue
+                if all(current.get(column) == entry.get(column) for column in INSTRUMENT_COLUMNS):
+                    continue
+            changed.append(entry)
+
+        if not changed:
+            return 0
+
+        placeholders = ", ".join("?" * (len(INSTRUMENT_COLUMNS) + 1))
+        with closing(sqlite3.connect(self.db_path)) as conn:
+            with conn:
+                conn.executemany(
+                    f"INSERT OR REPLACE INTO instruments ({', '.join(INSTRUMENT_COLUMNS)}, updated_at) "
+                    f"VALUES ({placeholders})",
+                    [tuple(entry.get(column) for column in INSTRUMENT_COLUMNS) + (now,) for entry in changed]
+                )
+        for entry in changed:
+            self._index(entry)
+        return len(changed)
+
+    def import_csv(self, path: Path) -> int:
+        """
+        종목 마스터 CSV(symbol, name, currency, isin, asset_class)를 가져옵니다.
+
+        Returns:
+            새로 쓰거나 바뀐 항목 수
+        """
+        df = pd.read_csv(path, dtype=str, keep_default_na=False)
+        missing = [column for column in ("symbol", "name") if column not in df.columns]
+        if missing:
+            raise ValueError(f"종목 CSV에 필수 컬럼이 없습니다: {', '.join(missing)}")
+
+        records = df.to_dict("records")
+        for record in records:
+            record["source"] = "import"
+        changed = self.upsert(records)
+        logger.info(f"종목 마스터 가져오기: {len(records)}건 중 {changed}건 갱신")
+        return changed
+
+    def refresh_from_api(self, queries: Iterable[str]) -> int:
+        """
+        캐시에 없는 종목을 서버 종목 검색 API(GET /v1/instruments)로 조회합니다.
+
+        최근 miss_ttl 안에 찾지 못한 조회어는 다시 묻지 않습니다.
+
+        Returns:
+            새로 쓰거나 바뀐 항목 수
+        """
+        api_url = config_manager.get("api.url")
+        api_token = config_manager.get("api.token")
+        if not api_url:
+            return 0
+
+        queries = [q for q in dict.fromkeys(queries) if q and not self._recently_missed(q)]
+        if not queries:
+            return 0
+
+        headers = {"Authorization": f"Bearer {api_token}"} if api_token else {}
+        timeout = float(config_manager.get("performance.default_timeout", 30))
+        found, missed = [], []
+
+        for query in queries:
+            try:
+                response = requests.get(
+                    f"{api_url}/v1/instruments",
+                    params={"query": query, "limit": 10},
+                    headers=headers,
+                    timeout=timeout
+                )
+            except requests.exceptions.RequestException as e:
+                logger.warning(f"종목 검색 API 연결 실패, 로컬 캐시만 사용합니다: {e}")
+                break
+
+            if response.status_code != 200:
+                logger.warning(f"종목 검색 실패 ({query}): HTTP {response.status_code}")
+                continue
+
+            items = response.json().get("items") or []
+            matches = [
+                item for item in items
+                if normalize_symbol(item.get("symbol")) == normalize_symbol(query)
+                or normalize_name(item.get("name")) == normalize_name(query)
+            ]
+            if matches:
+                found.extend(
+                    {**item, "instrument_id": item.get("id"), "source": "api"} for item in matches
+                )
+            else:
+                missed.append(query)
+
+        self._record_misses(missed)
+        return self.upsert(found)
+
+    def refresh_local(self, force: bool = False) -> int:
+        """
+        로컬에서 추정한 항목만 서버 종목 검색으로 다시 조회합니다.
+
+        Args:
+            force: True면 최근 실패한 조회어도 다시 조회
+        """
+        symbols = [entry["symbol"] for entry in self._by_key.values() if entry["source"] == "local"]
+        if force and symbols:
+            with closing(sqlite3.connect(self.db_path)) as conn:
+                with conn:
+                    conn.executemany("DELETE FROM instrument_misses WHERE query = ?", [(s,) for s in symbols])
+        return self.refresh_from_api(symbols)
+
+    def resolve_positions(self, positions: List[Any], remote_lookup: bool = True, learn: bool = True) -> int:
+        """
+        포지션의 종목을 해석해 ticker/isin/asset_class/instrument_id를 채웁니다.
+
+        같은 (ticker, name, currency) 조합은 한 번만 조회합니다.
+
+        Returns:
+            해석된 포지션 수
+        """
+        if not positions:
+            return 0
+
+        keys = {(p.ticker, p.name, p.currency) for p in positions}
+        resolved = {key: self.resolve(*key[:2], currency=key[2]) for key in keys}
+        misses = [key for key, entry in resolved.items() if entry is None]
+
+        if misses and remote_lookup:
+            queries = [normalize_symbol(ticker) or name for ticker, name, _ in misses]
+            if self.refresh_from_api(queries):
+                for key in misses:
+                    resolved[key] = self.resolve(*key[:2], currency=key[2])
+
+        if learn:
+            # 끝까지 찾지 못한 종목은 추정 자산군으로 로컬 항목을 만들어 다음 실행부터 바로 찾음
+            unresolved = [key for key, entry in resolved.items() if entry is None and normalize_symbol(key[0])]
+            self.upsert(
+                {"symbol": ticker, "name": name or ticker, "currency": currency, "source": "local"}
+                for ticker, name, currency in unresolved
+            )
+            for key in unresolved:
+                resolved[key] = self.resolve(*key[:2], currency=key[2])
+
+        count = 0
+        for position in positions:
+            entry = resolved.get((position.ticker, position.name, position.currency))
+            if entry is None:
+                continue
+            position.ticker = entry["symbol"]
+            position.isin = entry.get("isin")
+            position.asset_class = entry["asset_class"]
+            position.instrument_id = entry.get("instrument_id")
+            count += 1
+        return count
+
+    def _normalize_entry(self, entry: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """입력 항목을 저장 형식으로 정리합니다. symbol/name이 없으면 None입니다."""
+        symbol = normalize_symbol(entry.get("symbol"))
+        name = str(entry.get("name") or "").strip()
+        if not symbol or not name:
+            return None
+
+        isin = normalize_symbol(entry.get("isin")) or None
+        asset_class = str(entry.get("asset_class") or "").strip().lower()
+        if asset_class not in ASSET_CLASSES:
+            asset_class = infer_asset_class(name, symbol)
+
+        instrument_id = entry.get("instrument_id")
+        return {
+            "symbol": symbol,
+            "currency": str(entry.get("currency") or "KRW").strip().upper(),
+            "isin": isin if isin and _ISIN_RE.match(isin) else None,
+            "name": name,
+            "norm_name": normalize_name(name),
+            "asset_class": asset_class,
+            "instrument_id": int(instrument_id) if instrument_id not in (None, "") else None,
+            "source": entry.get("source", "local"),
+        }
+
+    def _recently_missed(self, query: str) -> bool:
+        with closing(sqlite3.connect(self.db_path)) as conn:
+            row = conn.execute("SELECT checked_at FROM instrument_misses WHERE query = ?", (query,)).fetchone()
+        return row is not None and datetime.fromisoformat(row[0]) > datetime.now() - self.miss_ttl
+
+    def _record_misses(self, queries: List[str]) -> None:
+        if not queries:
+            return
+        now = datetime.now().isoformat()
+        with closing(sqlite3.connect(self.db_path)) as conn:
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO instrument_misses (query, checked_at) VALUES (?, ?)",
+                    [(query, now) for query in queries]
+                )
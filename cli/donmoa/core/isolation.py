@@ -0,0 +1,182 @@
+"""
+Provider 격리 실행
+
+Provider의 collect_all을 별도 워커 프로세스에서 실행합니다. 잘못되었거나 매우 큰 입력
+파일로 파싱이 멈추거나 메모리를 과도하게 쓰더라도 전체 실행이 멈추지 않도록,
+시간 한도가 지나면 워커(와 워커가 만든 병렬 파싱 프로세스)를 강제 종료하고
+메모리 한도를 넘으면 워커 안에서 MemoryError로 끝냅니다.
+
+결과는 파이프로 받습니다. 워커는 자신의 프로세스 그룹을 만들어, 시간 초과 시
+그룹 전체에 SIGKILL을 보내 손자 프로세스까지 정리합니다.
+
+워커는 항상 fork 방식으로 시작합니다. 입력 인덱스 상태와 메모리 한도 계산이 부모
+프로세스를 물려받는 것을 전제로 하며, 설정은 워커에 명시적으로 넘겨 적용합니다.
+fork를 지원하지 않는 플랫폼에서는 fork_context()가 None을 반환하므로 호출하는 쪽이
+프로세스 안에서 수집해야 합니다.
+"""
+
+import multiprocessing
+import os
+import signal
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from ..utils.config import config_manager
+from ..utils.logger import get_worker_log_queue, init_worker_logging, logger
+from ..utils.memory import MemoryMonitor, StageMemory
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+_MB = 1024 * 1024
+
+
+@dataclass
+class IsolatedResult:
+    """격리 실행 결과 (status: ok, timeout, memory, error)"""
+    status: str
+    data: Optional[Dict[str, List[Any]]] = None
+    message: str = ""
+    memory: Optional[StageMemory] = None
+    seconds: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.status == "ok"
+
+
+def fork_context() -> Optional[Any]:
+    """fork 시작 방식의 multiprocessing 컨텍스트 (지원하지 않는 플랫폼이면 None)"""
+    if "fork" not in multiprocessing.get_all_start_methods():
+        return None
+    return multiprocessing.get_context("fork")
+
+
+def _address_space_bytes() -> int:
+    """현재 프로세스의 가상 메모리 크기 (측정할 수 없으면 0)"""
+    try:
+        with open("/proc/self/statm", "r") as f:
+            return int(f.read().split()[0]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        return 0
+
+
+def _limit_memory(memory_mb: float) -> None:
+    """
+    워커의 주소 공간을 현재 크기 + memory_mb로 제한합니다.
+
+    fork한 워커는 부모의 주소 공간(라이브러리, 이미 읽은 데이터)을 물려받으므로
+    한도는 워커가 추가로 할당할 수 있는 양으로 계산합니다.
+    """
+    if resource is None or not hasattr(resource, "RLIMIT_AS"):
+        return
+    limit = _address_space_bytes() + int(memory_mb * _MB)
+    _, hard = resource.getrlimit(resource.RLIMIT_AS)
+    if hard != resource.RLIM_INFINITY:
+        limit = min(limit, hard)
+    resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+
+
+def _worker(
+    provider: Any,
+    input_dir: Path,
+    conn: Any,
+    log_queue: Any,
+    level: int,
+    memory_mb: float,
+    config: Dict[str, Any]
+) -> None:
+    """워커 프로세스 진입점 (pickle 가능한 모듈 수준 함수)"""
+    if hasattr(os, "setpgrp"):
+        os.setpgrp()
+    init_worker_logging(log_queue, level)
+    # --config로 바꾼 설정도 워커에서 그대로 쓰도록 명시적으로 적용
+    config_manager.config = config
+
+    try:
+        if memory_mb:
+            _limit_memory(memory_mb)
+
+        monitor = MemoryMonitor()
+        with monitor.stage(f"provider:{provider.name}"):
+            data = provider.collect_all(input_dir)
+        conn.send(("ok", data, "", monitor.stages[-1]))
+    except MemoryError:
+        conn.send(("memory", None, f"메모리 한도 초과 ({memory_mb:,.0f}MB)", None))
+    except Exception as e:
+        conn.send(("error", None, str(e), None))
+    finally:
+        conn.close()
+
+
+def _kill(process: Any) -> None:
+    """워커와 그 프로세스 그룹을 강제 종료합니다."""
+    try:
+        if hasattr(os, "killpg"):
+            os.killpg(process.pid, signal.SIGKILL)
+        else:
+            process.kill()
+    except (ProcessLookupError, PermissionError):
+        process.kill()
+    process.join()
+
+
+def run_isolated(
+    provider: Any,
+    input_dir: Path,
+    timeout: Optional[float] = None,
+    memory_mb: Optional[float] = None
+) -> IsolatedResult:
+    """
+    Provider의 collect_all을 fork한 워커 프로세스에서 실행합니다.
+
+    Args:
+        provider: 실행할 Provider
+        input_dir: 입력 폴더
+        timeout: 시간 한도(초). None 또는 0이면 제한 없음
+        memory_mb: 워커가 추가로 쓸 수 있는 메모리(MB). None 또는 0이면 제한 없음
+
+    Returns:
+        IsolatedResult
+
+    Raises:
+        RuntimeError: fork 시작 방식을 지원하지 않는 플랫폼
+    """
+    context = fork_context()
+    if context is None:
+        raise RuntimeError("Provider 격리 실행에는 fork 시작 방식이 필요합니다")
+
+    receiver, sender = context.Pipe(duplex=False)
+    process = context.Process(
+        target=_worker,
+        args=(
+            provider, input_dir, sender, get_worker_log_queue(), logger.getEffectiveLevel(),
+            memory_mb or 0, config_manager.config,
+        ),
+        name=f"provider-{provider.name}",
+    )
+
+    started = time.perf_counter()
+    process.start()
+    # 부모 쪽 송신 끝을 닫아야 워커가 비정상 종료했을 때 EOF를 받을 수 있음
+    sender.close()
+
+    try:
+        if not receiver.poll(timeout or None):
+            _kill(process)
+            return IsolatedResult("timeout", message=f"시간 초과 ({timeout:g}초)", seconds=time.perf_counter() - started)
+        status, data, message, memory = receiver.recv()
+    except EOFError:
+        process.join()
+        return IsolatedResult(
+            "error", message=f"워커 비정상 종료 (exit code {process.exitcode})", seconds=time.perf_counter() - started
+        )
+    finally:
+        receiver.close()
+
+    process.join()
+    return IsolatedResult(status, data, message, memory, time.perf_counter() - started)
@@ -0,0 +1,329 @@
+"""
+스냅샷 업로드 대기열 (SQLite outbox)
+
+collect가 만든 export 디렉토리를 업로드 대기열에 기록해 두고, drain이 연결될 때
+전송합니다. 각 항목은 (스냅샷 날짜 + CSV 내용) 해시로 만든 멱등성 키를 가지며
+(수집 시각처럼 실행마다 바뀌는 VOLATILE_COLUMNS는 해시에서 제외),
+같은 키는 한 번만 쌓이고 서버에도 `Idempotency-Key` 헤더로 전달되므로 재시도나
+재실행으로 같은 데이터가 중복 업로드되지 않습니다.
+
+같은 날짜의 새 항목이 들어와도 이전 대기 항목의 거래를 모두 포함할 때만 이전 항목을
+대체(superseded)합니다. 거래 중복 제거로 새 export에 이전 export의 거래가 빠져 있으면
+두 항목을 모두 남겨 순서대로 전송합니다.
+
+실패한 항목은 지수 백오프로 다음 시도 시각을 늦추고, 재시도해도 소용없는
+응답(4xx)이나 최대 시도 횟수를 넘긴 항목은 failed로 남깁니다.
+"""
+
+import csv
+import hashlib
+import itertools
+import random
+import sqlite3
+from collections import Counter
+from contextlib import closing
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import requests
+
+from ..utils.logger import logger
+from ..utils.config import config_manager
+from .csv_exporter import VOLATILE_COLUMNS
+from .transaction_index import TransactionIndex
+from .uploader import EXPORT_FILES, SnapshotUploader
+
+
+SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS upload_outbox (
+  idempotency_key TEXT PRIMARY KEY,
+  snapshot_date TEXT NOT NULL,
+  export_dir TEXT NOT NULL,
+  notes TEXT,
+  status TEXT NOT NULL CHECK (status IN ('pending', 'sent', 'failed', 'superseded')),
+  attempts INTEGER NOT NULL DEFAULT 0,
+  next_attempt_at TEXT NOT NULL,
+  last_error TEXT,
+  snapshot_id TEXT,
+  created_at TEXT NOT NULL,
+  updated_at TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_upload_outbox_status ON upload_outbox(status, next_attempt_at);
+"""
+
+# 재시도하면 성공할 수 있는 HTTP 상태 코드
+RETRYABLE_STATUS = {408, 425, 429}
+
+
+class UploadOutbox:
+    """스냅샷 업로드 대기열"""
+
+    def __init__(self, db_path: Optional[Path] = None, uploader: Optional[SnapshotUploader] = None):
+        if db_path is None:
+            db_path = Path(config_manager.get("outbox.db_path", "data/history/outbox.db"))
+
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.uploader = uploader or SnapshotUploader()
+
+        self.batch_size = int(config_manager.get("outbox.batch_size", 10))
+        self.max_attempts = int(config_manager.get("outbox.max_attempts", 8))
+        self.backoff_base = float(config_manager.get("outbox.backoff_base_seconds", 30))
+        self.backoff_max = float(config_manager.get("outbox.backoff_max_seconds", 3600))
+
+        with closing(self._connect()) as conn:
+            conn.executescript(SCHEMA_SQL)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    @staticmethod
+    def idempotency_key(export_path: Path, snapshot_date: str) -> str:
+        """
+        스냅샷 날짜와 업로드할 CSV 내용으로 멱등성 키를 만듭니다.
+
+        VOLATILE_COLUMNS(collected_at)는 실행마다 바뀌므로 빼고 해시해, 같은 데이터를
+        다시 내보내도 같은 키가 나오게 합니다.
+        """
+        digest = hashlib.sha256(snapshot_date.encode("utf-8"))
+        for key in SnapshotUploader.find_files(export_path):
+            filename = EXPORT_FILES[key]
+            digest.update(b"\x00" + filename.encode("utf-8") + b"\x00")
+            with open(Path(export_path) / filename, "r", encoding="utf-8-sig", newline="") as f:
+                reader = csv.reader(f)
+                header = next(reader, [])
+                keep = [i for i, column in enumerate(header) if column not in VOLATILE_COLUMNS]
+                for row in itertools.chain([header], reader):
+                    digest.update("\x1f".join(row[i] if i < len(row) else "" for i in keep).encode("utf-8"))
+                    digest.update(b"\n")
+        return digest.hexdigest()
+
+    def enqueue(self, export_path: Path, snapshot_date: str, notes: Optional[str] = None) -> Optional[str]:
+        """
+        export 디렉토리를 업로드 대기열에 추가합니다.
+
+        같은 내용이 이미 대기 중이거나 전송되었으면 새로 추가하지 않습니다.
+        같은 날짜의 이전 대기 항목은 그 거래가 모두 새 항목에 들어 있을 때만
+        대체(superseded)되고, 아니면 함께 남아 오래된 순서대로 전송됩니다.
+
+        Returns:
+            멱등성 키 (업로드할 CSV가 없으면 None)
+        """
+        export_path = Path(export_path)
+        if not SnapshotUploader.find_files(export_path):
+            logger.warning(f"업로드할 CSV가 없어 대기열에 추가하지 않습니다: {export_path}")
+            return None
+
+        key = self.idempotency_key(export_path, snapshot_date)
+        now = datetime.now().isoformat()
+
+        with closing(self._connect()) as conn:
+            with conn:
+                cursor = conn.execute(
+                    "INSERT OR IGNORE INTO upload_outbox "
+                    "(idempotency_key, snapshot_date, export_dir, notes, status, next_attempt_at, created_at, updated_at) "
+                    "VALUES (?, ?, ?, ?, 'pending', ?, ?, ?)",
+                    (key, snapshot_date, str(export_path), notes, now, now, now)
+                )
+                if cursor.rowcount == 0:
+                    logger.info(f"이미 대기열에 있는 스냅샷입니다: {snapshot_date} ({key[:12]})")
+                    return key
+
+                previous = conn.execute(
+                    "SELECT idempotency_key, export_dir FROM upload_outbox "
+                    "WHERE snapshot_date = ? AND status = 'pending' AND idempotency_key != ?",
+                    (snapshot_date, key)
+                ).fetchall()
+                superseded = [row["idempotency_key"] for row in previous
+                              if self._contains_transactions(export_path, Path(row["export_dir"]))]
+                conn.executemany(
+                    "UPDATE upload_outbox SET status = 'superseded', updated_at = ? WHERE idempotency_key = ?",
+                    [(now, previous_key) for previous_key in superseded]
+                )
+
+        logger.info(f"📮 업로드 대기열 추가: {snapshot_date} ({key[:12]})")
+        if len(superseded) < len(previous):
+            logger.info(
+                f"같은 날짜의 대기 항목 {len(previous) - len(superseded)}건은 새 항목에 없는 거래가 있어 함께 전송합니다"
+            )
+        return key
+
+    @staticmethod
+    def transaction_fingerprints(export_path: Path) -> Optional[Counter]:
+        """export 디렉토리 transactions.csv의 거래 지문별 건수 (읽을 수 없으면 None)"""
+        transactions_path = Path(export_path) / EXPORT_FILES["transactions_file"]
+        if not transactions_path.exists():
+            return Counter()
+        try:
+            with open(transactions_path, "r", encoding="utf-8-sig", newline="") as f:
+                return Counter(TransactionIndex.fingerprint(row) for row in csv.DictReader(f))
+        except (OSError, csv.Error, UnicodeDecodeError) as e:
+            logger.warning(f"거래 지문 읽기 실패 ({transactions_path}): {e}")
+            return None
+
+    def _contains_transactions(self, new_path: Path, old_path: Path) -> bool:
+        """새 export가 이전 export의 거래를 모두(건수 포함) 포함하는지 여부"""
+        old = self.transaction_fingerprints(old_path)
+        new = self.transaction_fingerprints(new_path)
+        if old is None or new is None:
+            return False
+        return not old - new
+
+    def pending(self, due_only: bool = False, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """대기 중인 항목을 오래된 순으로 반환합니다."""
+        query = "SELECT * FROM upload_outbox WHERE status = 'pending'"
+        params: List[Any] = []
+        if due_only:
+            query += " AND next_attempt_at <= ?"
+            params.append(datetime.now().isoformat())
+        query += " ORDER BY created_at"
+        if limit:
+            query += " LIMIT ?"
+            params.append(limit)
+
+        with closing(self._connect()) as conn:
+            return [dict(row) for row in conn.execute(query, params).fetchall()]
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """멱등성 키로 항목을 조회합니다."""
+        with closing(self._connect()) as conn:
+            row = conn.execute("SELECT * FROM upload_outbox WHERE idempotency_key = ?", (key,)).fetchone()
+        return dict(row) if row else None
+
+    def counts(self) -> Dict[str, int]:
+        """상태별 항목 수를 반환합니다."""
+        with closing(self._connect()) as conn:
+            rows = conn.execute("SELECT status, COUNT(*) FROM upload_outbox GROUP BY status").fetchall()
+        return {status: count for status, count in rows}
+
+    def next_attempt_at(self) -> Optional[str]:
+        """가장 빠른 다음 시도 시각을 반환합니다."""
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT MIN(next_attempt_at) FROM upload_outbox WHERE status = 'pending'"
+            ).fetchone()
+        return row[0]
+
+    def drain(self, force: bool = False, limit: Optional[int] = None) -> Dict[str, int]:
+        """
+        시도 시각이 된 대기 항목을 한 배치 전송합니다.
+
+        연결 오류가 나면 오프라인으로 보고 남은 항목은 이번 배치에서 건너뜁니다.
+
+        Args:
+            force: True면 백오프 시각을 무시하고 모든 대기 항목을 시도
+            limit: 배치 크기 (기본값 outbox.batch_size)
+
+        Returns:
+            {"sent", "retry", "failed", "skipped"} 건수
+        """
+        result = {"sent": 0, "retry": 0, "failed": 0, "skipped": 0}
+        if not self.uploader.is_configured():
+            logger.warning("API 설정이 없어 업로드 대기열을 전송하지 않습니다")
+            return result
+
+        items = self.pending(due_only=not force, limit=limit or self.batch_size)
+        for i, item in enumerate(items):
+            outcome = self.send(item)
+            if outcome == "offline":
+                result["retry"] += 1
+                result["skipped"] += len(items) - i - 1
+                break
+            result[outcome] += 1
+
+        return result
+
+    def send(self, item: Dict[str, Any]) -> str:
+        """
+        항목 하나를 전송하고 상태를 갱신합니다.
+
+        Returns:
+            "sent", "retry", "offline"(연결 실패로 재시도 예약), "failed" 중 하나
+        """
+        key = item["idempotency_key"]
+        export_path = Path(item["export_dir"])
+
+        if not SnapshotUploader.find_files(export_path):
+            self._mark_failed(item, f"export 디렉토리에 CSV가 없습니다: {export_path}")
+            return "failed"
+
+        try:
+            response = self.uploader.post(
+                export_path,
+                item["snapshot_date"],
+                item["notes"],
+                extra_headers={"Idempotency-Key": key}
+            )
+        except ValueError as e:
+            # 업로드 전 검증에서 거부됨 - 재시도해도 같은 결과
+            self._mark_failed(item, f"업로드 전 검증 실패: {e}")
+            return "failed"
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+            outcome = self._schedule_retry(item, f"연결 실패: {e}")
+            return "offline" if outcome == "retry" else outcome
+        except requests.exceptions.RequestException as e:
+            return self._schedule_retry(item, str(e))
+
+        if SnapshotUploader.is_success(response):
+            snapshot_id = SnapshotUploader.snapshot_id(response)
+            self._update(key, status="sent", attempts=item["attempts"] + 1,
+                         snapshot_id=None if snapshot_id is None else str(snapshot_id), last_error=None)
+            logger.info(f"✅ 대기열 업로드 완료: {item['snapshot_date']} (ID: {snapshot_id})")
+            return "sent"
+
+        error = f"HTTP {response.status_code}: {response.text[:200]}"
+        if response.status_code >= 500 or response.status_code in RETRYABLE_STATUS:
+            return self._schedule_retry(item, error)
+
+        self._mark_failed(item, error)
+        return "failed"
+
+    def retry_failed(self) -> int:
+        """failed 항목을 다시 대기 상태로 돌립니다."""
+        now = datetime.now().isoformat()
+        with closing(self._connect()) as conn:
+            with conn:
+                cursor = conn.execute(
+                    "UPDATE upload_outbox SET status = 'pending', attempts = 0, next_attempt_at = ?, updated_at = ? "
+                    "WHERE status = 'failed'",
+                    (now, now)
+                )
+        return cursor.rowcount
+
+    def backoff_seconds(self, attempts: int) -> float:
+        """시도 횟수에 따른 대기 시간 (지수 백오프 + 최대 10% 지터)"""
+        delay = min(self.backoff_base * (2 ** max(attempts - 1, 0)), self.backoff_max)
+        return delay * (1 + random.random() * 0.1)
+
+    def _schedule_retry(self, item: Dict[str, Any], error: str) -> str:
+        attempts = item["attempts"] + 1
+        if attempts >= self.max_attempts:
+            self._mark_failed(item, error)
+            return "failed"
+
+        next_at = datetime.now() + timedelta(seconds=self.backoff_seconds(attempts))
+        self._update(item["idempotency_key"], attempts=attempts,
+                     next_attempt_at=next_at.isoformat(), last_error=error)
+        logger.warning(
+            f"⏳ 업로드 재시도 예정 ({item['snapshot_date']}, {attempts}회 실패): "
+            f"{next_at.strftime('%H:%M:%S')} - {error}"
+        )
+        return "retry"
+
+    def _mark_failed(self, item: Dict[str, Any], error: str) -> None:
+        self._update(item["idempotency_key"], status="failed", attempts=item["attempts"] + 1, last_error=error)
+        logger.error(f"❌ 업로드 실패 ({item['snapshot_date']}): {error}")
+
+    def _update(self, key: str, **values: Any) -> None:
+        values["updated_at"] = datetime.now().isoformat()
+        assignments = ", ".join(f"{column} = ?" for column in values)
+        with closing(self._connect()) as conn:
+            with conn:
+                conn.execute(
+                    f"UPDATE upload_outbox SET {assignments} WHERE idempotency_key = ?",
+                    (*values.values(), key)
+                )
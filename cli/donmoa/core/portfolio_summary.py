@@ -0,0 +1,141 @@
+"""
+포트폴리오 요약 집계
+
+수집 데이터에서 계좌/분류/통화/자산군별 현금·포지션 합계를 계산합니다.
+서버의 get_portfolio_summary(migration 004)와 같은 정보를 업로드 없이 로컬에서 바로
+확인하기 위한 것으로, 금액은 통화별 최소 단위 정수(amount_minor)로 합산해
+통화가 섞이지 않도록 항상 (그룹, 통화) 단위로 집계합니다.
+"""
+
+from typing import Any, Dict, List
+
+import numpy as np
+import pandas as pd
+
+from ..utils.money import currency_scale, to_minor_array
+
+# 요약 그룹 → 집계 키 컬럼
+SUMMARY_GROUPS = {
+    "total": "total",
+    "account": "account",
+    "category": "category",
+    "currency": "currency",
+    "asset_class": "asset_class",
+}
+
+SUMMARY_COLUMNS = [
+    "group", "key", "currency", "cash_minor", "positions_minor", "total_minor",
+    "cash", "positions", "total", "rows",
+]
+
+TOTAL_KEY = "전체"
+
+# 분류/자산군이 없는 행의 키
+UNKNOWN_KEY = "(미분류)"
+
+
+def build_summary(data: Dict[str, List[Dict[str, Any]]]) -> pd.DataFrame:
+    """
+    수집 데이터를 그룹별로 집계합니다.
+
+    현금은 amount_minor를 그대로 합산하고, 포지션 평가액은 수량 × 평균단가를
+    통화별 최소 단위로 변환해 합산합니다. 분류(category)는 현금에만 있으므로
+    category 그룹은 현금 합계이고, 자산군(asset_class)에서 현금은 "cash"입니다.
+
+    Args:
+        data: 수집 데이터 (cash/positions 레코드 목록)
+
+    Returns:
+        SUMMARY_COLUMNS 형식의 DataFrame (그룹 안에서는 통화별 합계가 큰 순서)
+    """
+    frame = _value_frame(data)
+    if frame.empty:
+        return pd.DataFrame(columns=SUMMARY_COLUMNS)
+
+    parts = []
+    for group, column in SUMMARY_GROUPS.items():
+        rows = frame if group != "category" else frame[frame["kind"] == "cash"]
+        if rows.empty:
+            continue
+        keys = [column, "currency"] if column != "currency" else ["currency"]
+        grouped = rows.groupby(keys, sort=False).agg(
+            cash_minor=("cash_minor", "sum"),
+            positions_minor=("positions_minor", "sum"),
+            rows=("kind", "size"),
+        ).reset_index()
+        grouped.insert(0, "key", grouped[column])
+        grouped.insert(0, "group", group)
+        parts.append(grouped)
+
+    summary = pd.concat(parts, ignore_index=True)[["group", "key", "currency", "cash_minor", "positions_minor", "rows"]]
+    summary["total_minor"] = summary["cash_minor"] + summary["positions_minor"]
+
+    scales = summary["currency"].map(currency_scale).to_numpy(np.float64)
+    for column in ("cash", "positions", "total"):
+        summary[column] = summary[f"{column}_minor"].to_numpy(np.float64) / scales
+
+    # 그룹 순서는 SUMMARY_GROUPS, 그룹 안에서는 통화별 합계가 큰 순서
+    summary["order"] = summary["group"].map({group: i for i, group in enumerate(SUMMARY_GROUPS)})
+    summary = summary.sort_values(["order", "currency", "total_minor"], ascending=[True, True, False], kind="stable")
+    return summary[SUMMARY_COLUMNS].reset_index(drop=True)
+
+
+def _value_frame(data: Dict[str, List[Dict[str, Any]]]) -> pd.DataFrame:
+    """현금/포지션 레코드를 (계좌, 분류, 자산군, 통화, 금액) 한 표로 합칩니다."""
+    frames = []
+
+    cash = pd.DataFrame(data.get("cash") or [])
+    if not cash.empty:
+        currency = _currency(cash)
+        amount = cash["amount_minor"] if "amount_minor" in cash.columns else pd.Series(np.nan, index=cash.index)
+        # amount_minor가 없는 행만 balance에서 다시 계산
+        fallback = to_minor_array(pd.to_numeric(cash.get("balance"), errors="coerce"), currency)
+        cash_minor = pd.to_numeric(amount, errors="coerce").fillna(pd.Series(fallback, index=cash.index))
+        frames.append(pd.DataFrame({
+            "kind": "cash",
+            "account": cash["account"],
+            "category": _text(cash, "category"),
+            "asset_class": "cash",
+            "currency": currency,
+            "cash_minor": cash_minor.to_numpy(np.int64),
+            "positions_minor": np.zeros(len(cash), dtype=np.int64),
+        }))
+
+    positions = pd.DataFrame(data.get("positions") or [])
+    if not positions.empty:
+        currency = _currency(positions)
+        value = (
+            pd.to_numeric(positions["quantity"], errors="coerce")
+            * pd.to_numeric(positions["average_price"], errors="coerce")
+        )
+        frames.append(pd.DataFrame({
+            "kind": "positions",
+            "account": positions["account"],
+            "category": UNKNOWN_KEY,
+            "asset_class": _text(positions, "asset_class"),
+            "currency": currency,
+            "cash_minor": np.zeros(len(positions), dtype=np.int64),
+            "positions_minor": to_minor_array(value, currency),
+        }))
+
+    if not frames:
+        return pd.DataFrame()
+
+    frame = pd.concat(frames, ignore_index=True)
+    frame["total"] = TOTAL_KEY
+    frame["account"] = frame["account"].fillna(UNKNOWN_KEY).astype(str)
+    return frame
+
+
+def _currency(df: pd.DataFrame) -> pd.Series:
+    """통화 컬럼 (없거나 비어 있으면 KRW)"""
+    if "currency" not in df.columns:
+        return pd.Series("KRW", index=df.index)
+    return df["currency"].fillna("").astype(str).str.upper().replace("", "KRW")
+
+
+def _text(df: pd.DataFrame, column: str) -> pd.Series:
+    """문자열 컬럼 (없거나 비어 있으면 UNKNOWN_KEY)"""
+    if column not in df.columns:
+        return pd.Series(UNKNOWN_KEY, index=df.index)
+    return df[column].fillna("").astype(str).replace("", UNKNOWN_KEY)
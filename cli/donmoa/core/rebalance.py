@@ -0,0 +1,359 @@
+"""
+로컬 리밸런싱 계산기
+
+서버 리밸런싱 모델(migration 005의 rebalance_targets, rebalance_rules)과 같은 구조의
+설정(rebalance.targets, rebalance.rules)으로 최근 export의 현금/포지션에서 자산군별
+현재 비중과 목표 비중을 비교하고, 밴드 규칙을 벗어난 버킷의 거래를 제안합니다.
+
+버킷은 계좌별 목표가 있는 계좌 하나씩과, 나머지 계좌를 합친 전체(global) 버킷입니다.
+모든 계산은 (시나리오, 버킷, 자산군) 배열 연산이므로 자산군 수익률 충격을 준
+what-if 시나리오 수천 개를 한 번에 평가할 수 있습니다.
+"""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from ..utils.logger import logger
+from ..utils.config import config_manager
+from .fx_rates import FxRateStore, normalize_currency
+from .instrument_cache import infer_asset_class
+
+# 전체(global) 버킷 이름
+GLOBAL_SCOPE = "전체"
+
+# 밴드 규칙 기본 허용 오차 (비중 차이, 0.05 = 5%p)
+DEFAULT_THRESHOLD = 0.05
+
+
+@dataclass
+class Holdings:
+    """계좌 × 자산군 평가액 (기준 통화)"""
+    accounts: List[str]
+    asset_classes: List[str]
+    # (계좌 수, 자산군 수)
+    values: np.ndarray
+    base_currency: str
+    as_of: Optional[str] = None
+
+
+@dataclass
+class BandResult:
+    """밴드 규칙 평가 결과 (앞 차원은 시나리오)"""
+    # (..., 버킷, 자산군)
+    values: np.ndarray
+    weights: np.ndarray
+    trades: np.ndarray
+    # (..., 버킷)
+    breached: np.ndarray
+
+    @property
+    def turnover(self) -> np.ndarray:
+        """시나리오별 거래 규모 (매수 + 매도의 절반)"""
+        return np.abs(self.trades).sum(axis=(-2, -1)) / 2
+
+
+@dataclass
+class RebalancePlan:
+    """목표 비중 행렬과 계좌 → 버킷 대응"""
+    buckets: List[str]
+    # (버킷 수, 자산군 수)
+    targets: np.ndarray
+    # (계좌 수, 버킷 수) 0/1 행렬, 버킷이 없는 계좌는 모두 0
+    membership: np.ndarray
+    threshold: float = DEFAULT_THRESHOLD
+    unassigned: List[str] = field(default_factory=list)
+
+
+def band_trades(values: np.ndarray, targets: np.ndarray, threshold: float, min_trade: float = 0.0) -> BandResult:
+    """
+    밴드 규칙으로 거래를 계산합니다.
+
+    버킷의 어느 자산군이라도 |현재 비중 - 목표 비중| > threshold이면 그 버킷 전체를
+    목표 비중으로 되돌리는 거래를 제안합니다. min_trade보다 작은 거래는 제외합니다.
+
+    Args:
+        values: (..., 버킷, 자산군) 평가액
+        targets: (버킷, 자산군) 목표 비중
+        threshold: 허용 오차
+        min_trade: 최소 거래 금액
+
+    Returns:
+        BandResult
+    """
+    totals = values.sum(axis=-1, keepdims=True)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        weights = np.where(totals > 0, values / totals, 0.0)
+
+    breached = (np.abs(weights - targets) > threshold + 1e-12).any(axis=-1) & (totals[..., 0] > 0)
+    trades = np.where(breached[..., None], targets * totals - values, 0.0)
+    if min_trade > 0:
+        trades = np.where(np.abs(trades) >= min_trade, trades, 0.0)
+    return BandResult(values=values, weights=weights, trades=trades, breached=breached)
+
+
+def random_shocks(
+    asset_classes: List[str],
+    count: int,
+    volatility: float,
+    seed: Optional[int] = None,
+    fixed: Optional[Dict[str, float]] = None
+) -> np.ndarray:
+    """
+    자산군별 수익률 시나리오를 만듭니다. 현금은 항상 0입니다.
+
+    Args:
+        asset_classes: 자산군 목록
+        count: 시나리오 수 (0이면 fixed만 적용한 시나리오 1개)
+        volatility: 수익률 표준편차
+        seed: 난수 시드
+        fixed: 모든 시나리오에 더할 자산군별 수익률 (예: {"equity": -0.2})
+
+    Returns:
+        (시나리오 수, 자산군 수) 수익률 배열
+    """
+    shape = (max(count, 1), len(asset_classes))
+    shocks = np.zeros(shape)
+    if count > 0 and volatility > 0:
+        shocks = np.random.default_rng(seed).normal(0.0, volatility, size=shape)
+
+    for name, value in (fixed or {}).items():
+        if name in asset_classes:
+            shocks[:, asset_classes.index(name)] += value
+    if "cash" in asset_classes:
+        shocks[:, asset_classes.index("cash")] = 0.0
+    # 평가액이 음수가 되지 않도록 -100%에서 자름
+    return np.maximum(shocks, -1.0)
+
+
+class RebalanceEngine:
+    """리밸런싱 계산기"""
+
+    def __init__(
+        self,
+        targets: Optional[Dict[str, Any]] = None,
+        rules: Optional[List[Dict[str, Any]]] = None,
+        fx: Optional[FxRateStore] = None
+    ):
+        self.targets = targets if targets is not None else (config_manager.get("rebalance.targets", {}) or {})
+        self.rules = rules if rules is not None else (config_manager.get("rebalance.rules", []) or [])
+        self.min_trade = float(config_manager.get("rebalance.min_trade_amount", 0) or 0)
+        self.fx = fx
+        self.threshold = self._band_threshold()
+
+    def _band_threshold(self) -> float:
+        """활성화된 첫 번째 band 규칙의 threshold. 다른 타입은 로컬에서 지원하지 않습니다."""
+        threshold = None
+        for rule in self.rules:
+            if not rule.get("enabled", True):
+                continue
+            rule_type = rule.get("type")
+            if rule_type == "band" and threshold is None:
+                threshold = float((rule.get("params") or {}).get("threshold", DEFAULT_THRESHOLD))
+            elif rule_type != "band":
+                logger.warning(f"⚠️ 리밸런싱 규칙 '{rule.get('name', rule_type)}'({rule_type})은 서버에서만 지원합니다")
+        return DEFAULT_THRESHOLD if threshold is None else threshold
+
+    def load_holdings(self, export_path: Path, base_currency: Optional[str] = None) -> Holdings:
+        """
+        export 디렉토리의 cash.csv, positions.csv를 계좌 × 자산군 평가액으로 집계합니다.
+
+        포지션 평가액은 수량 × 평균단가이고, 통화가 다른 행은 스냅샷 날짜의 as-of
+        환율로 기준 통화로 환산합니다. 환율이 없는 행은 제외합니다.
+        """
+        if self.fx is None:
+            self.fx = FxRateStore()
+        base = normalize_currency(base_currency or self.fx.base_currency)
+
+        frames = []
+        cash_path = export_path / "cash.csv"
+        if cash_path.exists():
+            cash = pd.read_csv(cash_path, dtype={"account": str, "currency": str, "date": str})
+            frames.append(pd.DataFrame({
+                "date": cash["date"],
+                "account": cash["account"],
+                "asset_class": "cash",
+                "currency": cash.get("currency"),
+                "value": pd.to_numeric(cash["balance"], errors="coerce"),
+            }))
+
+        positions_path = export_path / "positions.csv"
+        if positions_path.exists():
+            positions = pd.read_csv(positions_path, dtype=str, keep_default_na=False)
+            asset_class = positions["asset_class"] if "asset_class" in positions.columns else pd.Series("", index=positions.index)
+            inferred = [
+                value or infer_asset_class(name, ticker)
+                for value, name, ticker in zip(asset_class, positions["name"], positions["ticker"])
+            ]
+            frames.append(pd.DataFrame({
+                "date": positions["date"],
+                "account": positions["account"],
+                "asset_class": inferred,
+                "currency": positions.get("currency"),
+                "value": (
+                    pd.to_numeric(positions["quantity"], errors="coerce")
+                    * pd.to_numeric(positions["average_price"], errors="coerce")
+                ),
+            }))
+
+        if not frames:
+            raise ValueError(f"export 디렉토리에 cash.csv/positions.csv가 없습니다: {export_path}")
+
+        rows = pd.concat(frames, ignore_index=True)
+        rows["value"] = rows["value"].fillna(0.0)
+        rows["currency"] = rows["currency"].fillna("KRW").replace("", "KRW")
+        dates = pd.to_datetime(rows["date"].astype(str).str.slice(0, 10), format="%Y-%m-%d", errors="coerce")
+        as_of = dates.max()
+        days = dates.fillna(as_of).values.astype("datetime64[D]").astype(np.int64)
+        as_of_day = np.array([days.max()])
+
+        currency_codes, currency_labels = pd.factorize(rows["currency"])
+        rates = self.fx.rates_asof(currency_codes, list(currency_labels), days, base)
+        missing = np.isnan(rates)
+        if missing.any():
+            names = ", ".join(sorted(set(rows.loc[missing, "currency"])))
+            logger.warning(f"⚠️ 환율이 없어 리밸런싱 계산에서 제외된 행: {int(missing.sum())}건 ({names})")
+
+        # 최소 거래 금액(fx.base_currency 기준)을 평가 통화로 환산
+        if self.min_trade and base != self.fx.base_currency:
+            rate = self.fx.rates_asof(np.zeros(1, dtype=np.int64), [self.fx.base_currency], as_of_day, base)[0]
+            self.min_trade = 0.0 if np.isnan(rate) else self.min_trade * rate
+
+        account_codes, accounts = pd.factorize(rows["account"].astype(str))
+        class_codes, asset_classes = pd.factorize(rows["asset_class"].astype(str))
+        values = rows["value"].to_numpy(np.float64) * np.where(missing, 0.0, rates)
+
+        matrix = np.bincount(
+            account_codes * len(asset_classes) + class_codes,
+            weights=values,
+            minlength=len(accounts) * len(asset_classes)
+        ).reshape(len(accounts), len(asset_classes))
+
+        return Holdings(
+            accounts=list(accounts),
+            asset_classes=list(asset_classes),
+            values=matrix,
+            base_currency=base,
+            as_of=None if pd.isna(as_of) else as_of.strftime("%Y-%m-%d"),
+        )
+
+    def plan(self, holdings: Holdings) -> Tuple[RebalancePlan, Holdings]:
+        """
+        설정의 목표 비중을 버킷 × 자산군 행렬로 만듭니다.
+
+        목표에만 있는 자산군은 평가액 0인 열로 추가된 Holdings를 함께 반환합니다.
+        """
+        account_targets: Dict[str, Dict[str, float]] = dict(self.targets.get("accounts") or {})
+        global_targets: Dict[str, float] = dict(self.targets.get("global") or {})
+
+        asset_classes = list(holdings.asset_classes)
+        for weights in [global_targets, *account_targets.values()]:
+            for name in weights:
+                if name not in asset_classes:
+                    asset_classes.append(name)
+        values = np.zeros((len(holdings.accounts), len(asset_classes)))
+        values[:, :len(holdings.asset_classes)] = holdings.values
+        holdings = Holdings(holdings.accounts, asset_classes, values, holdings.base_currency, holdings.as_of)
+
+        buckets = [name for name in account_targets if name in holdings.accounts]
+        for name in account_targets:
+            if name not in holdings.accounts:
+                logger.warning(f"⚠️ 리밸런싱 목표의 계좌가 export에 없습니다: {name}")
+
+        bucket_targets = [account_targets[name] for name in buckets]
+        if global_targets:
+            buckets.append(GLOBAL_SCOPE)
+            bucket_targets.append(global_targets)
+
+        targets = np.zeros((len(buckets), len(asset_classes)))
+        for b, weights in enumerate(bucket_targets):
+            for name, pct in weights.items():
+                targets[b, asset_classes.index(name)] = float(pct)
+            total = targets[b].sum()
+            if total <= 0:
+                raise ValueError(f"리밸런싱 목표 비중 합계가 0입니다: {buckets[b]}")
+            if abs(total - 1.0) > 1e-6:
+                logger.warning(f"⚠️ {buckets[b]} 목표 비중 합계가 {total:.4f}이므로 1로 정규화합니다")
+                targets[b] /= total
+
+        membership = np.zeros((len(holdings.accounts), len(buckets)))
+        unassigned = []
+        for a, account in enumerate(holdings.accounts):
+            if account in account_targets:
+                membership[a, buckets.index(account)] = 1.0
+            elif global_targets:
+                membership[a, buckets.index(GLOBAL_SCOPE)] = 1.0
+            else:
+                unassigned.append(account)
+
+        plan = RebalancePlan(buckets, targets, membership, self.threshold, unassigned)
+        return plan, holdings
+
+    def evaluate(self, plan: RebalancePlan, account_values: np.ndarray) -> BandResult:
+        """(..., 계좌, 자산군) 평가액을 버킷으로 합쳐 밴드 규칙을 평가합니다."""
+        bucket_values = plan.membership.T @ account_values
+        return band_trades(bucket_values, plan.targets, plan.threshold, self.min_trade)
+
+    def propose(self, holdings: Holdings) -> Tuple[pd.DataFrame, RebalancePlan]:
+        """
+        현재 평가액으로 버킷 × 자산군별 비중과 제안 거래를 계산합니다.
+
+        Returns:
+            (scope, asset_class, value, weight, target, drift, trade, breached 표, 계획)
+        """
+        plan, holdings = self.plan(holdings)
+        if plan.unassigned:
+            logger.warning(f"⚠️ 목표 비중이 없어 제외된 계좌: {', '.join(plan.unassigned)}")
+        if not plan.buckets:
+            raise ValueError("리밸런싱 목표가 없습니다 (rebalance.targets 설정 필요)")
+
+        result = self.evaluate(plan, holdings.values)
+        buckets, classes = np.meshgrid(np.arange(len(plan.buckets)), np.arange(len(holdings.asset_classes)), indexing="ij")
+        frame = pd.DataFrame({
+            "scope": np.array(plan.buckets, dtype=object)[buckets.ravel()],
+            "asset_class": np.array(holdings.asset_classes, dtype=object)[classes.ravel()],
+            "value": result.values.ravel(),
+            "weight": result.weights.ravel(),
+            "target": plan.targets.ravel(),
+            "drift": (result.weights - plan.targets).ravel(),
+            "trade": result.trades.ravel(),
+            "breached": np.repeat(result.breached, len(holdings.asset_classes)),
+        })
+        # 보유도 목표도 없는 자산군 행은 표시하지 않음
+        frame = frame[(frame["value"] != 0) | (frame["target"] != 0)]
+        return frame.reset_index(drop=True), plan
+
+    def simulate(self, holdings: Holdings, shocks: np.ndarray) -> Dict[str, Any]:
+        """
+        자산군별 수익률 시나리오를 한 번에 평가합니다.
+
+        Args:
+            holdings: 현재 평가액
+            shocks: (시나리오 수, 자산군 수) 수익률 (holdings.asset_classes 순서)
+
+        Returns:
+            시나리오 수, 버킷별 리밸런싱 발생 확률, 거래 규모 통계
+        """
+        plan, planned = self.plan(holdings)
+        if not plan.buckets:
+            raise ValueError("리밸런싱 목표가 없습니다 (rebalance.targets 설정 필요)")
+
+        # 목표에만 있는 자산군(평가액 0)의 수익률은 결과에 영향이 없으므로 0으로 채움
+        padded = np.zeros((shocks.shape[0], len(planned.asset_classes)))
+        padded[:, :shocks.shape[1]] = shocks
+
+        scenario_values = planned.values[None, :, :] * (1.0 + padded[:, None, :])
+        result = self.evaluate(plan, scenario_values)
+        turnover = result.turnover
+
+        return {
+            "scenarios": int(shocks.shape[0]),
+            "trigger_rate": dict(zip(plan.buckets, result.breached.mean(axis=0).tolist())),
+            "any_trigger_rate": float(result.breached.any(axis=-1).mean()),
+            "turnover_mean": float(turnover.mean()),
+            "turnover_p95": float(np.percentile(turnover, 95)),
+            "turnover_max": float(turnover.max()),
+        }
@@ -0,0 +1,177 @@
+"""
+Provider 간 중복 조정
+
+같은 계좌가 여러 Provider에 나타나면(예: 증권 예수금이 도미노와 뱅크샐러드 재무현황에
+모두 있거나, 수동 입력 포지션이 스크래핑 결과와 겹침) 단순 합치기로는 합계가 두 번
+더해집니다. 현금은 (account, currency), 포지션은 (account, ticker)로 해시 인덱스를
+만들고 키마다 우선순위가 가장 높은 Provider의 행만 남깁니다.
+
+한 Provider가 여러 파일을 읽는 경우(manual*.xlsx 여러 개 등)에도 같은 계좌가 두 파일에
+있으면 두 번 더해지므로, 출처는 (Provider, 원본 파일) 단위로 봅니다. 같은 Provider 안에서는
+먼저 읽은 파일(이름순)이 우선합니다.
+
+한 번의 선형 순회로 처리합니다. 키의 현재 출처보다 우선순위가 높은 출처가 나오면
+기존 행을 버리고 교체하며, 같은 출처의 행은 함께 유지합니다.
+거래는 중복 제거 인덱스(TransactionIndex)가 처리하므로 여기서 다루지 않습니다.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+from .instrument_cache import normalize_name, normalize_symbol
+from .transaction_index import fingerprint_field
+
+# 조정 대상 데이터 타입
+RECONCILE_TYPES = ["cash", "positions"]
+
+
+# 레코드의 출처: (Provider, 원본 파일)
+Source = Tuple[str, Optional[str]]
+
+
+def record_source(record: Any) -> Source:
+    """레코드의 출처 (Provider, 원본 파일)"""
+    return fingerprint_field(record, "provider") or "", fingerprint_field(record, "source_file")
+
+
+@dataclass
+class ReconcileReport:
+    """조정 결과: 데이터 타입별로 버린 행과 그 행을 대신한 출처"""
+    dropped: Dict[str, List[Any]] = field(default_factory=dict)
+    kept_by: Dict[str, List[Source]] = field(default_factory=dict)
+
+    @property
+    def total(self) -> int:
+        return sum(len(records) for records in self.dropped.values())
+
+    @property
+    def counts(self) -> Dict[str, Dict[str, int]]:
+        """타입별 → 버린 Provider별 건수"""
+        counts: Dict[str, Dict[str, int]] = {}
+        for data_type, records in self.dropped.items():
+            for record in records:
+                provider = fingerprint_field(record, "provider") or "(알 수 없음)"
+                by_provider = counts.setdefault(data_type, {})
+                by_provider[provider] = by_provider.get(provider, 0) + 1
+        return counts
+
+    @property
+    def file_conflicts(self) -> Dict[str, List[Tuple[Optional[str], Optional[str]]]]:
+        """같은 Provider의 다른 파일끼리 겹친 경우: Provider → (버린 파일, 남긴 파일) 목록"""
+        conflicts: Dict[str, List[Tuple[Optional[str], Optional[str]]]] = {}
+        for data_type, records in self.dropped.items():
+            for record, (provider, kept_file) in zip(records, self.kept_by[data_type]):
+                dropped_provider, dropped_file = record_source(record)
+                pair = (dropped_file, kept_file)
+                if dropped_provider == provider and pair not in conflicts.get(provider, []):
+                    conflicts.setdefault(provider, []).append(pair)
+        return conflicts
+
+
+def cash_key(record: Any) -> Hashable:
+    """현금 조정 키: (계좌, 통화)"""
+    return (
+        str(fingerprint_field(record, "account") or "").strip(),
+        str(fingerprint_field(record, "currency") or "KRW").strip().upper(),
+    )
+
+
+def position_key(record: Any) -> Hashable:
+    """포지션 조정 키: (계좌, 정규화 티커), 티커가 없으면 정규화 종목명"""
+    symbol = normalize_symbol(fingerprint_field(record, "ticker"))
+    return (
+        str(fingerprint_field(record, "account") or "").strip(),
+        symbol or "name:" + normalize_name(fingerprint_field(record, "name")),
+    )
+
+
+KEY_FUNCTIONS: Dict[str, Callable[[Any], Hashable]] = {
+    "cash": cash_key,
+    "positions": position_key,
+}
+
+
+def reconcile_records(
+    records: List[Any],
+    key_func: Callable[[Any], Hashable],
+    ranks: Dict[str, int]
+) -> Tuple[List[Any], List[Any], List[Source]]:
+    """
+    키별로 우선순위가 가장 높은 출처(Provider, 원본 파일)의 행만 남깁니다.
+
+    Args:
+        records: 스키마 객체 또는 딕셔너리 목록 (수집 순서)
+        key_func: 레코드 → 조정 키
+        ranks: Provider → 우선순위 (작을수록 우선). 없는 Provider는 처음 나온 순서대로 뒤에 추가됨.
+            같은 Provider 안에서는 먼저 나온 파일이 우선
+
+    Returns:
+        (남긴 행 목록, 버린 행 목록, 버린 행별 대신 남은 출처 목록)
+    """
+    # 키 → [순위, 출처, 행 위치 목록]
+    winners: Dict[Hashable, List[Any]] = {}
+    file_ranks: Dict[Source, int] = {}
+    dropped: List[int] = []
+    replaced_by: Dict[int, Source] = {}
+
+    for index, record in enumerate(records):
+        source = record_source(record)
+        rank = (ranks.setdefault(source[0], len(ranks)), file_ranks.setdefault(source, len(file_ranks)))
+        key = key_func(record)
+        current = winners.get(key)
+
+        if current is None:
+            winners[key] = [rank, source, [index]]
+        elif rank == current[0]:
+            current[2].append(index)
+        elif rank < current[0]:
+            dropped.extend(current[2])
+            for position in current[2]:
+                replaced_by[position] = source
+            winners[key] = [rank, source, [index]]
+        else:
+            dropped.append(index)
+            replaced_by[index] = current[1]
+
+    if not dropped:
+        return records, [], []
+
+    keep = [True] * len(records)
+    for index in dropped:
+        keep[index] = False
+    dropped.sort()
+    return (
+        [record for record, flag in zip(records, keep) if flag],
+        [records[index] for index in dropped],
+        [replaced_by[index] for index in dropped],
+    )
+
+
+def reconcile_providers(
+    data: Dict[str, List[Any]],
+    precedence: Optional[Sequence[str]] = None
+) -> ReconcileReport:
+    """
+    통합 데이터의 현금/포지션에서 Provider 간(및 같은 Provider의 파일 간) 중복을 제거합니다.
+    data를 직접 수정합니다.
+
+    Args:
+        data: 통합 데이터 (cash/positions/transactions 레코드 목록)
+        precedence: Provider 우선순위 (앞이 우선, 목록에 없는 Provider는 수집 순서대로 뒤)
+
+    Returns:
+        ReconcileReport
+    """
+    report = ReconcileReport()
+    base_ranks = {name: rank for rank, name in enumerate(precedence or [])}
+
+    for data_type in RECONCILE_TYPES:
+        records = data.get(data_type)
+        if not records:
+            continue
+        kept, dropped, replaced_by = reconcile_records(records, KEY_FUNCTIONS[data_type], dict(base_ranks))
+        if dropped:
+            data[data_type] = kept
+            report.dropped[data_type] = dropped
+            report.kept_by[data_type] = replaced_by
+    return report
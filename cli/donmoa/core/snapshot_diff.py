@@ -0,0 +1,300 @@
+"""
+export 스냅샷 비교
+
+두 export 디렉토리의 CSV를 해시 조인으로 비교해 변경 내역을 만듭니다.
+- 현금: (account, currency)별 잔액 합계
+- 포지션: (account, ticker)별 수량/평가액 합계
+- 거래: 중복 제거 인덱스와 같은 필드(date, account, amount, type, note)의 행 해시 다중 집합
+
+현금/포지션은 csv 모듈로 한 행씩 읽으며 키별 합계만 보관합니다. 거래는 청크 단위로
+읽어 행 해시를 벡터 연산으로 계산하고, pandas 해시 테이블(value_counts/reindex)로
+짝을 맞춥니다. 전체 시간은 두 파일 행 수에 선형입니다.
+"""
+
+import csv
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from ..utils.config import config_manager
+
+DIFF_COLUMNS = [
+    "type", "change", "account", "key", "name", "currency", "date",
+    "quantity_before", "quantity_after", "quantity_delta",
+    "amount_before", "amount_after", "amount_delta",
+]
+
+DIFF_TYPES = ["cash", "positions", "transactions"]
+
+# 거래 지문 필드 (TransactionIndex.FINGERPRINT_FIELDS와 같음)
+FINGERPRINT_FIELDS = ["date", "account", "amount", "transaction_type", "note"]
+
+# 컬럼 해시를 행 해시로 합칠 때 곱하는 홀수 (64비트 FNV prime)
+HASH_MULTIPLIER = np.uint64(0x100000001B3)
+
+# 거래 CSV를 나누어 읽는 행 수
+CHUNK_ROWS = 200_000
+
+# 값이 같다고 보는 오차 (CSV 실수 표기 차이)
+QUANTITY_TOLERANCE = 1e-9
+AMOUNT_TOLERANCE = 1e-6
+
+
+@dataclass
+class SnapshotDiff:
+    """두 export의 변경 내역"""
+    before: Path
+    after: Path
+    records: List[Dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def counts(self) -> Dict[str, Dict[str, int]]:
+        """타입별 added/removed/changed 건수"""
+        counts = {data_type: {"added": 0, "removed": 0, "changed": 0} for data_type in DIFF_TYPES}
+        for record in self.records:
+            counts[record["type"]][record["change"]] += 1
+        return counts
+
+    def to_frame(self) -> pd.DataFrame:
+        return pd.DataFrame(self.records, columns=DIFF_COLUMNS)
+
+    def write(self, path: Path, file_format: str = "csv") -> None:
+        """변경 내역을 CSV 또는 JSON으로 저장합니다."""
+        if file_format == "json":
+            payload = {
+                "before": str(self.before),
+                "after": str(self.after),
+                "counts": self.counts,
+                "changes": self.records,
+            }
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(payload, f, ensure_ascii=False, indent=2)
+        else:
+            self.to_frame().to_csv(path, index=False, encoding=config_manager.get("export.encoding", "utf-8"))
+
+
+def diff_exports(before: Path, after: Path, types: Optional[List[str]] = None) -> SnapshotDiff:
+    """
+    두 export 디렉토리를 비교합니다.
+
+    Args:
+        before: 기준 export 디렉토리 (A)
+        after: 비교할 export 디렉토리 (B)
+        types: 비교할 데이터 타입 (기본값 전체)
+
+    Returns:
+        SnapshotDiff
+    """
+    result = SnapshotDiff(before=Path(before), after=Path(after))
+    types = types or DIFF_TYPES
+
+    if "cash" in types:
+        result.records.extend(_diff_balances(result.before, result.after))
+    if "positions" in types:
+        result.records.extend(_diff_positions(result.before, result.after))
+    if "transactions" in types:
+        result.records.extend(_diff_transactions(result.before, result.after))
+    return result
+
+
+def _iter_rows(export_path: Path, filename: str) -> Iterator[Dict[str, str]]:
+    """export CSV를 한 행씩 읽습니다. 파일이 없으면 빈 반복자입니다."""
+    path = export_path / filename
+    if not path.exists():
+        return
+    encoding = config_manager.get("export.encoding", "utf-8")
+    with open(path, "r", encoding=encoding, newline="") as f:
+        yield from csv.DictReader(f)
+
+
+def _number(value: Optional[str]) -> float:
+    try:
+        return float(value) if value not in (None, "") else 0.0
+    except ValueError:
+        return 0.0
+
+
+def _record(data_type: str, change: str, account: str, key: str, **values: Any) -> Dict[str, Any]:
+    record = dict.fromkeys(DIFF_COLUMNS)
+    record.update(type=data_type, change=change, account=account, key=key, **values)
+    # 합계/차이의 실수 오차 제거 (예: 25.05000000000001)
+    for name in ("quantity_delta", "amount_before", "amount_after", "amount_delta"):
+        if isinstance(record[name], float):
+            record[name] = round(record[name], 9)
+    return record
+
+
+def _diff_balances(before: Path, after: Path) -> Iterator[Dict[str, Any]]:
+    """현금 잔액을 (account, currency)로 조인합니다."""
+    table: Dict[Tuple[str, str], float] = {}
+    for row in _iter_rows(before, "cash.csv"):
+        key = (row.get("account", ""), row.get("currency") or "KRW")
+        table[key] = table.get(key, 0.0) + _number(row.get("balance"))
+
+    probed: Dict[Tuple[str, str], float] = {}
+    for row in _iter_rows(after, "cash.csv"):
+        key = (row.get("account", ""), row.get("currency") or "KRW")
+        probed[key] = probed.get(key, 0.0) + _number(row.get("balance"))
+
+    for key, amount_after in probed.items():
+        account, currency = key
+        amount_before = table.pop(key, None)
+        if amount_before is None:
+            change = "added"
+        elif abs(amount_after - amount_before) > AMOUNT_TOLERANCE:
+            change = "changed"
+        else:
+            continue
+        yield _record(
+            "cash", change, account, currency, currency=currency,
+            amount_before=amount_before, amount_after=amount_after,
+            amount_delta=amount_after - (amount_before or 0.0),
+        )
+
+    for (account, currency), amount_before in table.items():
+        yield _record(
+            "cash", "removed", account, currency, currency=currency,
+            amount_before=amount_before, amount_delta=-amount_before,
+        )
+
+
+def _diff_positions(before: Path, after: Path) -> Iterator[Dict[str, Any]]:
+    """포지션을 (account, ticker)로 조인합니다. 값은 [수량, 평가액, 이름, 통화]입니다."""
+    def accumulate(table: Dict[Tuple[str, str], List[Any]], row: Dict[str, str]) -> None:
+        key = (row.get("account", ""), row.get("ticker") or row.get("name", ""))
+        quantity = _number(row.get("quantity"))
+        value = quantity * _number(row.get("average_price"))
+        entry = table.get(key)
+        if entry is None:
+            table[key] = [quantity, value, row.get("name", ""), row.get("currency") or "KRW"]
+        else:
+            entry[0] += quantity
+            entry[1] += value
+
+    table: Dict[Tuple[str, str], List[Any]] = {}
+    for row in _iter_rows(before, "positions.csv"):
+        accumulate(table, row)
+
+    probed: Dict[Tuple[str, str], List[Any]] = {}
+    for row in _iter_rows(after, "positions.csv"):
+        accumulate(probed, row)
+
+    for key, (quantity_after, value_after, name, currency) in probed.items():
+        account, ticker = key
+        entry = table.pop(key, None)
+        if entry is None:
+            quantity_before, value_before, change = None, None, "added"
+        else:
+            quantity_before, value_before = entry[0], entry[1]
+            if (abs(quantity_after - quantity_before) <= QUANTITY_TOLERANCE
+                    and abs(value_after - value_before) <= AMOUNT_TOLERANCE):
+                continue
+            change = "changed"
+        yield _record(
+            "positions", change, account, ticker, name=name, currency=currency,
+            quantity_before=quantity_before, quantity_after=quantity_after,
+            quantity_delta=quantity_after - (quantity_before or 0.0),
+            amount_before=value_before, amount_after=value_after,
+            amount_delta=value_after - (value_before or 0.0),
+        )
+
+    for (account, ticker), (quantity_before, value_before, name, currency) in table.items():
+        yield _record(
+            "positions", "removed", account, ticker, name=name, currency=currency,
+            quantity_before=quantity_before, quantity_delta=-quantity_before,
+            amount_before=value_before, amount_delta=-value_before,
+        )
+
+
+def _read_chunks(export_path: Path, filename: str, columns: Optional[List[str]] = None) -> Iterator[pd.DataFrame]:
+    """export CSV를 CHUNK_ROWS행씩 문자열 DataFrame으로 읽습니다. columns가 있으면 그 컬럼만 읽습니다."""
+    path = export_path / filename
+    if not path.exists():
+        return
+    yield from pd.read_csv(
+        path,
+        dtype=str,
+        keep_default_na=False,
+        usecols=(lambda column: column in columns) if columns else None,
+        chunksize=CHUNK_ROWS,
+        encoding=config_manager.get("export.encoding", "utf-8")
+    )
+
+
+def _transaction_hashes(chunk: pd.DataFrame) -> np.ndarray:
+    """
+    거래 지문 필드(date, account, amount, type, note)의 64비트 행 해시를 계산합니다.
+
+    문자열은 앞뒤 공백을 지우고 금액은 숫자로 바꿔 "1000"과 "1000.0"을 같게 봅니다.
+    정규화와 해시는 컬럼의 고유값에만 수행하고 factorize 코드로 행에 펼칩니다.
+    """
+    combined = np.zeros(len(chunk), dtype=np.uint64)
+    for name in FINGERPRINT_FIELDS:
+        if name not in chunk.columns:
+            values = np.zeros(len(chunk), dtype=np.uint64)
+        else:
+            codes, uniques = pd.factorize(chunk[name])
+            if name == "amount":
+                normalized = pd.to_numeric(pd.Series(uniques), errors="coerce").fillna(0.0).to_numpy()
+            else:
+                normalized = pd.Series(uniques, dtype=object).str.strip().to_numpy(object)
+            values = pd.util.hash_array(normalized)[codes]
+        combined = (combined ^ values) * HASH_MULTIPLIER
+    return combined
+
+
+def _unmatched(hashes: np.ndarray, other: np.ndarray) -> np.ndarray:
+    """
+    다중 집합 비교: 같은 해시의 n번째 행은 상대편에 그 해시가 n개보다 많을 때만 짝이 있습니다.
+
+    Returns:
+        짝이 없는 행 마스크
+    """
+    if not len(hashes):
+        return np.zeros(0, dtype=bool)
+    series = pd.Series(hashes)
+    occurrence = series.groupby(hashes, sort=False).cumcount().to_numpy()
+    available = pd.Series(other).value_counts().reindex(hashes, fill_value=0).to_numpy()
+    return occurrence >= available
+
+
+def _diff_transactions(before: Path, after: Path) -> Iterator[Dict[str, Any]]:
+    """
+    거래를 지문의 다중 집합으로 비교합니다. 거래는 추가/삭제만 있습니다.
+
+    첫 번째 읽기에서 행 해시만 모아 짝이 없는 행을 찾고, 두 번째 읽기에서 해당 행만
+    변경 내역으로 만듭니다. 메모리에는 행당 8바이트 해시와 청크 하나만 유지합니다.
+    """
+    hashes = {}
+    for side, path in (("removed", before), ("added", after)):
+        chunks = _read_chunks(path, "transactions.csv", FINGERPRINT_FIELDS)
+        parts = [_transaction_hashes(chunk) for chunk in chunks]
+        hashes[side] = np.concatenate(parts) if parts else np.zeros(0, dtype=np.uint64)
+
+    masks = {
+        "added": _unmatched(hashes["added"], hashes["removed"]),
+        "removed": _unmatched(hashes["removed"], hashes["added"]),
+    }
+
+    for change, path in (("added", after), ("removed", before)):
+        if not masks[change].any():
+            continue
+        offset = 0
+        for chunk in _read_chunks(path, "transactions.csv"):
+            mask = masks[change][offset:offset + len(chunk)]
+            keys = hashes[change][offset:offset + len(chunk)][mask]
+            offset += len(chunk)
+            for key, row in zip(keys, chunk[mask].to_dict("records")):
+                amount = _number(row.get("amount"))
+                yield _record(
+                    "transactions", change, row.get("account", ""), f"{int(key):016x}",
+                    name=" ".join(filter(None, [row.get("transaction_type"), row.get("note")])),
+                    currency=row.get("currency") or "KRW", date=row.get("date"),
+                    amount_before=amount if change == "removed" else None,
+                    amount_after=amount if change == "added" else None,
+                    amount_delta=-amount if change == "removed" else amount,
+                )
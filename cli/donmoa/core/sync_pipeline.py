@@ -0,0 +1,211 @@
+"""
+수집 → 내보내기 → 업로드 비동기 파이프라인
+
+각 단계는 asyncio 태스크로 동시에 동작하며, 실제 작업(파싱, CSV 쓰기, HTTP 요청)은
+executor 워커에서 실행됩니다. 단계 사이에는 크기가 제한된 큐를 두어 뒤 단계가
+밀리면 앞 단계가 기다리도록(backpressure) 합니다. 여러 날짜 폴더를 처리할 때
+다음 폴더 수집이 이전 폴더의 내보내기/업로드와 겹쳐 진행됩니다.
+
+업로드는 업로드 대기열(outbox)을 거치므로, 전송에 실패한 스냅샷은 대기열에 남아
+`drain` 명령어로 다시 전송됩니다.
+"""
+
+import asyncio
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..utils.logger import logger
+from ..utils.config import config_manager
+from ..utils.date_utils import extract_date_from_folder_name
+from .checkpoint import CheckpointRun, CheckpointStore
+from .donmoa import Donmoa
+from .outbox import UploadOutbox
+from .uploader import SnapshotUploader
+
+# 단계 종료 신호
+_DONE = object()
+
+
+class SyncPipeline:
+    """날짜 폴더별 수집/내보내기/업로드 파이프라인"""
+
+    def __init__(
+        self,
+        donmoa: Optional[Donmoa] = None,
+        upload: bool = True,
+        queue_size: Optional[int] = None,
+        resume: bool = False
+    ):
+        self.donmoa = donmoa or Donmoa()
+        self.resume = resume
+        self.donmoa.data_collector.resume = resume
+        self.uploader = SnapshotUploader() if upload else None
+        self.queue_size = queue_size or config_manager.get("performance.pipeline_queue_size", 2)
+
+    def run(self, folders: List[Path], notes: Optional[str] = None) -> Dict[str, Any]:
+        """파이프라인을 실행하고 폴더별 결과를 반환합니다."""
+        if self.uploader is not None and not self.uploader.is_configured():
+            logger.warning("API 설정이 없어 업로드 단계를 건너뜁니다")
+            self.uploader = None
+
+        results = [{"folder": str(folder), "status": "pending"} for folder in folders]
+        asyncio.run(self._run(folders, results, notes))
+
+        failed = [r for r in results if r["status"] == "error"]
+        return {
+            "status": "success" if not failed else ("error" if len(failed) == len(results) else "partial"),
+            "folders": results
+        }
+
+    async def _run(self, folders: List[Path], results: List[Dict[str, Any]], notes: Optional[str]) -> None:
+        export_queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        upload_queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+
+        await asyncio.gather(
+            self._collect_stage(folders, results, export_queue),
+            self._export_stage(results, export_queue, upload_queue),
+            self._upload_stage(results, upload_queue, notes),
+        )
+
+    async def _collect_stage(
+        self,
+        folders: List[Path],
+        results: List[Dict[str, Any]],
+        export_queue: asyncio.Queue
+    ) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            for i, folder in enumerate(folders):
+                try:
+                    if self.resume:
+                        completed = self._completed_date(folder)
+                        if completed:
+                            logger.info(f"♻️ 이미 완료된 폴더를 건너뜁니다: {folder}")
+                            results[i].update(date=completed, status="skipped")
+                            continue
+
+                    snapshot_date, data, run = await loop.run_in_executor(None, self._collect, folder)
+                    results[i].update(date=snapshot_date, status="collected")
+                    # 시간/메모리 한도로 제외된 Provider (나머지 Provider 결과는 그대로 내보냄)
+                    if self.donmoa.data_collector.failed_providers:
+                        results[i]["failed_providers"] = dict(self.donmoa.data_collector.failed_providers)
+                    await export_queue.put((i, snapshot_date, data, run))
+                except Exception as e:
+                    logger.error(f"❌ 수집 실패 ({folder}): {e}")
+                    results[i].update(status="error", message=f"수집 실패: {e}")
+        finally:
+            await export_queue.put(_DONE)
+
+    async def _export_stage(
+        self,
+        results: List[Dict[str, Any]],
+        export_queue: asyncio.Queue,
+        upload_queue: asyncio.Queue
+    ) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                item = await export_queue.get()
+                if item is _DONE:
+                    break
+
+                i, snapshot_date, data, run = item
+                try:
+                    export_path, total_records = await loop.run_in_executor(
+                        None, self._export, snapshot_date, data, run
+                    )
+                    results[i].update(
+                        status="exported", export_dir=str(export_path), total_records=total_records
+                    )
+                    if export_path is not None:
+                        await upload_queue.put((i, snapshot_date, export_path))
+                except Exception as e:
+                    logger.error(f"❌ 내보내기 실패 ({snapshot_date}): {e}")
+                    results[i].update(status="error", message=f"내보내기 실패: {e}")
+        finally:
+            await upload_queue.put(_DONE)
+
+    async def _upload_stage(
+        self,
+        results: List[Dict[str, Any]],
+        upload_queue: asyncio.Queue,
+        notes: Optional[str]
+    ) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            item = await upload_queue.get()
+            if item is _DONE:
+                break
+
+            i, snapshot_date, export_path = item
+            try:
+                key = await loop.run_in_executor(
+                    None, self.donmoa.enqueue_upload, export_path, snapshot_date, notes
+                )
+                if self.uploader is None:
+                    results[i]["upload"] = "queued" if key else "skipped"
+                elif key is None:
+                    # 대기열을 사용하지 않으면 바로 전송
+                    response = await loop.run_in_executor(
+                        None, self.uploader.post, export_path, snapshot_date, notes
+                    )
+                    if SnapshotUploader.is_success(response):
+                        results[i].update(upload="success", snapshot_id=SnapshotUploader.snapshot_id(response))
+                    else:
+                        results[i].update(status="error", upload=f"HTTP {response.status_code}")
+                else:
+                    outcome, entry = await loop.run_in_executor(None, self._send_queued, key)
+                    if outcome == "sent":
+                        results[i].update(upload="success", snapshot_id=entry.get("snapshot_id"))
+                    elif outcome == "failed":
+                        results[i].update(status="error", upload=f"실패: {entry.get('last_error')}")
+                    else:
+                        results[i]["upload"] = "queued"
+            except Exception as e:
+                logger.error(f"❌ 업로드 실패 ({snapshot_date}): {e}")
+                results[i].update(status="error", upload=f"실패: {e}")
+
+    def _send_queued(self, key: str) -> Tuple[str, Dict[str, Any]]:
+        """대기열 항목 하나를 전송합니다. 이미 전송된 내용이면 다시 보내지 않습니다. (executor 워커에서 실행)"""
+        outbox = UploadOutbox(uploader=self.uploader)
+        entry = outbox.get(key) or {}
+        if entry.get("status") != "pending":
+            return ("sent" if entry.get("status") == "sent" else "failed"), entry
+
+        outcome = outbox.send(entry)
+        return outcome, outbox.get(key) or entry
+
+    def _completed_date(self, folder: Path) -> Optional[str]:
+        """폴더의 최근 실행 체크포인트가 완료되었으면 그 날짜를 반환합니다."""
+        snapshot_date = extract_date_from_folder_name(folder)
+        if not snapshot_date or not config_manager.get("checkpoint.enabled", True):
+            return None
+        latest = CheckpointStore().latest_run(snapshot_date)
+        return snapshot_date if latest is not None and latest.completed else None
+
+    def _collect(self, folder: Path) -> Tuple[Optional[str], Dict[str, List[Any]], Optional[CheckpointRun]]:
+        """폴더 하나를 수집합니다. (executor 워커에서 실행)"""
+        data = self.donmoa.collect(str(folder))
+        data_collector = self.donmoa.data_collector
+        # 다음 폴더 수집이 체크포인트를 바꾸기 전에 이 폴더의 실행을 함께 넘김
+        return data_collector.snapshot_date, data, data_collector.checkpoint_run
+
+    def _export(
+        self,
+        snapshot_date: Optional[str],
+        data: Dict[str, List[Any]],
+        run: Optional[CheckpointRun] = None
+    ) -> Tuple[Optional[Path], int]:
+        """중복 제거, CSV/요약 내보내기, 이력 저장을 수행합니다. (executor 워커에서 실행)"""
+        data_collector = self.donmoa.data_collector
+
+        exported_files = self.donmoa.export_stage(data, run=run)
+        self.donmoa.history_stage(data, snapshot_date, run)
+
+        total_records = sum(len(records) for records in data.values())
+        export_path = next(iter(exported_files.values())).parent if exported_files else None
+        if export_path is not None:
+            self.donmoa.export_summary(data_collector.summarize_portfolio(data), export_path)
+        if run is not None:
+            run.finish()
+        return export_path, total_records
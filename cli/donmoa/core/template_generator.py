@@ -55,7 +55,7 @@ class TemplateGenerator:
             sheet_info = {}
             for sheet_name, schema_class in self.schemas.items():
                 self._create_sheet(wb, sheet_name, schema_class)
-                sheet_info[sheet_name] = len(schema_class.__dataclass_fields__)
+                sheet_info[sheet_name] = len(self._template_fields(schema_class))
 
             # 워크북 저장
             wb.save(template_path)
@@ -84,8 +84,8 @@ class TemplateGenerator:
         # 시트 생성
         ws = wb.create_sheet(title=sheet_name)
 
-        # 스키마 필드 정보 가져오기
-        fields = schema_class.__dataclass_fields__
+        # 스키마 필드 정보 가져오기 (내부 필드 제외)
+        fields = self._template_fields(schema_class)
 
         # 헤더 행 생성
         headers = []
@@ -114,6 +114,14 @@ class TemplateGenerator:
         # 테두리 추가
         self._add_borders(ws, len(headers), 4)
 
+    @staticmethod
+    def _template_fields(schema_class) -> Dict[str, Any]:
+        """사용자가 입력하는 필드만 반환합니다. (source_file, amount_minor 등 내부 필드 제외)"""
+        return {
+            name: field_info for name, field_info in schema_class.__dataclass_fields__.items()
+            if not field_info.metadata.get("internal")
+        }
+
     def _add_example_data(self, ws: openpyxl.worksheet.worksheet.Worksheet, schema_class, headers: List[str]):
         """예시 데이터를 추가합니다."""
 
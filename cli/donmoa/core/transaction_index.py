@@ -0,0 +1,163 @@
+"""
+거래 중복 제거용 지문(fingerprint) 인덱스
+
+이미 내보낸 거래의 지문을 SQLite에 기록해 두고, 다음 실행에서는
+처음 보는 거래만 통과시킵니다. 지문은 (date, account, amount, type, note)로
+만든 16바이트 해시이며 WITHOUT ROWID 기본 키로 조회됩니다.
+
+같은 날 같은 금액의 카드 결제 두 건처럼 지문이 같은 실제 거래가 있으므로 지문마다
+내보낸 건수(occurrences)를 기록합니다. 배치에 n건이 있고 m건이 이미 기록되어 있으면
+n - m건을 새 거래로 통과시킵니다. 배치 안의 건수는 Provider별로 세고 그중 가장 큰 값을
+씁니다. 서로 다른 Provider(예: 수동 입력과 뱅크샐러드)에 같은 거래가 있으면 하나로
+보기 위함입니다.
+"""
+
+import hashlib
+import numbers
+import sqlite3
+from contextlib import closing
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+import pandas as pd
+
+from ..utils.logger import logger
+from ..utils.config import config_manager
+
+
+SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS seen_transactions (
+  fingerprint BLOB PRIMARY KEY,
+  date TEXT NOT NULL,
+  first_seen_at TEXT NOT NULL,
+  occurrences INTEGER NOT NULL DEFAULT 1
+) WITHOUT ROWID;
+"""
+
+# SQLite 바인딩 변수 개수 제한보다 작게 나누어 조회합니다
+LOOKUP_CHUNK_SIZE = 500
+
+
+def fingerprint_field(record: Any, name: str) -> Any:
+    """스키마 객체 또는 딕셔너리에서 필드 값을 꺼냅니다."""
+    if isinstance(record, dict):
+        return record.get(name)
+    return getattr(record, name, None)
+
+
+def _normalize(value: Any) -> str:
+    """지문 계산용으로 값을 정규화합니다. 결측값은 빈 문자열입니다."""
+    if value is None:
+        return ""
+    try:
+        if pd.isna(value):
+            return ""
+    except (TypeError, ValueError):
+        pass
+    if isinstance(value, numbers.Real) and not isinstance(value, bool):
+        return f"{float(value):.4f}"
+    return str(value).strip()
+
+
+class TransactionIndex:
+    """내보낸 거래 지문 영속 인덱스"""
+
+    FINGERPRINT_FIELDS = ["date", "account", "amount", "transaction_type", "note"]
+
+    def __init__(self, db_path: Optional[Path] = None):
+        if db_path is None:
+            db_path = Path(config_manager.get("dedup.index_path", "data/history/transactions_index.db"))
+
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(sqlite3.connect(self.db_path)) as conn:
+            conn.executescript(SCHEMA_SQL)
+            # 건수 열이 없던 이전 인덱스는 지문마다 1건으로 봅니다
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(seen_transactions)")}
+            if "occurrences" not in columns:
+                conn.execute(
+                    "ALTER TABLE seen_transactions ADD COLUMN occurrences INTEGER NOT NULL DEFAULT 1"
+                )
+                conn.commit()
+
+    @classmethod
+    def fingerprint(cls, transaction: Any) -> bytes:
+        """거래의 안정적인 지문을 계산합니다."""
+        key = "\x1f".join(_normalize(fingerprint_field(transaction, name)) for name in cls.FINGERPRINT_FIELDS)
+        return hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+
+    def filter_new(self, transactions: List[Any]) -> List[Any]:
+        """
+        인덱스에 없는 거래만 반환합니다.
+
+        지문이 같은 거래는 건수로 비교합니다. 배치의 건수(Provider별 건수 중 최댓값)에서
+        이미 기록된 건수를 뺀 만큼, 가장 많이 가진 Provider의 뒤쪽 행을 남깁니다.
+        """
+        if not transactions:
+            return transactions
+
+        fingerprints = [self.fingerprint(txn) for txn in transactions]
+        recorded = self._lookup(set(fingerprints))
+
+        # 지문 → Provider → 행 위치 목록 (처음 나온 순서 유지)
+        groups: Dict[bytes, Dict[Any, List[int]]] = {}
+        for position, (txn, fp) in enumerate(zip(transactions, fingerprints)):
+            groups.setdefault(fp, {}).setdefault(fingerprint_field(txn, "provider"), []).append(position)
+
+        keep = [False] * len(transactions)
+        for fp, by_provider in groups.items():
+            positions = max(by_provider.values(), key=len)
+            for position in positions[recorded.get(fp, 0):]:
+                keep[position] = True
+
+        new_transactions = [txn for txn, flag in zip(transactions, keep) if flag]
+        dropped = len(transactions) - len(new_transactions)
+        if dropped:
+            logger.info(f"중복 거래 {dropped}건 제외, 신규 거래 {len(new_transactions)}건")
+        return new_transactions
+
+    def add(self, transactions: Iterable[Any]) -> int:
+        """
+        거래 지문을 인덱스에 기록합니다.
+
+        filter_new가 통과시킨 거래를 받으므로, 이미 있는 지문은 건수를 더합니다.
+        기록한 거래 수를 반환합니다.
+        """
+        now = datetime.now().isoformat()
+        rows: Dict[bytes, List[Any]] = {}
+        for txn in transactions:
+            fp = self.fingerprint(txn)
+            if fp in rows:
+                rows[fp][2] += 1
+            else:
+                rows[fp] = [_normalize(fingerprint_field(txn, "date")), now, 1]
+        if not rows:
+            return 0
+
+        with closing(sqlite3.connect(self.db_path)) as conn:
+            with conn:
+                conn.executemany(
+                    "INSERT INTO seen_transactions (fingerprint, date, first_seen_at, occurrences) "
+                    "VALUES (?, ?, ?, ?) "
+                    "ON CONFLICT(fingerprint) DO UPDATE SET occurrences = occurrences + excluded.occurrences",
+                    [(fp, *values) for fp, values in rows.items()]
+                )
+        return sum(values[2] for values in rows.values())
+
+    def _lookup(self, fingerprints: Set[bytes]) -> Dict[bytes, int]:
+        """인덱스에 이미 있는 지문 → 기록된 건수"""
+        found: Dict[bytes, int] = {}
+        candidates = list(fingerprints)
+
+        with closing(sqlite3.connect(self.db_path)) as conn:
+            for i in range(0, len(candidates), LOOKUP_CHUNK_SIZE):
+                chunk = candidates[i:i + LOOKUP_CHUNK_SIZE]
+                placeholders = ", ".join("?" * len(chunk))
+                rows = conn.execute(
+                    f"SELECT fingerprint, occurrences FROM seen_transactions WHERE fingerprint IN ({placeholders})",
+                    chunk
+                ).fetchall()
+                found.update(rows)
+
+        return found
@@ -0,0 +1,254 @@
+"""
+업로드 전 로컬 검증
+
+마이그레이션에서 생성한 서버 제약 조건(schemas/server_constraints.py)으로 export CSV를
+업로드 전에 검사합니다. 서버에서 거부될 행은 보내기 전에 제외하고, 한국어 거래 타입처럼
+서버 열거값으로 옮길 수 있는 값은 변환합니다. 스냅샷 자체가 거부될 경우(날짜/출처 오류)는
+네트워크 요청 없이 ValueError를 발생시킵니다.
+"""
+
+import io
+import re
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from ..schemas.server_constraints import TABLE_CONSTRAINTS
+from ..schemas.validation import ValidationReport, apply_checks
+from ..utils.logger import logger
+from ..utils.config import config_manager
+
+# 서버 테이블 → (export 파일, 서버 컬럼 → CSV 컬럼 후보)
+# 정수 컬럼이 없는 이전 export는 원래 값 컬럼으로 대신 확인합니다 (서버에서 변환).
+TABLE_FILES = {
+    "snapshot_cash": ("cash.csv", {
+        "account_id": ["account"],
+        "currency": ["currency"],
+        "amount_minor": ["amount_minor", "balance"],
+    }),
+    "snapshot_positions": ("positions.csv", {
+        "account_id": ["account"],
+        "instrument_id": ["ticker"],
+        "qty_nano": ["qty_nano", "quantity"],
+        "currency": ["currency"],
+    }),
+    "snapshot_transactions": ("transactions.csv", {
+        "account_id": ["account"],
+        "trade_datetime": ["date"],
+        "type": ["transaction_type"],
+        "currency": ["currency"],
+        "amount_minor": ["amount_minor", "amount"],
+    }),
+}
+
+# 한국어/별칭 거래 타입 → 서버 열거값 (설정 upload_validation.transaction_type_map으로 추가)
+TRANSACTION_TYPE_ALIASES = {
+    "매수": "buy",
+    "매도": "sell",
+    "배당": "dividend",
+    "배당금": "dividend",
+    "수수료": "fee",
+    "이체": "transfer",
+    "입금": "deposit",
+    "수입": "deposit",
+    "출금": "withdraw",
+    "지출": "withdraw",
+    "이자": "interest",
+    "withdrawal": "withdraw",
+}
+
+# 열거값으로 변환할 수 없을 때 사용할 값 (없으면 행 제외)
+ENUM_FALLBACKS = {("snapshot_transactions", "type"): "other"}
+
+# API 검증(packages/api snapshot validator)의 날짜/통화 코드 형식
+DATE_RE = r"^\d{4}-\d{2}-\d{2}$"
+CURRENCY_RE = r"^[A-Za-z]{3}$"
+
+INT64_MAX = np.iinfo(np.int64).max
+
+
+@dataclass
+class PreparedUpload:
+    """검증을 거친 업로드 파일과 결과"""
+    # 업로드 폼 필드 → (파일명, CSV 바이트)
+    files: Dict[str, Tuple[str, bytes]] = field(default_factory=dict)
+    reports: Dict[str, ValidationReport] = field(default_factory=dict)
+    # "파일.컬럼: 원래값 → 변환값" → 건수
+    mapped: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def rejected_rows(self) -> int:
+        return sum(report.invalid_rows for report in self.reports.values())
+
+
+class UploadValidator:
+    """서버 제약 조건 기반 업로드 전 검증기"""
+
+    def __init__(self):
+        self.encoding = config_manager.get("export.encoding", "utf-8")
+        self.type_aliases = dict(TRANSACTION_TYPE_ALIASES)
+        self.type_aliases.update(config_manager.get("upload_validation.transaction_type_map", {}) or {})
+
+    def check_snapshot(self, snapshot_date: str, source: str) -> None:
+        """스냅샷 헤더를 검사합니다. 서버에서 거부될 값이면 ValueError를 발생시킵니다."""
+        constraints = TABLE_CONSTRAINTS["snapshots"]
+        sources = constraints["enums"]["source"]
+        if source not in sources:
+            raise ValueError(f"허용되지 않는 스냅샷 출처: {source} (허용: {', '.join(sources)})")
+        try:
+            if not re.match(DATE_RE, snapshot_date or ""):
+                raise ValueError(snapshot_date)
+            datetime.strptime(snapshot_date, "%Y-%m-%d")
+        except ValueError:
+            raise ValueError(f"스냅샷 날짜 형식 오류: {snapshot_date} (YYYY-MM-DD)")
+
+    def prepare(self, export_path: Path, files: Dict[str, str]) -> PreparedUpload:
+        """
+        export CSV를 검증하고 업로드할 내용을 만듭니다.
+
+        바뀐 행이 없는 파일은 원본 바이트를 그대로 사용합니다.
+
+        Args:
+            export_path: export 디렉토리
+            files: 업로드 폼 필드 → 파일명
+
+        Returns:
+            PreparedUpload
+        """
+        prepared = PreparedUpload()
+        table_by_file = {filename: table for table, (filename, _) in TABLE_FILES.items()}
+
+        for key, filename in files.items():
+            raw = (Path(export_path) / filename).read_bytes()
+            table = table_by_file.get(filename)
+            if table is None:
+                prepared.files[key] = (filename, raw)
+                continue
+
+            df = pd.read_csv(io.BytesIO(raw), dtype=str, keep_default_na=False, encoding=self.encoding)
+            df, report, changed = self.validate_table(table, df, prepared.mapped)
+            prepared.reports[filename] = report
+
+            if changed:
+                raw = df[report.valid_mask].to_csv(index=False).encode(self.encoding)
+            prepared.files[key] = (filename, raw)
+
+            if not report.is_valid:
+                logger.warning("⚠️ 업로드 전 검증 %s", report.summary(row_offset=2))
+
+        for mapping, count in prepared.mapped.items():
+            logger.info("업로드 전 변환 %s: %d건", mapping, count)
+        return prepared
+
+    def validate_table(
+        self,
+        table: str,
+        df: pd.DataFrame,
+        mapped: Dict[str, int]
+    ) -> Tuple[pd.DataFrame, ValidationReport, bool]:
+        """
+        테이블 하나를 제약 조건으로 검사합니다. (값은 모두 문자열)
+
+        Returns:
+            (열거값을 변환한 DataFrame, 검증 결과, 내용이 바뀌었는지 여부)
+        """
+        filename, candidates = TABLE_FILES[table]
+        constraints = TABLE_CONSTRAINTS[table]
+        report = ValidationReport(schema=filename, total_rows=len(df))
+
+        # 서버 컬럼 → 실제로 있는 첫 번째 CSV 컬럼
+        columns = {
+            name: next((c for c in options if c in df.columns), options[0])
+            for name, options in candidates.items()
+        }
+        report.missing_columns = [
+            columns[name] for name in constraints["not_null"]
+            if name in columns and columns[name] not in df.columns
+        ]
+        if report.missing_columns:
+            report.valid_mask = np.zeros(len(df), dtype=bool)
+            return df, report, True
+
+        checks: List[Tuple[str, str, np.ndarray]] = []
+        changed = False
+
+        for name, allowed in constraints["enums"].items():
+            column = columns.get(name)
+            if column not in df.columns:
+                continue
+            df, invalid, enum_changed = self._map_enum(table, name, df, column, allowed, mapped)
+            changed = changed or enum_changed
+            checks.append((column, "허용되지 않는 값", invalid))
+
+        for name in constraints["not_null"]:
+            column = columns.get(name)
+            if column in df.columns:
+                checks.append((column, "필수값 누락", (df[column].str.strip() == "").to_numpy()))
+
+        currency = columns.get("currency")
+        if currency in df.columns:
+            checks.append((currency, "통화 코드 오류", ~df[currency].str.match(CURRENCY_RE).to_numpy()))
+
+        amount = columns.get("amount_minor")
+        if amount == "amount_minor" and amount in df.columns:
+            values = pd.to_numeric(df[amount].replace("", np.nan), errors="coerce")
+            too_large = values.abs().to_numpy() > INT64_MAX
+            non_integer = values.notna().to_numpy() & (values.to_numpy() != np.floor(values.to_numpy()))
+            checks.append((amount, "정수 범위 오류", too_large | non_integer))
+
+        # 고유 키 중복은 계좌 매핑으로 합쳐진 정상 행일 수 있으므로 제외하지 않고 경고만 남김
+        for unique in constraints["unique"]:
+            subset = [columns[name] for name in unique if columns.get(name) in df.columns]
+            if len(subset) == len(unique):
+                duplicates = int(df.duplicated(subset).sum())
+                if duplicates:
+                    logger.warning("⚠️ %s: (%s) 중복 %d건 - 서버에서 거부될 수 있습니다",
+                                   filename, ", ".join(subset), duplicates)
+
+        apply_checks(report, checks, len(df))
+        changed = changed or not report.errors.empty
+        return df, report, changed
+
+    def _map_enum(
+        self,
+        table: str,
+        name: str,
+        df: pd.DataFrame,
+        column: str,
+        allowed: List[str],
+        mapped: Dict[str, int]
+    ) -> Tuple[pd.DataFrame, np.ndarray, bool]:
+        """열거 컬럼을 서버 값으로 변환하고, 변환할 수 없는 행 마스크를 반환합니다."""
+        original = df[column]
+        aliases = self.type_aliases if name == "type" else {}
+
+        normalized = original.str.strip()
+        lowered = normalized.str.lower()
+        values = lowered.where(lowered.isin(allowed), normalized.map(aliases))
+
+        fallback = ENUM_FALLBACKS.get((table, name))
+        if fallback is not None:
+            values = values.fillna(fallback)
+        invalid = values.isna().to_numpy()
+        values = values.fillna(original)
+
+        diff = (values != original).to_numpy() & ~invalid
+        if diff.any():
+            pairs = pd.DataFrame({"from": original[diff], "to": values[diff]}).value_counts()
+            for (source, target), count in pairs.items():
+                label = f"{TABLE_FILES[table][0]}.{column}: {source} → {target}"
+                mapped[label] = mapped.get(label, 0) + int(count)
+            df = df.assign(**{column: values})
+
+        return df, invalid, bool(diff.any())
+
+
+def validate_export(export_path: Path, snapshot_date: str, files: Dict[str, str], source: Optional[str] = None) -> PreparedUpload:
+    """스냅샷 헤더와 export CSV를 검증합니다."""
+    validator = UploadValidator()
+    validator.check_snapshot(snapshot_date, source or config_manager.get("upload_validation.source", "cli"))
+    return validator.prepare(export_path, files)
@@ -0,0 +1,97 @@
+"""
+스냅샷 업로드 클래스
+"""
+
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import requests
+
+from ..utils.config import config_manager
+from .upload_validator import validate_export
+
+# 업로드 폼 필드 → export 파일명
+EXPORT_FILES = {
+    'cash_file': 'cash.csv',
+    'positions_file': 'positions.csv',
+    'transactions_file': 'transactions.csv',
+}
+
+# 업로드 성공으로 보는 HTTP 상태 코드 (직접 업로드, 대기열, sync 공통)
+SUCCESS_STATUS = (200, 201)
+
+
+class SnapshotUploader:
+    """export 디렉토리의 CSV를 API로 업로드하는 클래스"""
+
+    def __init__(self, api_url: Optional[str] = None, api_token: Optional[str] = None, timeout: int = 60):
+        self.api_url = api_url or config_manager.get("api.url")
+        self.api_token = api_token or config_manager.get("api.token")
+        self.timeout = timeout
+        self.source = config_manager.get("upload_validation.source", "cli")
+        self.validate = config_manager.get("upload_validation.enabled", True)
+
+    @staticmethod
+    def is_success(response: requests.Response) -> bool:
+        """업로드 응답이 성공(200 OK, 201 Created)인지 확인합니다."""
+        return response.status_code in SUCCESS_STATUS
+
+    @staticmethod
+    def snapshot_id(response: requests.Response) -> Optional[Any]:
+        """성공 응답 본문의 snapshot_id (JSON이 아니면 None)"""
+        try:
+            return response.json().get("snapshot_id")
+        except ValueError:
+            return None
+
+    def is_configured(self) -> bool:
+        """API URL과 토큰이 설정되어 있는지 확인합니다."""
+        return bool(self.api_url and self.api_token)
+
+    @staticmethod
+    def find_files(export_path: Path) -> List[str]:
+        """업로드할 CSV 파일의 폼 필드 목록을 반환합니다."""
+        return [key for key, filename in EXPORT_FILES.items() if (export_path / filename).exists()]
+
+    def post(
+        self,
+        export_path: Path,
+        snapshot_date: str,
+        notes: Optional[str] = None,
+        extra_headers: Optional[Dict[str, str]] = None
+    ) -> requests.Response:
+        """
+        CSV 파일들을 업로드합니다.
+
+        업로드 전 검증(upload_validation.enabled)이 켜져 있으면 서버 제약 조건에 맞지 않는
+        행은 제외하고 거래 타입 등은 서버 값으로 변환한 내용을 보냅니다.
+
+        Raises:
+            ValueError: 스냅샷 날짜/출처가 서버 제약 조건에 맞지 않음 (요청하지 않음)
+            requests.exceptions.RequestException: 네트워크 오류
+        """
+        export_files = {key: EXPORT_FILES[key] for key in self.find_files(export_path)}
+        if self.validate:
+            contents = validate_export(export_path, snapshot_date, export_files, self.source).files
+        else:
+            contents = {
+                key: (filename, (export_path / filename).read_bytes())
+                for key, filename in export_files.items()
+            }
+
+        data = {'snapshot_date': snapshot_date, 'source': self.source}
+        if notes:
+            data['notes'] = notes
+
+        headers = {'Authorization': f'Bearer {self.api_token}'}
+        if extra_headers:
+            headers.update(extra_headers)
+
+        files = {key: (filename, content, 'text/csv') for key, (filename, content) in contents.items()}
+        return requests.post(
+            f"{self.api_url}/v1/snapshots/upload",
+            files=files,
+            data=data,
+            headers=headers,
+            timeout=self.timeout
+        )
@@ -1,15 +1,33 @@
 """
 Provider 모듈들
+
+개별 Provider는 무거운 파서 의존성(BeautifulSoup, openpyxl)을 가지므로
+처음 접근할 때 import합니다.
 """
 
+import importlib
+
 from .base import BaseProvider
-from .banksalad import BanksaladProvider
-from .domino import DominoProvider
-from .manual import ManualProvider
+from .registry import ProviderSpec, discover_providers
+
+_LAZY_PROVIDERS = {
+    "BanksaladProvider": ".banksalad",
+    "DominoProvider": ".domino",
+    "ManualProvider": ".manual",
+}
 
 __all__ = [
     "BaseProvider",
     "BanksaladProvider",
     "DominoProvider",
     "ManualProvider",
+    "ProviderSpec",
+    "discover_providers",
 ]
+
+
+def __getattr__(name):
+    if name in _LAZY_PROVIDERS:
+        module = importlib.import_module(_LAZY_PROVIDERS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
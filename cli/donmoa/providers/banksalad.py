@@ -10,24 +10,39 @@ import openpyxl
 from datetime import datetime
 
 from ..schemas import CashSchema, PositionSchema, TransactionSchema
+from ..utils.archive import open_seekable
 from ..utils.logger import logger
+from ..utils.memory import memory_monitor
 from .base import BaseProvider
+from .registry import builtin_file_patterns
+
+# 거래 파싱에 쓰는 가계부 내역 컬럼 (순서대로 TransactionSchema 필드에 대응)
+TRANSACTION_COLUMNS = ["날짜", "시간", "결제수단", "타입", "금액", "대분류", "소분류", "메모"]
+
+# 메모리 절약 모드에서 읽는 가계부 내역 컬럼
+EXPENSE_COLUMNS = set(TRANSACTION_COLUMNS)
+
+
+def _pad(row: tuple, width: int = 5) -> tuple:
+    """읽기 전용 모드에서 짧게 끝나는 행을 width 칸으로 맞춥니다."""
+    return tuple(row) + (None,) * (width - len(row)) if len(row) < width else row
 
 
 class BanksaladProvider(BaseProvider):
     """뱅크샐러드 Excel 파일 파싱 Provider"""
 
+    default_file_patterns = builtin_file_patterns("banksalad")
+
     def __init__(self, name: str = "banksalad_csv", config: Optional[Dict[str, Any]] = None):
         super().__init__(name, config)
 
-    def get_supported_names(self) -> List[str]:
-        """지원하는 파일 이름 목록을 반환합니다."""
-        return ["banksalad.xlsx"]
-
     def parse_raw(self, file_path: Path) -> Dict[str, pd.DataFrame]:
         """원본 데이터를 파싱합니다."""
         try:
-            workbook = openpyxl.load_workbook(file_path, data_only=True)
+            # 메모리 예산에 가까우면 읽기 전용(스트리밍) 모드로 셀 객체를 만들지 않고 읽음
+            low_memory = memory_monitor.low_memory
+            source = open_seekable(file_path)
+            workbook = openpyxl.load_workbook(source, data_only=True, read_only=low_memory)
 
             dict_datas = {
                 "financial_status": pd.DataFrame(),
@@ -41,28 +56,23 @@ class BanksaladProvider(BaseProvider):
                 logger.error("뱅샐현황 시트를 찾을 수 없습니다")
                 return dict_datas
 
-            sheet = workbook["뱅샐현황"]
+            # 시트를 한 번만 순회 (읽기 전용 모드에서는 행/열 임의 접근이 느림)
+            rows = (_pad(row) for row in workbook["뱅샐현황"].iter_rows(values_only=True))
 
             # "3.재무현황" 헤더 찾기
-            header_cell = None
-            for cell in sheet['B']:
-                if cell.value and "3.재무현황" in str(cell.value):
-                    header_cell = cell
-                    break
-
-            if not header_cell:
+            if not any(row[1] and "3.재무현황" in str(row[1]) for row in rows):
                 logger.error("3.재무현황 헤더를 찾을 수 없습니다")
                 return dict_datas
 
-            # 재무현황 테이블 파싱
-            table_start_row = header_cell.row + 3
-
-            header_row = sheet[table_start_row]
-            header = [header_row[1].value, header_row[2].value, header_row[4].value]
+            # 재무현황 테이블 파싱 (헤더는 제목 3행 아래)
+            next(rows, None)
+            next(rows, None)
+            header_row = next(rows, _pad(()))
+            header = [header_row[1], header_row[2], header_row[4]]
 
             datas = []
             tmp_type = None
-            for row in sheet.iter_rows(min_row=table_start_row + 1, values_only=True):
+            for row in rows:
                 if not any(cell is not None for cell in row):
                     break
                 if row[1] is not None:
@@ -70,13 +80,23 @@ class BanksaladProvider(BaseProvider):
                 if row[2] is None:
                     continue
                 datas.append([tmp_type, row[2], row[4]])
+            workbook.close()
 
-            dict_datas["financial_status"] = pd.DataFrame(datas, columns=header)
+            dict_datas["financial_status"] = self._convert_columns(pd.DataFrame(datas, columns=header), ["금액"])
 
             #########################################################
             # 가계부 내역 데이터 파싱
             #########################################################
-            dict_datas["expenses_records"] = pd.read_excel(file_path, sheet_name="가계부 내역")
+            if hasattr(source, "seek"):
+                source.seek(0)
+            dict_datas["expenses_records"] = self._convert_columns(
+                pd.read_excel(
+                    source,
+                    sheet_name="가계부 내역",
+                    usecols=(lambda column: column in EXPENSE_COLUMNS) if low_memory else None
+                ),
+                ["금액"]
+            )
 
             logger.info(f"재무현황 데이터 파싱 완료: {len(dict_datas['financial_status'])}건")
             logger.info(f"가계부 내역 데이터 파싱 완료: {len(dict_datas['expenses_records'])}건")
@@ -141,25 +161,21 @@ class BanksaladProvider(BaseProvider):
             start_date = max_date - pd.DateOffset(months=1)
             df_expenses_records = df_expenses_records[df_expenses_records["날짜"] >= start_date]
 
-        transactions_datas = []
-        for _, row in df_expenses_records.iterrows():
-            date = row["날짜"].strftime("%Y-%m-%d") + "T" + row["시간"].strftime("%H:%M:%S")
-            account = row["결제수단"]
-            transaction_type = row["타입"]
-            amount = row["금액"]
-            category = row["대분류"]
-            category_detail = row["소분류"]
-            currency = "KRW"
-            note = row["메모"]
+        if df_expenses_records.empty:
+            return []
 
+        # iterrows는 행마다 Series를 만들므로 필요한 컬럼만 묶어 순회
+        transactions_datas = []
+        columns = [df_expenses_records[column] for column in TRANSACTION_COLUMNS]
+        for day, time_of_day, account, transaction_type, amount, category, category_detail, note in zip(*columns):
             transactions_datas.append(TransactionSchema(
-                date=date,
+                date=day.strftime("%Y-%m-%d") + "T" + time_of_day.strftime("%H:%M:%S"),
                 account=account,
                 transaction_type=transaction_type,
                 amount=amount,
                 category=category,
                 category_detail=category_detail,
-                currency=currency,
+                currency="KRW",
                 note=note,
                 provider=self.name,
                 collected_at=self._get_current_timestamp(),
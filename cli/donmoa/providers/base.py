@@ -2,24 +2,39 @@
 Provider 기본 클래스
 """
 
+import os
+import pickle
 from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union, TypeVar
-import re
+from typing import Any, Dict, List, Optional, Tuple, Union, TypeVar
 import pandas as pd
 from dataclasses import replace
 
 from ..schemas import CashSchema, PositionSchema, TransactionSchema
-from ..utils.logger import logger
+from ..utils.logger import get_worker_log_queue, init_worker_logging, logger
 from ..utils.config import config_manager
+from ..utils.input_index import input_index
+from ..utils.memory import memory_monitor
+from ..utils.number_utils import parse_number, parse_numbers
+from .registry import configured_file_patterns
 
 # 제네릭 타입 정의
 T = TypeVar('T', CashSchema, PositionSchema)
 
 
+def _parse_file_worker(provider: "BaseProvider", file_path: Path) -> Dict[str, List[Any]]:
+    """워커 프로세스에서 파일 하나를 파싱합니다. (pickle 가능한 모듈 수준 함수)"""
+    return provider.parse_file(file_path)
+
+
 class BaseProvider(ABC):
     """모든 Provider의 기본 클래스"""
 
+    # 설정(providers.<이름>.file_patterns)이 없을 때의 파일 패턴 (ProviderSpec.create가 채움)
+    default_file_patterns: Tuple[str, ...] = ()
+
     def __init__(self, name: str, config: Optional[Dict[str, Any]] = None):
         """
         Provider 초기화
@@ -43,10 +58,9 @@ class BaseProvider(ABC):
             logger.warning(f"Provider 설정 로드 실패: {e}")
             return {}
 
-    @abstractmethod
     def get_supported_names(self) -> List[str]:
-        """지원하는 파일 확장자 목록을 반환합니다."""
-        pass
+        """지원하는 파일 이름 패턴 목록을 반환합니다. (설정 우선, 없으면 등록 정보의 기본 패턴)"""
+        return list(configured_file_patterns(self.provider_config, self.default_file_patterns))
 
     @abstractmethod
     def parse_raw(self, file_path: Path) -> Dict[str, pd.DataFrame]:
@@ -84,20 +98,19 @@ class BaseProvider(ABC):
 
         try:
             # 지원하는 파일 찾기
-            file_path = self._find_input_file(input_dir)
-            if not file_path:
+            file_paths = self._find_input_files(input_dir)
+            if not file_paths:
                 logger.info("")
                 logger.info(f"{self.name}: 지원하는 파일을 찾을 수 없습니다 ⚠️")
                 logger.info("")
                 return result
 
-            logger.info(f"{self.name}: 파일 발견 - {file_path.name}")
+            logger.info(f"{self.name}: 파일 발견 - {', '.join(f.name for f in file_paths)}")
 
-            raw_datas = self.parse_raw(file_path)
-            # 각 데이터 타입별로 파싱 (하위 클래스의 추상화 함수 호출)
-            result["cash"] = self.parse_cash(raw_datas)
-            result["positions"] = self.parse_positions(raw_datas)
-            result["transactions"] = self.parse_transactions(raw_datas)
+            # 파일별 파싱 결과를 하나로 병합 (각 레코드는 source_file로 출처를 가짐)
+            for file_result in self._parse_files(file_paths):
+                for data_type in result:
+                    result[data_type].extend(file_result[data_type])
 
             # 계좌 매핑 적용
             result["cash"] = self._apply_account_mapping("cash", result["cash"])
@@ -108,42 +121,97 @@ class BaseProvider(ABC):
                 f"데이터 수집 완료 - 현금:{len(result['cash'])}건, "
                 f"포지션:{len(result['positions'])}건, 거래:{len(result['transactions'])}건 🟢"
             )
+        except MemoryError:
+            # 격리 워커의 메모리 한도 초과는 호출 측에서 보고
+            raise
         except Exception as e:
             logger.error(f"데이터 수집 실패 : {e} ❌")
         logger.info("")
 
         return result
 
-    def _find_input_file(self, input_dir: Path) -> Optional[Path]:
-        """입력 파일을 찾습니다."""
-        if not input_dir.exists():
-            return None
+    def parse_file(
+        self,
+        file_path: Path
+    ) -> Dict[str, Union[List[CashSchema], List[PositionSchema], List[TransactionSchema]]]:
+        """파일 하나를 파싱하고 각 레코드에 출처 파일명을 기록합니다."""
+        raw_datas = self.parse_raw(file_path)
+
+        # 각 데이터 타입별로 파싱 (하위 클래스의 추상화 함수 호출)
+        file_result = {
+            "cash": self.parse_cash(raw_datas),
+            "positions": self.parse_positions(raw_datas),
+            "transactions": self.parse_transactions(raw_datas),
+        }
+        for records in file_result.values():
+            for record in records:
+                record.source_file = file_path.name
 
-        names = self.get_supported_names()
-        files = []
-        for name in names:
-            files.extend(input_dir.glob(f"{name}"))
+        return file_result
 
+    def _parse_files(self, file_paths: List[Path]) -> List[Dict[str, List[Any]]]:
+        """
+        파일들을 파싱합니다.
+
+        파일이 여러 개면 워커 프로세스에서 병렬로 파싱하며, 결과는 파일 순서를 유지합니다.
+        메모리 예산에 가까우면 워커마다 원본을 따로 올리지 않도록 순차로 파싱합니다.
+        워커 풀이 깨지거나 Provider를 pickle할 수 없을 때만 순차 파싱으로 전환하고,
+        파싱 자체의 오류는 그대로 올려 보냅니다.
+
+        같은 계좌가 여러 파일에 있으면 결과에 두 번 들어가며, 수집 후 조정(reconcile)
+        단계에서 먼저 읽은 파일의 행만 남깁니다.
+        """
+        max_workers = min(
+            len(file_paths),
+            config_manager.get("performance.max_parse_workers") or os.cpu_count() or 1
+        )
+        if max_workers > 1 and memory_monitor.low_memory:
+            logger.info("%s: 메모리 예산에 가까워 순차 파싱합니다", self.name)
+            max_workers = 1
+        if max_workers <= 1:
+            return [self.parse_file(file_path) for file_path in file_paths]
+
+        try:
+            # 워커 로그는 메인 프로세스 리스너로 모아 출력
+            with ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=init_worker_logging,
+                initargs=(get_worker_log_queue(), logger.getEffectiveLevel())
+            ) as executor:
+                return list(executor.map(_parse_file_worker, [self] * len(file_paths), file_paths))
+        except (BrokenProcessPool, pickle.PicklingError) as e:
+            logger.error("%s: 병렬 파싱 실패, 순차 파싱으로 전환합니다 - %s", self.name, e)
+            return [self.parse_file(file_path) for file_path in file_paths]
+
+    def _find_input_files(self, input_dir: Path) -> List[Path]:
+        """지원하는 입력 파일을 모두 찾아 이름순으로 반환합니다."""
+        files = input_index.find_files(input_dir, self.get_supported_names())
+        # 압축 멤버는 전체 멤버 경로로 가리켜 하위 폴더의 같은 이름 파일을 구분
+        files = sorted(files, key=lambda f: (f.name, f.member or ""))
+        return [input_dir / (file.member or file.name) for file in files]
+
+    def _find_input_file(self, input_dir: Path) -> Optional[Path]:
+        """입력 파일을 찾습니다."""
+        files = input_index.find_files(input_dir, self.get_supported_names())
         if not files:
             return None
 
         # 가장 최근 파일 반환
-        return max(files, key=lambda f: f.stat().st_mtime)
+        latest = max(files, key=lambda f: f.mtime)
+        return input_dir / (latest.member or latest.name)
 
     # 공통 유틸리티 메서드들
     def _convert_to_number(self, value: Any) -> float:
-        """값을 숫자로 변환합니다."""
-        try:
-            if pd.isna(value) or value is None:
-                return 0.0
-            if isinstance(value, (int, float)):
-                return float(value)
-            if isinstance(value, str):
-                cleaned = re.sub(r'[^\d.-]', '', value.replace(',', ''))
-                return float(cleaned) if cleaned else 0.0
-            return 0.0
-        except (ValueError, TypeError):
-            return 0.0
+        """값을 숫자로 변환합니다. ("1,234원", "1.2만", "△500", "(1,000)" 등 지원)"""
+        return parse_number(value)
+
+    def _convert_columns(self, df: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
+        """DataFrame의 숫자 컬럼을 한 번에 변환합니다. 없는 컬럼은 건너뜁니다."""
+        df = df.copy()
+        for column in columns:
+            if column in df.columns:
+                df[column] = parse_numbers(df[column])
+        return df
 
     def _format_date(self, date_value: Any) -> str:
         """날짜를 YYYY-MM-DD 형식으로 변환합니다."""
@@ -161,13 +229,7 @@ class BaseProvider(ABC):
 
     def _extract_number_from_text(self, text: str) -> float:
         """텍스트에서 숫자를 추출합니다."""
-        try:
-            if not text:
-                return 0.0
-            cleaned = re.sub(r'[^\d.-]', '', str(text))
-            return float(cleaned) if cleaned else 0.0
-        except (ValueError, TypeError):
-            return 0.0
+        return parse_number(text)
 
     def _get_current_timestamp(self) -> str:
         """현재 타임스탬프를 반환합니다."""
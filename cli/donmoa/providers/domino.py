@@ -2,7 +2,7 @@
 도미노 증권 Provider
 """
 
-import re
+import io
 import quopri
 from datetime import datetime
 from pathlib import Path
@@ -12,28 +12,34 @@ import pandas as pd
 from bs4 import BeautifulSoup
 
 from ..schemas import CashSchema, PositionSchema, TransactionSchema
+from ..utils.archive import open_input
 from ..utils.logger import logger
+from ..utils.memory import memory_monitor
+from ..utils.money import from_minor, nano_product_to_minor, to_nano
 from .base import BaseProvider
+from .registry import builtin_file_patterns
 
 
 class DominoProvider(BaseProvider):
     """도미노 증권 MHTML 파일 파싱 Provider"""
 
+    default_file_patterns = builtin_file_patterns("domino")
+
     def __init__(self, name: str = "domino_securities", config: Optional[Dict[str, Any]] = None):
         super().__init__(name, config)
 
-    def get_supported_names(self) -> List[str]:
-        """지원하는 파일 이름 목록을 반환합니다."""
-        return ["domino.mhtml"]
-
     def parse_raw(self, file_path: Path) -> Dict[str, pd.DataFrame]:
         """원본 데이터를 파싱합니다."""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                content = quopri.decodestring(content.encode('latin1')).decode('utf-8', errors='ignore')
+            # quoted-printable 본문을 스트림에서 바로 디코딩 (압축 멤버도 동일)
+            decoded = io.BytesIO()
+            with open_input(file_path) as f:
+                quopri.decode(f, decoded)
+            content = decoded.getvalue().decode('utf-8', errors='ignore')
+            decoded.close()
 
             soup = BeautifulSoup(content, 'html.parser')
+            del content
 
             dict_datas = {
                 "cash": pd.DataFrame(),
@@ -53,10 +59,10 @@ class DominoProvider(BaseProvider):
                     spans = li.find_all("span")
                     if len(spans) >= 3:
                         currency = spans[2].get_text(strip=True)
-                        value_text = spans[-1].get_text(strip=True)
-                        amount = self._extract_number(value_text)
-                        cash_datas.append([currency, amount])
-                dict_datas["cash"] = pd.DataFrame(cash_datas, columns=cash_headers)
+                        cash_datas.append([currency, spans[-1].get_text(strip=True)])
+                dict_datas["cash"] = self._convert_columns(
+                    pd.DataFrame(cash_datas, columns=cash_headers), ["amount"]
+                )
 
             #########################################################
             # 포지션 데이터 파싱
@@ -86,20 +92,25 @@ class DominoProvider(BaseProvider):
                         if not account_name or account_name == "-":
                             continue
 
-                        amount = self._extract_number(cells[1].get_text(strip=True))
-                        quantity = self._extract_number(cells[2].get_text(strip=True))
-                        avg_price = self._extract_number(cells[3].get_text(strip=True))
-
-                        if amount > 0:  # 실제 보유량이 있는 경우만
-                            positions_datas.append({
-                                'account': account_name,
-                                'name': tmp_asset_info['name'],
-                                'ticker': tmp_asset_info['ticker'],
-                                'quantity': quantity,
-                                'average_price': avg_price,
-                            })
-
-                dict_datas["positions"] = pd.DataFrame(positions_datas, columns=positions_headers)
+                        positions_datas.append({
+                            'account': account_name,
+                            'name': tmp_asset_info['name'],
+                            'ticker': tmp_asset_info['ticker'],
+                            'amount': cells[1].get_text(strip=True),
+                            'quantity': cells[2].get_text(strip=True),
+                            'average_price': cells[3].get_text(strip=True),
+                        })
+
+                # 숫자 컬럼을 한 번에 변환한 뒤 실제 보유량이 있는 경우만 남김
+                df_positions = self._convert_columns(
+                    pd.DataFrame(positions_datas, columns=positions_headers + ["amount"]),
+                    ["amount", "quantity", "average_price"]
+                )
+                dict_datas["positions"] = df_positions[df_positions["amount"] > 0][positions_headers]
+
+            # 메모리 예산에 가까우면 파싱 트리의 순환 참조를 끊어 바로 회수되도록 함
+            if memory_monitor.low_memory:
+                soup.decompose()
 
             logger.info(f"현금 데이터 파싱 완료: {len(dict_datas['cash'])}건")
             logger.info(f"포지션 데이터 파싱 완료: {len(dict_datas['positions'])}건")
@@ -141,11 +152,15 @@ class DominoProvider(BaseProvider):
             if "현금성자산" not in name:
                 continue
 
+            # 평가액은 nano 정수 곱으로 계산해 실수 오차 없이 원 단위로 반올림
+            amount_minor = nano_product_to_minor(to_nano(quantity), to_nano(average_price), "KRW")
+
             cash_datas.append(CashSchema(
                 date=datetime.now().strftime("%Y-%m-%d"),
                 category="증권",
                 account=name,
-                balance=quantity * average_price,
+                balance=from_minor(amount_minor, "KRW"),
+                amount_minor=amount_minor,
                 currency="KRW",
                 provider=self.name,
                 collected_at=self._get_current_timestamp(),
@@ -203,14 +218,6 @@ class DominoProvider(BaseProvider):
             logger.error(f"자산 정보 추출 실패: {e}")
             return {}
 
-    def _extract_number(self, text: str) -> float:
-        """텍스트에서 숫자를 추출합니다"""
-        try:
-            cleaned = re.sub(r"[^\d.-]", "", text)
-            return float(cleaned) if cleaned else 0.0
-        except ValueError:
-            return 0.0
-
     def _convert_currency(self, currency: str) -> str:
         """통화를 변환합니다"""
         if currency == "원":
@@ -8,25 +8,25 @@ from typing import Dict, List, Optional, Any
 import openpyxl
 
 from .base import BaseProvider
-from ..schemas import CashSchema, PositionSchema, TransactionSchema
+from .registry import builtin_file_patterns
+from ..schemas import CashSchema, PositionSchema, TransactionSchema, validate_frame
+from ..utils.archive import open_seekable
 from ..utils.logger import logger
 
 
 class ManualProvider(BaseProvider):
     """수동 입력 데이터 Provider"""
 
+    default_file_patterns = builtin_file_patterns("manual")
+
     def __init__(self, name: str = "manual", config: Optional[Dict[str, Any]] = None):
         super().__init__(name, config)
 
-    def get_supported_names(self) -> List[str]:
-        """지원하는 파일 이름 목록을 반환합니다."""
-        return ["manual.xlsx"]
-
     def parse_raw(self, file_path: Path) -> Dict[str, pd.DataFrame]:
         """Excel 파일을 파싱합니다."""
         try:
             # Excel 파일 읽기
-            wb = openpyxl.load_workbook(file_path, data_only=True)
+            wb = openpyxl.load_workbook(open_seekable(file_path), data_only=True)
 
             data = {}
             sheet_mapping = {
@@ -76,115 +76,91 @@ class ManualProvider(BaseProvider):
 
     def parse_cash(self, data: Dict[str, pd.DataFrame]) -> List[CashSchema]:
         """현금 데이터를 파싱합니다."""
-        cash_list = []
-
-        if 'cash' not in data or data['cash'].empty:
-            return cash_list
-
-        df = data['cash']
-
-        for _, row in df.iterrows():
-            try:
-                # 필수 필드 검증
-                required_fields = ['date', 'category', 'account', 'balance']
-                if not all(field in df.columns for field in required_fields):
-                    logger.warning("현금 데이터에 필수 필드가 없습니다")
-                    continue
-
-                # 데이터 변환
-                cash = CashSchema(
-                    date=self._format_date(row.get('date', '')),
-                    category=str(row.get('category', '')),
-                    account=str(row.get('account', '')),
-                    balance=self._convert_to_number(row.get('balance', 0)),
-                    currency=str(row.get('currency', 'KRW')),
-                    provider=self.name,
-                    collected_at=self._get_current_timestamp()
-                )
-
-                cash_list.append(cash)
-
-            except Exception as e:
-                logger.warning(f"현금 데이터 파싱 실패: {e}")
-                continue
-
-        return cash_list
+        df = self._validated_rows(data, 'cash', CashSchema)
+        if df is None:
+            return []
+
+        collected_at = self._get_current_timestamp()
+        return [
+            CashSchema(
+                date=self._format_date(row['date']),
+                category=str(row['category']),
+                account=str(row['account']),
+                balance=row['balance'],
+                currency=self._text_or(row.get('currency'), 'KRW'),
+                provider=self.name,
+                collected_at=collected_at
+            )
+            for row in df.to_dict('records')
+        ]
 
     def parse_positions(self, data: Dict[str, pd.DataFrame]) -> List[PositionSchema]:
         """포지션 데이터를 파싱합니다."""
-        position_list = []
-
-        if 'position' not in data or data['position'].empty:
-            return position_list
-
-        df = data['position']
-
-        for _, row in df.iterrows():
-            try:
-                # 필수 필드 검증
-                required_fields = ['date', 'account', 'name', 'ticker', 'quantity', 'average_price']
-                if not all(field in df.columns for field in required_fields):
-                    logger.warning("포지션 데이터에 필수 필드가 없습니다")
-                    continue
-
-                # 데이터 변환
-                position = PositionSchema(
-                    date=self._format_date(row.get('date', '')),
-                    account=str(row.get('account', '')),
-                    name=str(row.get('name', '')),
-                    ticker=str(row.get('ticker', '')),
-                    quantity=self._convert_to_number(row.get('quantity', 0)),
-                    average_price=self._convert_to_number(row.get('average_price', 0)),
-                    currency=str(row.get('currency', 'KRW')),
-                    provider=self.name,
-                    collected_at=self._get_current_timestamp()
-                )
-
-                position_list.append(position)
-
-            except Exception as e:
-                logger.warning(f"포지션 데이터 파싱 실패: {e}")
-                continue
-
-        return position_list
+        df = self._validated_rows(data, 'position', PositionSchema)
+        if df is None:
+            return []
+
+        collected_at = self._get_current_timestamp()
+        return [
+            PositionSchema(
+                date=self._format_date(row['date']),
+                account=str(row['account']),
+                name=str(row['name']),
+                ticker=str(row['ticker']),
+                quantity=row['quantity'],
+                average_price=row['average_price'],
+                currency=self._text_or(row.get('currency'), 'KRW'),
+                provider=self.name,
+                collected_at=collected_at
+            )
+            for row in df.to_dict('records')
+        ]
 
     def parse_transactions(self, data: Dict[str, pd.DataFrame]) -> List[TransactionSchema]:
         """거래 데이터를 파싱합니다."""
-        transaction_list = []
-
-        if 'transaction' not in data or data['transaction'].empty:
-            return transaction_list
-
-        df = data['transaction']
-
-        for _, row in df.iterrows():
-            try:
-                # 필수 필드 검증
-                required_fields = ['date', 'account', 'transaction_type', 'amount', 'category']
-                if not all(field in df.columns for field in required_fields):
-                    logger.warning("거래 데이터에 필수 필드가 없습니다")
-                    continue
-
-                # 데이터 변환
-                transaction = TransactionSchema(
-                    date=self._format_date(row.get('date', '')),
-                    account=str(row.get('account', '')),
-                    transaction_type=str(row.get('transaction_type', '')),
-                    amount=self._convert_to_number(row.get('amount', 0)),
-                    category=str(row.get('category', '')),
-                    category_detail=(str(row.get('category_detail', ''))
-                                     if pd.notna(row.get('category_detail')) else None),
-                    currency=str(row.get('currency', 'KRW')),
-                    note=(str(row.get('note', ''))
-                          if pd.notna(row.get('note')) else None),
-                    provider=self.name,
-                    collected_at=self._get_current_timestamp()
-                )
-
-                transaction_list.append(transaction)
-
-            except Exception as e:
-                logger.warning(f"거래 데이터 파싱 실패: {e}")
-                continue
-
-        return transaction_list
+        df = self._validated_rows(data, 'transaction', TransactionSchema)
+        if df is None:
+            return []
+
+        collected_at = self._get_current_timestamp()
+        return [
+            TransactionSchema(
+                date=self._format_date(row['date']),
+                account=str(row['account']),
+                transaction_type=str(row['transaction_type']),
+                amount=row['amount'],
+                category=str(row['category']),
+                category_detail=self._text_or(row.get('category_detail'), None),
+                currency=self._text_or(row.get('currency'), 'KRW'),
+                note=self._text_or(row.get('note'), None),
+                provider=self.name,
+                collected_at=collected_at
+            )
+            for row in df.to_dict('records')
+        ]
+
+    def _validated_rows(self, data: Dict[str, pd.DataFrame], key: str, schema: type) -> Optional[pd.DataFrame]:
+        """
+        시트를 스키마로 검증하고 유효한 행만 반환합니다.
+
+        오류는 행마다 경고하지 않고 시트별 요약 한 줄로 기록합니다.
+        시트가 없거나 필수 컬럼이 없으면 None을 반환합니다.
+        """
+        if key not in data or data[key].empty:
+            return None
+
+        df, report = validate_frame(data[key], schema)
+        if report.missing_columns:
+            logger.warning("⚠️ %s 시트 %s", key, report.summary())
+            return None
+        if not report.is_valid:
+            # 엑셀 행 번호 = 0부터 센 위치 + 헤더 1행 + 1
+            logger.warning("⚠️ %s 시트 %s", key, report.summary(row_offset=2))
+        return df[report.valid_mask]
+
+    @staticmethod
+    def _text_or(value: Any, default: Optional[str]) -> Optional[str]:
+        """비어 있지 않은 값은 문자열로, 비어 있으면 기본값을 반환합니다."""
+        if value is None or (isinstance(value, float) and pd.isna(value)):
+            return default
+        return str(value)
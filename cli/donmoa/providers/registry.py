@@ -0,0 +1,122 @@
+"""
+Provider 레지스트리
+
+내장 Provider와 `donmoa.providers` 엔트리 포인트로 등록된 외부 Provider의
+등록 정보(ProviderSpec)를 모읍니다. 각 등록 정보는 처리할 파일 패턴을 미리
+선언하므로, 대상 폴더에 해당 파일이 있는 Provider만 import 및 생성됩니다.
+
+파일 패턴은 등록 정보 한 곳에만 선언합니다. `providers.<이름>.file_patterns` 설정이
+있으면 그 값이 우선하며, Provider 선택과 Provider의 입력 파일 탐색
+(BaseProvider.get_supported_names)이 같은 규칙(configured_file_patterns)을 사용합니다.
+
+외부 패키지는 다음과 같이 ProviderSpec 객체를 엔트리 포인트로 노출합니다.
+
+    [project.entry-points."donmoa.providers"]
+    mybank = "donmoa_mybank.spec:PROVIDER_SPEC"
+
+    # donmoa_mybank/spec.py (가벼운 모듈)
+    PROVIDER_SPEC = ProviderSpec(
+        name="mybank",
+        target="donmoa_mybank.provider:MyBankProvider",
+        file_patterns=("mybank*.csv",),
+    )
+"""
+
+import importlib
+from dataclasses import dataclass
+from fnmatch import fnmatch
+from importlib.metadata import entry_points
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from ..utils.config import config_manager
+from ..utils.logger import logger
+
+
+ENTRY_POINT_GROUP = "donmoa.providers"
+
+
+def configured_file_patterns(provider_config: Optional[Dict[str, Any]], default: Iterable[str]) -> Tuple[str, ...]:
+    """Provider 설정의 file_patterns(문자열 또는 목록)가 있으면 그 값을, 없으면 기본 패턴을 반환합니다."""
+    configured = (provider_config or {}).get("file_patterns")
+    if isinstance(configured, str):
+        configured = [configured]
+    return tuple(configured) if configured else tuple(default)
+
+
+@dataclass(frozen=True)
+class ProviderSpec:
+    """Provider 등록 정보 (file_patterns는 설정이 없을 때의 기본 패턴)"""
+    name: str
+    target: str
+    file_patterns: Tuple[str, ...]
+
+    def patterns(self) -> Tuple[str, ...]:
+        """providers.<이름>.file_patterns 설정을 반영한 파일 패턴"""
+        return configured_file_patterns(config_manager.get(f"providers.{self.name}"), self.file_patterns)
+
+    def matches(self, file_names: Iterable[str]) -> bool:
+        """파일 이름 중 하나라도 패턴과 일치하는지 확인합니다."""
+        patterns = self.patterns()
+        return any(
+            fnmatch(file_name, pattern)
+            for file_name in file_names
+            for pattern in patterns
+        )
+
+    def load_class(self):
+        """target("모듈:클래스")을 import해 Provider 클래스를 반환합니다."""
+        module_name, _, class_name = self.target.partition(":")
+        module = importlib.import_module(module_name)
+        return getattr(module, class_name)
+
+    def create(self, config: Optional[Dict[str, Any]] = None):
+        """Provider 인스턴스를 생성합니다. 기본 파일 패턴은 등록 정보의 값을 사용합니다."""
+        provider = self.load_class()(self.name, config)
+        provider.default_file_patterns = tuple(self.file_patterns)
+        return provider
+
+
+BUILTIN_PROVIDERS: List[ProviderSpec] = [
+    ProviderSpec("domino", "donmoa.providers.domino:DominoProvider", ("domino*.mhtml",)),
+    ProviderSpec("banksalad", "donmoa.providers.banksalad:BanksaladProvider", ("banksalad*.xlsx",)),
+    ProviderSpec("manual", "donmoa.providers.manual:ManualProvider", ("manual*.xlsx",)),
+]
+
+
+def builtin_file_patterns(name: str) -> Tuple[str, ...]:
+    """내장 Provider 등록 정보의 기본 파일 패턴 (Provider 클래스의 default_file_patterns)"""
+    for spec in BUILTIN_PROVIDERS:
+        if spec.name == name:
+            return spec.file_patterns
+    raise KeyError(name)
+
+
+def _iter_entry_points():
+    """엔트리 포인트 그룹을 Python 버전에 맞게 조회합니다."""
+    eps = entry_points()
+    if hasattr(eps, "select"):
+        return eps.select(group=ENTRY_POINT_GROUP)
+    return eps.get(ENTRY_POINT_GROUP, [])
+
+
+def discover_providers() -> List[ProviderSpec]:
+    """내장 Provider와 엔트리 포인트 Provider의 등록 정보를 반환합니다."""
+    specs = {spec.name: spec for spec in BUILTIN_PROVIDERS}
+
+    for ep in _iter_entry_points():
+        try:
+            spec = ep.load()
+            if not isinstance(spec, ProviderSpec):
+                logger.warning(f"Provider 엔트리 포인트가 ProviderSpec이 아닙니다: {ep.name}")
+                continue
+            specs[spec.name] = spec
+        except Exception as e:
+            logger.warning(f"Provider 엔트리 포인트 로드 실패 ({ep.name}): {e}")
+
+    return list(specs.values())
+
+
+def select_providers(specs: Iterable[ProviderSpec], file_names: Iterable[str]) -> List[ProviderSpec]:
+    """파일 이름 목록과 패턴이 일치하는 등록 정보만 반환합니다."""
+    file_names = list(file_names)
+    return [spec for spec in specs if spec.matches(file_names)]
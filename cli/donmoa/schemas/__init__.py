@@ -3,5 +3,6 @@
 """
 
 from .schemas import CashSchema, PositionSchema, TransactionSchema
+from .validation import ValidationReport, validate_frame
 
-__all__ = ['CashSchema', 'PositionSchema', 'TransactionSchema']
+__all__ = ['CashSchema', 'PositionSchema', 'TransactionSchema', 'ValidationReport', 'validate_frame']
@@ -0,0 +1,131 @@
+"""
+마이그레이션 SQL에서 서버 제약 조건을 추출해 server_constraints.py를 생성합니다.
+
+packages/database/migrations/*.sql의 CREATE TABLE 문에서 다음을 읽습니다.
+- NOT NULL 컬럼 (기본값이 있거나 서버가 채우는 컬럼 제외)
+- CHECK (컬럼 IN (...)) 열거값
+- UNIQUE 제약의 컬럼 조합
+
+사용법 (cli 디렉토리에서):
+    python -m donmoa.schemas.migration_constraints ../packages/database/migrations [--output 경로]
+
+업로드 테이블(UPLOAD_TABLES)을 모두 찾았을 때만 임시 파일에 쓴 뒤 대상 파일을 교체합니다.
+"""
+
+import argparse
+import json
+import re
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# 서버가 채우는 컬럼은 검증 대상에서 제외
+SERVER_FILLED_COLUMNS = {"id", "user_id", "snapshot_id", "created_at", "updated_at"}
+
+_TABLE_RE = re.compile(r"CREATE TABLE IF NOT EXISTS (\w+)\s*\((.*?)\n\);", re.S)
+_CHECK_IN_RE = re.compile(r"CHECK\s*\(\s*(\w+)\s+IN\s*\(([^)]*)\)\s*\)", re.I)
+_UNIQUE_RE = re.compile(r"UNIQUE\s*\(([^)]*)\)", re.I)
+
+OUTPUT_HEADER = '''"""
+서버 DB 제약 조건 (자동 생성 파일 - 직접 수정하지 마세요)
+
+생성: python -m donmoa.schemas.migration_constraints ../packages/database/migrations
+"""
+
+'''
+
+
+def parse_migration_sql(sql: str) -> Dict[str, Dict[str, Any]]:
+    """
+    SQL 텍스트에서 테이블별 제약 조건을 추출합니다.
+
+    Returns:
+        {테이블: {"not_null": [...], "enums": {컬럼: [...]}, "unique": [[...]]}}
+    """
+    sql = re.sub(r"--[^\n]*", "", sql)
+    tables: Dict[str, Dict[str, Any]] = {}
+
+    for name, body in _TABLE_RE.findall(sql):
+        not_null: List[str] = []
+        enums: Dict[str, List[str]] = {}
+        unique: List[List[str]] = []
+
+        for line in body.split("\n"):
+            line = line.strip().rstrip(",")
+            if not line:
+                continue
+
+            unique_match = _UNIQUE_RE.search(line)
+            if line.upper().startswith("CONSTRAINT") or line.upper().startswith("UNIQUE"):
+                if unique_match:
+                    columns = [c.strip() for c in unique_match.group(1).split(",")]
+                    unique.append([c for c in columns if c not in SERVER_FILLED_COLUMNS])
+                continue
+
+            column = line.split()[0]
+            if column in SERVER_FILLED_COLUMNS:
+                continue
+
+            upper = line.upper()
+            if "NOT NULL" in upper and " DEFAULT " not in upper and "PRIMARY KEY" not in upper:
+                not_null.append(column)
+
+            for enum_column, values in _CHECK_IN_RE.findall(line):
+                enums[enum_column] = re.findall(r"'([^']*)'", values)
+
+        tables[name] = {"not_null": not_null, "enums": enums, "unique": unique}
+
+    return tables
+
+
+def parse_migrations(migrations_dir: Path) -> Dict[str, Dict[str, Any]]:
+    """디렉토리의 모든 마이그레이션을 파일명 순서로 읽어 합칩니다."""
+    tables: Dict[str, Dict[str, Any]] = {}
+    for path in sorted(Path(migrations_dir).glob("*.sql")):
+        tables.update(parse_migration_sql(path.read_text(encoding="utf-8")))
+    return tables
+
+
+def render_module(tables: Dict[str, Dict[str, Any]], table_names: List[str]) -> str:
+    """server_constraints.py 소스를 만듭니다."""
+    selected = {name: tables[name] for name in table_names if name in tables}
+    return OUTPUT_HEADER + "TABLE_CONSTRAINTS = " + json.dumps(selected, indent=4, ensure_ascii=False) + "\n"
+
+
+# CLI 업로드와 관련된 테이블
+UPLOAD_TABLES = ["snapshots", "snapshot_cash", "snapshot_positions", "snapshot_transactions"]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """마이그레이션 디렉토리를 읽어 server_constraints.py를 생성합니다. 종료 코드를 반환합니다."""
+    parser = argparse.ArgumentParser(
+        prog="python -m donmoa.schemas.migration_constraints",
+        description="마이그레이션 SQL에서 서버 제약 조건을 추출해 server_constraints.py를 생성합니다.",
+    )
+    parser.add_argument("migrations_dir", type=Path, help="마이그레이션 SQL 디렉토리 (*.sql)")
+    parser.add_argument(
+        "--output", "-o", type=Path, default=Path(__file__).with_name("server_constraints.py"),
+        help="생성할 파일 (기본: donmoa/schemas/server_constraints.py)",
+    )
+    args = parser.parse_args(argv)
+
+    if not args.migrations_dir.is_dir() or not any(args.migrations_dir.glob("*.sql")):
+        print(f"ERROR: *.sql 파일이 있는 디렉토리가 아닙니다: {args.migrations_dir}", file=sys.stderr)
+        return 1
+
+    tables = parse_migrations(args.migrations_dir)
+    missing = [name for name in UPLOAD_TABLES if name not in tables]
+    if missing:
+        print(f"ERROR: 업로드 테이블을 찾지 못해 생성하지 않습니다: {', '.join(missing)}", file=sys.stderr)
+        return 1
+
+    output = args.output
+    tmp_path = output.with_name(f"{output.name}.tmp")
+    tmp_path.write_text(render_module(tables, UPLOAD_TABLES), encoding="utf-8")
+    tmp_path.replace(output)
+    print(f"생성 완료: {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
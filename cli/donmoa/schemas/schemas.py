@@ -2,9 +2,14 @@
 공통 데이터 스키마 정의
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional, Dict, Any
 
+from ..utils.money import to_minor, to_nano
+
+# 수집/변환 중에 채워지는 내부 필드 표시 (수동 입력 템플릿 헤더에서 제외)
+INTERNAL = {"internal": True}
+
 
 @dataclass
 class CashSchema:
@@ -16,6 +21,13 @@ class CashSchema:
     currency: str = "KRW"
     provider: Optional[str] = None
     collected_at: Optional[str] = None
+    source_file: Optional[str] = field(default=None, metadata=INTERNAL)
+    amount_minor: Optional[int] = field(default=None, metadata=INTERNAL)
+
+    def __post_init__(self):
+        # 통화별 최소 단위 정수 금액 (DB snapshot_cash.amount_minor)
+        if self.amount_minor is None:
+            self.amount_minor = to_minor(self.balance, self.currency)
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -25,7 +37,9 @@ class CashSchema:
             "balance": self.balance,
             "currency": self.currency,
             "provider": self.provider,
-            "collected_at": self.collected_at
+            "collected_at": self.collected_at,
+            "source_file": self.source_file,
+            "amount_minor": self.amount_minor
         }
 
 
@@ -41,6 +55,20 @@ class PositionSchema:
     currency: str = "KRW"
     provider: Optional[str] = None
     collected_at: Optional[str] = None
+    source_file: Optional[str] = field(default=None, metadata=INTERNAL)
+    qty_nano: Optional[int] = field(default=None, metadata=INTERNAL)
+    price_nano: Optional[int] = field(default=None, metadata=INTERNAL)
+    # 종목 마스터 캐시에서 해석한 값 (InstrumentCache.resolve_positions)
+    isin: Optional[str] = field(default=None, metadata=INTERNAL)
+    asset_class: Optional[str] = field(default=None, metadata=INTERNAL)
+    instrument_id: Optional[int] = field(default=None, metadata=INTERNAL)
+
+    def __post_init__(self):
+        # 수량/단가 × 10^9 정수 (DB snapshot_positions.qty_nano)
+        if self.qty_nano is None:
+            self.qty_nano = to_nano(self.quantity)
+        if self.price_nano is None:
+            self.price_nano = to_nano(self.average_price)
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -52,7 +80,13 @@ class PositionSchema:
             "average_price": self.average_price,
             "currency": self.currency,
             "provider": self.provider,
-            "collected_at": self.collected_at
+            "collected_at": self.collected_at,
+            "source_file": self.source_file,
+            "qty_nano": self.qty_nano,
+            "price_nano": self.price_nano,
+            "isin": self.isin,
+            "asset_class": self.asset_class,
+            "instrument_id": self.instrument_id
         }
 
 
@@ -69,6 +103,13 @@ class TransactionSchema:
     note: Optional[str] = None
     provider: Optional[str] = None
     collected_at: Optional[str] = None
+    source_file: Optional[str] = field(default=None, metadata=INTERNAL)
+    amount_minor: Optional[int] = field(default=None, metadata=INTERNAL)
+
+    def __post_init__(self):
+        # 통화별 최소 단위 정수 금액 (DB snapshot_transactions.amount_minor)
+        if self.amount_minor is None:
+            self.amount_minor = to_minor(self.amount, self.currency)
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -81,5 +122,7 @@ class TransactionSchema:
             "currency": self.currency,
             "note": self.note,
             "provider": self.provider,
-            "collected_at": self.collected_at
+            "collected_at": self.collected_at,
+            "source_file": self.source_file,
+            "amount_minor": self.amount_minor
         }
@@ -0,0 +1,81 @@
+"""
+서버 DB 제약 조건 (자동 생성 파일 - 직접 수정하지 마세요)
+
+생성: python -m donmoa.schemas.migration_constraints ../packages/database/migrations
+"""
+
+TABLE_CONSTRAINTS = {
+    "snapshots": {
+        "not_null": [
+            "snapshot_date",
+            "source"
+        ],
+        "enums": {
+            "source": [
+                "cli",
+                "manual",
+                "banksalad",
+                "domino",
+                "web"
+            ],
+            "status": [
+                "pending",
+                "processing",
+                "completed",
+                "failed"
+            ]
+        },
+        "unique": []
+    },
+    "snapshot_cash": {
+        "not_null": [
+            "account_id",
+            "currency",
+            "amount_minor"
+        ],
+        "enums": {},
+        "unique": [
+            [
+                "account_id",
+                "currency"
+            ]
+        ]
+    },
+    "snapshot_positions": {
+        "not_null": [
+            "account_id",
+            "instrument_id",
+            "qty_nano",
+            "currency"
+        ],
+        "enums": {},
+        "unique": [
+            [
+                "account_id",
+                "instrument_id"
+            ]
+        ]
+    },
+    "snapshot_transactions": {
+        "not_null": [
+            "account_id",
+            "trade_datetime",
+            "type",
+            "currency"
+        ],
+        "enums": {
+            "type": [
+                "buy",
+                "sell",
+                "dividend",
+                "fee",
+                "transfer",
+                "deposit",
+                "withdraw",
+                "interest",
+                "other"
+            ]
+        },
+        "unique": []
+    }
+}
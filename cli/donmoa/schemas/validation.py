@@ -0,0 +1,196 @@
+"""
+스키마 기반 DataFrame 검증
+
+schemas.py의 dataclass 정의에서 필수 필드(기본값 없는 필드)와 타입을 읽어
+DataFrame 전체를 컬럼 단위로 한 번에 검사합니다. 필수 컬럼은 한 번만 확인하고,
+값 검사는 행 반복 없이 컬럼 전체에 대한 불리언 마스크로 계산합니다.
+"""
+
+from dataclasses import MISSING, dataclass, field, fields
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+import numpy as np
+import pandas as pd
+
+from ..utils.number_utils import parse_numbers
+from .schemas import PositionSchema
+
+# 검증 대상이 아닌 필드 (Provider가 채우거나 다른 값에서 계산됨)
+SYSTEM_FIELDS = {
+    "provider", "collected_at", "source_file", "amount_minor", "qty_nano", "price_nano",
+    "isin", "asset_class", "instrument_id",
+}
+
+# 스키마별 값 범위 규칙: 필드 → (최솟값, 최댓값), None은 제한 없음
+RANGE_RULES: Dict[type, Dict[str, Tuple[Optional[float], Optional[float]]]] = {
+    PositionSchema: {
+        "quantity": (0, None),
+        "average_price": (0, None),
+    },
+}
+
+# 날짜 필드 형식
+DATE_FIELDS = {"date"}
+DATE_FORMAT = "%Y-%m-%d"
+
+# 로그에 표시할 최대 오류 수
+MAX_LOGGED_ERRORS = 10
+
+
+@dataclass
+class ValidationReport:
+    """검증 결과"""
+    schema: str
+    total_rows: int
+    missing_columns: List[str] = field(default_factory=list)
+    # 행 위치(0부터), 컬럼, 오류 코드
+    errors: pd.DataFrame = field(
+        default_factory=lambda: pd.DataFrame({"row": [], "column": [], "error": []})
+    )
+    valid_mask: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=bool))
+
+    @property
+    def is_valid(self) -> bool:
+        """모든 행이 유효한지 여부"""
+        return not self.missing_columns and self.errors.empty
+
+    @property
+    def invalid_rows(self) -> int:
+        """오류가 있는 행 수"""
+        return int(self.total_rows - self.valid_mask.sum())
+
+    def summary(self, row_offset: int = 0, limit: int = MAX_LOGGED_ERRORS) -> str:
+        """
+        사람이 읽을 수 있는 요약을 반환합니다.
+
+        Args:
+            row_offset: 표시할 행 번호에 더할 값 (엑셀 헤더 행 보정 등)
+            limit: 표시할 최대 오류 수
+        """
+        if self.missing_columns:
+            return f"{self.schema}: 필수 컬럼 없음 ({', '.join(self.missing_columns)})"
+        if self.errors.empty:
+            return f"{self.schema}: {self.total_rows}행 모두 유효"
+
+        head = self.errors.head(limit)
+        details = ", ".join(
+            f"{row + row_offset}행 {column} {error}"
+            for row, column, error in zip(head["row"], head["column"], head["error"])
+        )
+        more = len(self.errors) - len(head)
+        if more > 0:
+            details += f" 외 {more}건"
+        return f"{self.schema}: {self.invalid_rows}/{self.total_rows}행 오류 - {details}"
+
+
+def schema_rules(schema: Type[Any]) -> Tuple[List[str], List[str], List[str]]:
+    """
+    스키마 정의에서 검증 규칙을 읽습니다.
+
+    Returns:
+        (필수 필드, 숫자 필드, 문자열 필드)
+    """
+    required, numeric, text = [], [], []
+    for f in fields(schema):
+        if f.name in SYSTEM_FIELDS:
+            continue
+        if f.default is MISSING and f.default_factory is MISSING:
+            required.append(f.name)
+        if f.type in (float, int, "float", "int"):
+            numeric.append(f.name)
+        elif f.type in (str, "str"):
+            text.append(f.name)
+    return required, numeric, text
+
+
+def validate_frame(df: pd.DataFrame, schema: Type[Any]) -> Tuple[pd.DataFrame, ValidationReport]:
+    """
+    DataFrame을 스키마 기준으로 검증합니다.
+
+    숫자 필드는 parse_numbers로 변환한 값으로 바꿔 반환하므로 호출 측에서
+    다시 변환할 필요가 없습니다.
+
+    Args:
+        df: 검증할 DataFrame
+        schema: CashSchema, PositionSchema, TransactionSchema 등 dataclass
+
+    Returns:
+        (숫자 컬럼을 변환한 DataFrame, 검증 결과)
+    """
+    required, numeric, text = schema_rules(schema)
+    report = ValidationReport(schema=schema.__name__, total_rows=len(df))
+
+    report.missing_columns = [name for name in required if name not in df.columns]
+    if report.missing_columns:
+        report.valid_mask = np.zeros(len(df), dtype=bool)
+        return df, report
+
+    df = df.reset_index(drop=True)
+    checks: List[Tuple[str, str, np.ndarray]] = []
+
+    for name in text:
+        if name not in df.columns:
+            continue
+        codes, uniques = pd.factorize(df[name], use_na_sentinel=True)
+        # 값 검사는 고유값에만 수행하고 코드로 행에 펼침 (-1은 결측값)
+        missing = codes < 0
+        unique_text = pd.Series(uniques, dtype=object).astype(str)
+        blank = missing | _expand(unique_text.str.strip() == "", codes)
+        if name in required:
+            checks.append((name, "필수값 누락", blank))
+        if name in DATE_FIELDS:
+            dates = pd.to_datetime(unique_text.str.slice(0, 10), format=DATE_FORMAT, errors="coerce")
+            checks.append((name, "날짜 형식 오류", _expand(dates.isna(), codes) & ~blank))
+
+    numeric_values: Dict[str, np.ndarray] = {}
+    for name in numeric:
+        if name not in df.columns:
+            continue
+        codes, uniques = pd.factorize(df[name], use_na_sentinel=True)
+        values = parse_numbers(pd.Series(uniques), default=np.nan)
+        values = np.append(values, np.nan)[codes]
+        numeric_values[name] = values
+        invalid = np.isnan(values)
+        blank = codes < 0
+        if name in required:
+            checks.append((name, "필수값 누락", blank))
+        checks.append((name, "숫자 아님", invalid & ~blank))
+
+        low, high = RANGE_RULES.get(schema, {}).get(name, (None, None))
+        if low is not None:
+            checks.append((name, f"{low} 미만", ~invalid & (values < low)))
+        if high is not None:
+            checks.append((name, f"{high} 초과", ~invalid & (values > high)))
+
+    apply_checks(report, checks, len(df))
+
+    if numeric_values:
+        df = df.assign(**{name: np.nan_to_num(values, nan=0.0) for name, values in numeric_values.items()})
+    return df, report
+
+
+def apply_checks(report: ValidationReport, checks: List[Tuple[str, str, np.ndarray]], total_rows: int) -> None:
+    """(컬럼, 오류 코드, 행 마스크) 목록으로 보고서의 오류 목록과 유효 행 마스크를 채웁니다."""
+    valid = np.ones(total_rows, dtype=bool)
+    rows, columns, codes = [], [], []
+    for name, code, mask in checks:
+        positions = np.flatnonzero(mask)
+        if positions.size:
+            valid[positions] = False
+            rows.append(positions)
+            columns.append(np.full(positions.size, name, dtype=object))
+            codes.append(np.full(positions.size, code, dtype=object))
+
+    if rows:
+        errors = pd.DataFrame({
+            "row": np.concatenate(rows),
+            "column": np.concatenate(columns),
+            "error": np.concatenate(codes),
+        })
+        report.errors = errors.sort_values("row", kind="stable").reset_index(drop=True)
+    report.valid_mask = valid
+
+
+def _expand(unique_mask: pd.Series, codes: np.ndarray) -> np.ndarray:
+    """고유값별 마스크를 factorize 코드로 전체 행에 펼칩니다. 결측값(-1)은 False입니다."""
+    return np.append(np.asarray(unique_mask, dtype=bool), False)[codes]
@@ -0,0 +1,142 @@
+"""
+압축 입력 유틸리티
+
+data/input/<날짜>.zip, <날짜>.tar.gz 처럼 보관된 날짜 폴더를 풀지 않고 읽습니다.
+압축 파일 안의 파일은 `<압축 파일 경로>/<멤버 경로>` 형태의 가상 경로로 다루며,
+open_input/open_seekable이 일반 파일과 압축 멤버를 구분해 스트림을 엽니다.
+멤버는 전체 경로로 찾으므로 서로 다른 하위 폴더의 같은 이름 파일이 섞이지 않습니다.
+"""
+
+import io
+import os
+import tarfile
+import time
+import zipfile
+from functools import lru_cache
+from pathlib import Path, PurePosixPath
+from typing import BinaryIO, Dict, List, Optional, Tuple, Union
+
+ARCHIVE_SUFFIXES = (".tar.gz", ".tgz", ".tar", ".zip")
+
+
+def archive_stem(name: str) -> Optional[str]:
+    """압축 파일 이름이면 확장자를 뺀 이름을, 아니면 None을 반환합니다."""
+    lowered = name.lower()
+    for suffix in ARCHIVE_SUFFIXES:
+        if lowered.endswith(suffix):
+            return name[:-len(suffix)]
+    return None
+
+
+def list_archive_members(archive_path: Path) -> List[Tuple[str, int, float, str]]:
+    """
+    압축 파일의 멤버를 (파일명, 크기, 수정 시각, 멤버 경로) 목록으로 반환합니다.
+
+    멤버가 하위 폴더(예: 2024-01-01/domino.mhtml)에 있어도 파일명으로 노출되며(패턴 매칭용),
+    가상 경로는 멤버 경로로 만듭니다.
+    """
+    stat = os.stat(archive_path)
+    return list(_members(str(archive_path), stat.st_mtime_ns))
+
+
+@lru_cache(maxsize=64)
+def _members(archive_path: str, mtime_ns: int) -> Tuple[Tuple[str, int, float, str], ...]:
+    """압축 파일 목록을 읽습니다. (경로, mtime) 단위로 캐시됩니다."""
+    members = []
+    if archive_path.lower().endswith(".zip"):
+        with zipfile.ZipFile(archive_path) as zf:
+            for info in zf.infolist():
+                if info.is_dir():
+                    continue
+                mtime = _zip_mtime(info)
+                members.append((Path(info.filename).name, info.file_size, mtime, info.filename))
+    else:
+        with tarfile.open(archive_path, "r:*") as tf:
+            for info in tf:
+                if not info.isfile():
+                    continue
+                members.append((Path(info.name).name, info.size, float(info.mtime), info.name))
+    return tuple(members)
+
+
+def _zip_mtime(info: zipfile.ZipInfo) -> float:
+    return time.mktime(info.date_time + (0, 0, -1))
+
+
+def split_archive_path(path: Path) -> Optional[Tuple[Path, str]]:
+    """
+    가상 경로가 압축 멤버를 가리키면 (압축 파일, 멤버 경로)를 반환합니다.
+
+    멤버는 압축 파일 아래의 전체 경로로 찾습니다. 파일명만 주어졌으면 그 이름의 멤버가
+    하나일 때만 허용하고, 여러 하위 폴더에 있으면 어느 것인지 알 수 없으므로 오류로 봅니다.
+
+    Raises:
+        FileNotFoundError: 압축 파일에 멤버가 없음
+        ValueError: 파일명만으로는 멤버를 하나로 정할 수 없음
+    """
+    archive_path = next(
+        (parent for parent in path.parents if archive_stem(parent.name) is not None and parent.is_file()),
+        None
+    )
+    if archive_path is None:
+        return None
+
+    member_path = path.relative_to(archive_path).as_posix()
+    # tar 멤버의 "./" 접두사 등은 가상 경로에서 사라지므로 정규화한 경로로 비교
+    members: Dict[str, str] = {
+        PurePosixPath(member).as_posix(): member for _, _, _, member in list_archive_members(archive_path)
+    }
+    if member_path in members:
+        return archive_path, members[member_path]
+
+    matches = [member for normalized, member in members.items() if PurePosixPath(normalized).name == member_path]
+    if len(matches) > 1:
+        raise ValueError(f"압축 파일에 같은 이름의 멤버가 여러 개 있습니다: {path} ({', '.join(sorted(matches))})")
+    if not matches:
+        raise FileNotFoundError(f"압축 파일에 멤버가 없습니다: {path}")
+    return archive_path, matches[0]
+
+
+def open_input(path: Path) -> BinaryIO:
+    """일반 파일 또는 압축 멤버를 바이너리 스트림으로 엽니다."""
+    located = split_archive_path(path)
+    if located is None:
+        return open(path, "rb")
+
+    archive_path, member = located
+    if archive_path.name.lower().endswith(".zip"):
+        zf = zipfile.ZipFile(archive_path)
+        stream = zf.open(member)
+        return _ClosingStream(stream, zf)
+
+    tf = tarfile.open(archive_path, "r:*")
+    stream = tf.extractfile(member)
+    return _ClosingStream(stream, tf)
+
+
+def open_seekable(path: Path) -> Union[Path, io.BytesIO]:
+    """
+    탐색 가능한 입력을 반환합니다.
+
+    일반 파일은 경로를 그대로 반환하고, 압축 멤버는 메모리 버퍼로 읽어 반환합니다.
+    (xlsx는 zip 구조라 임의 접근이 필요합니다)
+    """
+    if split_archive_path(path) is None:
+        return path
+
+    with open_input(path) as f:
+        return io.BytesIO(f.read())
+
+
+class _ClosingStream(io.BufferedReader):
+    """멤버 스트림을 닫을 때 압축 파일 핸들도 함께 닫습니다."""
+
+    def __init__(self, stream, owner):
+        super().__init__(stream)
+        self._owner = owner
+
+    def close(self) -> None:
+        try:
+            super().close()
+        finally:
+            self._owner.close()
@@ -5,6 +5,9 @@ from pathlib import Path
 from datetime import datetime
 from typing import Optional
 
+from .archive import archive_stem
+from .input_index import input_index
+
 
 def extract_date_from_folder_name(folder_path: Path) -> Optional[str]:
     """
@@ -17,6 +20,24 @@ def extract_date_from_folder_name(folder_path: Path) -> Optional[str]:
         YYYY-MM-DD 형식의 날짜 문자열 또는 None
     """
     folder_name = folder_path.name
+    # 보관된 날짜 폴더 (예: 2024-01-01.zip)
+    folder_name = archive_stem(folder_name) or folder_name
+    return parse_date_folder_name(folder_name)
+
+
+def parse_date_folder_name(folder_name: str) -> Optional[str]:
+    """
+    폴더 이름 문자열에서 날짜를 추출합니다.
+
+    Args:
+        folder_name: 폴더 이름
+
+    Returns:
+        YYYY-MM-DD 형식의 날짜 문자열 또는 None
+    """
+    # 날짜 형식이 될 수 없는 이름은 파싱하지 않음
+    if not 8 <= len(folder_name) <= 10 or not folder_name[:4].isdigit():
+        return None
 
     # YYYY-MM-DD 형식인지 확인
     try:
@@ -77,17 +98,4 @@ def get_all_date_folders(input_dir: Path) -> list[tuple[str, Path]]:
     Returns:
         (날짜문자열, 폴더경로) 튜플의 리스트
     """
-    date_folders = []
-
-    if not input_dir.exists():
-        return date_folders
-
-    for item in input_dir.iterdir():
-        if item.is_dir():
-            date_str = extract_date_from_folder_name(item)
-            if date_str:
-                date_folders.append((date_str, item))
-
-    # 날짜순으로 정렬
-    date_folders.sort(key=lambda x: x[0])
-    return date_folders
+    return input_index.date_folders(input_dir)
@@ -0,0 +1,203 @@
+"""
+입력 폴더 탐색 인덱스
+
+data/input 아래의 날짜 폴더(또는 날짜 이름의 압축 파일)와 파일 목록(이름, 크기,
+수정 시각)을 os.scandir 한 번으로 수집하고 JSON으로 저장해 둡니다. 다음 실행에서는
+디렉토리의 mtime이 그대로이면 저장된 목록을 재사용하므로, 폴더를 다시 나열하거나
+날짜 파싱을 반복하지 않습니다. 모든 Provider는 파일시스템 대신 이 인덱스에서 파일을 고릅니다.
+
+파일을 제자리에서 고쳐 저장하면(manual.xlsx 다시 저장 등) 디렉토리 mtime은 바뀌지 않으므로,
+목록을 재사용할 때도 기록된 파일마다 stat을 한 번씩 다시 해 크기와 수정 시각을 갱신합니다.
+체크포인트 재사용 여부가 이 값으로 결정되기 때문입니다.
+"""
+
+import json
+import os
+import time
+from dataclasses import dataclass
+from fnmatch import fnmatch
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .archive import archive_stem, list_archive_members
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+INDEX_VERSION = 1
+
+# 디렉토리 mtime 해상도가 낮은 파일시스템(NAS 등)에서 같은 초에 추가된 파일을
+# 놓치지 않도록, 스캔 직전에 바뀐 디렉토리는 다음 실행에서 다시 스캔합니다.
+MTIME_SAFETY_SECONDS = 2.0
+
+
+@dataclass
+class FileEntry:
+    """인덱스에 기록된 파일 정보"""
+    name: str
+    size: int
+    mtime: float
+    member: Optional[str] = None
+
+
+class InputIndex:
+    """날짜 폴더/파일 탐색 인덱스"""
+
+    def __init__(self, index_path: Optional[Path] = None):
+        self._index_path = index_path
+        self._data: Optional[Dict[str, Any]] = None
+        self._checked: set = set()
+        self._dirty = False
+
+    @property
+    def index_path(self) -> Path:
+        if self._index_path is None:
+            from .config import config_manager
+            self._index_path = Path(config_manager.get("input_index.path", "data/history/input_index.json"))
+        return self._index_path
+
+    def date_folders(self, input_dir: Path) -> List[Tuple[str, Path]]:
+        """input_dir 아래의 날짜 폴더를 (날짜, 경로) 목록으로 날짜순 반환합니다."""
+        entry = self._entry("roots", input_dir, self._scan_root)
+        if entry is None:
+            return []
+        return [(date_str, input_dir / name) for date_str, name in entry["folders"]]
+
+    def list_files(self, folder: Path) -> List[FileEntry]:
+        """폴더의 파일 목록을 반환합니다."""
+        entry = self._entry("folders", folder, self._scan_folder)
+        if entry is None:
+            return []
+        return [FileEntry(*item) for item in entry["files"]]
+
+    def find_files(self, folder: Path, patterns: Iterable[str]) -> List[FileEntry]:
+        """패턴과 일치하는 파일 목록을 반환합니다."""
+        patterns = list(patterns)
+        return [
+            file for file in self.list_files(folder)
+            if any(fnmatch(file.name, pattern) for pattern in patterns)
+        ]
+
+    def refresh(self) -> None:
+        """이번 실행에서 확인한 디렉토리 기록을 지워 다음 조회 때 mtime을 다시 확인하게 합니다."""
+        self._checked.clear()
+
+    def save(self) -> None:
+        """변경된 인덱스를 저장합니다."""
+        if not self._dirty or self._data is None:
+            return
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.index_path.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._data, f, ensure_ascii=False)
+            tmp_path.replace(self.index_path)
+            self._dirty = False
+        except Exception as e:
+            logger.warning(f"입력 인덱스 저장 실패: {e}")
+
+    # 내부 구현
+    def _entry(self, section: str, path: Path, scanner) -> Optional[Dict[str, Any]]:
+        """mtime이 바뀌었거나 기록이 없을 때만 디렉토리를 스캔합니다."""
+        data = self._load()
+        key = str(path.resolve())
+        cached = data[section].get(key)
+
+        if key in self._checked and cached is not None:
+            return cached
+
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except OSError:
+            data[section].pop(key, None)
+            return None
+
+        self._checked.add(key)
+        if (
+            cached is not None
+            and cached["mtime_ns"] == mtime_ns
+            and cached["scanned_at"] - mtime_ns / 1e9 > MTIME_SAFETY_SECONDS
+            and (section != "folders" or self._restat_files(path, cached))
+        ):
+            return cached
+
+        entry = scanner(path)
+        entry["mtime_ns"] = mtime_ns
+        entry["scanned_at"] = time.time()
+        data[section][key] = entry
+        self._dirty = True
+        return entry
+
+    def _restat_files(self, folder: Path, entry: Dict[str, Any]) -> bool:
+        """
+        기록된 파일의 크기/수정 시각을 다시 읽어 갱신합니다.
+
+        압축 파일은 자체 mtime으로 판단하므로 건너뜁니다. 기록된 파일이 없어졌으면
+        False를 반환해 폴더를 다시 스캔하게 합니다.
+        """
+        if not folder.is_dir():
+            return True
+        for item in entry["files"]:
+            try:
+                stat = os.stat(folder / item[0])
+            except OSError:
+                return False
+            if item[1] != stat.st_size or item[2] != stat.st_mtime:
+                item[1], item[2] = stat.st_size, stat.st_mtime
+                self._dirty = True
+        return True
+
+    def _scan_root(self, input_dir: Path) -> Dict[str, Any]:
+        """input_dir을 한 번 스캔해 날짜 폴더 목록을 만듭니다."""
+        from .date_utils import parse_date_folder_name
+
+        # 같은 날짜의 일반 폴더와 압축 파일이 함께 있으면 일반 폴더를 사용
+        folders: Dict[str, str] = {}
+        with os.scandir(input_dir) as it:
+            for dir_entry in it:
+                if dir_entry.is_dir():
+                    date_str = parse_date_folder_name(dir_entry.name)
+                    if date_str:
+                        folders[date_str] = dir_entry.name
+                elif dir_entry.is_file():
+                    stem = archive_stem(dir_entry.name)
+                    date_str = parse_date_folder_name(stem) if stem else None
+                    if date_str:
+                        folders.setdefault(date_str, dir_entry.name)
+
+        return {"folders": [[date_str, folders[date_str]] for date_str in sorted(folders)]}
+
+    def _scan_folder(self, folder: Path) -> Dict[str, Any]:
+        """폴더를 한 번 스캔해 파일 이름/크기/수정 시각을 기록합니다."""
+        if folder.is_file():
+            return {"files": [list(member) for member in list_archive_members(folder)]}
+
+        files = []
+        with os.scandir(folder) as it:
+            for dir_entry in it:
+                if not dir_entry.is_file():
+                    continue
+                stat = dir_entry.stat()
+                files.append([dir_entry.name, stat.st_size, stat.st_mtime])
+        return {"files": files}
+
+    def _load(self) -> Dict[str, Any]:
+        """저장된 인덱스를 처음 한 번만 읽습니다."""
+        if self._data is not None:
+            return self._data
+
+        self._data = {"version": INDEX_VERSION, "roots": {}, "folders": {}}
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == INDEX_VERSION:
+                self._data = data
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"입력 인덱스 로드 실패, 새로 생성합니다: {e}")
+        return self._data
+
+
+# 전역 입력 인덱스 인스턴스
+input_index = InputIndex()
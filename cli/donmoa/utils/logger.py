@@ -1,11 +1,85 @@
 """
 로깅 유틸리티 모듈
+
+로거에는 QueueHandler만 연결하고, 실제 출력(콘솔/파일)은 QueueListener 스레드가
+담당합니다. 로그 호출은 레코드를 큐에 넣기만 하므로 출력 I/O를 기다리지 않습니다.
+병렬 파싱 워커 프로세스는 init_worker_logging으로 multiprocessing 큐에 로그를 보내고,
+메인 프로세스의 리스너가 같은 핸들러로 출력합니다.
+
+메시지는 `logger.debug("%s 처리: %d건", name, count)`처럼 %-스타일 인자로 넘기면
+해당 레벨이 꺼져 있을 때 문자열을 만들지 않습니다.
 """
 
+import atexit
+import json
 import logging
+import multiprocessing
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, List, Optional
+
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+class JsonFormatter(logging.Formatter):
+    """로그 레코드를 한 줄짜리 JSON으로 출력하는 포맷터"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload: Dict[str, Any] = {
+            "time": self.formatTime(record, self.datefmt),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if record.processName != "MainProcess":
+            payload["process"] = record.processName
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(payload, ensure_ascii=False)
+
+
+class _LogQueues:
+    """로거별 큐, 리스너와 출력 핸들러 상태"""
+
+    def __init__(self, handlers: List[logging.Handler]):
+        self.handlers = handlers
+        self.queue: queue.Queue = queue.Queue(-1)
+        self.listener = QueueListener(self.queue, *handlers, respect_handler_level=True)
+        self.listener.start()
+        self.worker_queue: Any = None
+        self.worker_listener: Optional[QueueListener] = None
+
+    def get_worker_queue(self):
+        """워커 프로세스용 multiprocessing 큐를 처음 요청될 때 만듭니다."""
+        if self.worker_queue is None:
+            self.worker_queue = multiprocessing.Queue(-1)
+            self.worker_listener = QueueListener(self.worker_queue, *self.handlers, respect_handler_level=True)
+            self.worker_listener.start()
+        return self.worker_queue
+
+    def flush(self) -> None:
+        """큐에 쌓인 로그가 모두 출력될 때까지 기다립니다."""
+        if self.listener._thread is not None:
+            self.queue.join()
+
+    def stop(self) -> None:
+        """리스너를 멈추고 남은 로그를 출력한 뒤 핸들러를 닫습니다."""
+        for listener in (self.listener, self.worker_listener):
+            if listener is not None and listener._thread is not None:
+                listener.stop()
+        if self.worker_queue is not None:
+            self.worker_queue.close()
+        for handler in self.handlers:
+            handler.close()
+
+
+_queues: Dict[str, _LogQueues] = {}
+
+# 워커 프로세스에 설치된 로그 큐. 워커가 다시 워커(격리 실행 안의 병렬 파싱)를 만들 때 그대로 넘깁니다.
+_worker_queues: Dict[str, Any] = {}
 
 
 def setup_logger(
@@ -13,6 +87,7 @@ def setup_logger(
     level: int = logging.INFO,
     log_file: Optional[Path] = None,
     console_output: bool = True,
+    json_format: bool = False,
 ) -> logging.Logger:
     """
     로거를 설정하고 반환합니다.
@@ -22,6 +97,7 @@ def setup_logger(
         level: 로그 레벨
         log_file: 로그 파일 경로 (None이면 파일 출력 안함)
         console_output: 콘솔 출력 여부
+        json_format: True면 한 줄짜리 JSON으로 출력
 
     Returns:
         설정된 로거 인스턴스
@@ -35,17 +111,19 @@ def setup_logger(
     logger.setLevel(level)
 
     # 로그 포맷 설정
-    formatter = logging.Formatter(
-        "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-    )
+    if json_format:
+        formatter: logging.Formatter = JsonFormatter(datefmt=DATE_FORMAT)
+    else:
+        formatter = logging.Formatter(LOG_FORMAT, datefmt=DATE_FORMAT)
+
+    handlers: List[logging.Handler] = []
 
     # 콘솔 출력 핸들러
     if console_output:
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(level)
         console_handler.setFormatter(formatter)
-        logger.addHandler(console_handler)
+        handlers.append(console_handler)
 
     # 파일 출력 핸들러
     if log_file:
@@ -55,11 +133,89 @@ def setup_logger(
         file_handler = logging.FileHandler(log_file, encoding="utf-8")
         file_handler.setLevel(level)
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
+
+    # 로거에는 큐 핸들러만 연결하고 출력은 리스너 스레드에서 처리
+    log_queues = _LogQueues(handlers)
+    _queues[name] = log_queues
+    logger.addHandler(QueueHandler(log_queues.queue))
 
     return logger
 
 
+def configure_logging(
+    level: str = "INFO",
+    log_file: Optional[str] = None,
+    console_output: bool = True,
+    json_format: bool = False,
+    name: str = "donmoa",
+) -> logging.Logger:
+    """
+    설정값으로 기존 로거를 다시 구성합니다.
+
+    로거 객체는 그대로 두고 핸들러만 교체하므로, 모듈에서 이미 가져간
+    `logger` 참조도 새 설정을 따릅니다.
+    """
+    _shutdown(name)
+    logging.getLogger(name).handlers.clear()
+
+    return setup_logger(
+        name,
+        level=getattr(logging, str(level).upper(), logging.INFO),
+        log_file=Path(log_file) if log_file else None,
+        console_output=console_output,
+        json_format=json_format,
+    )
+
+
+def flush_logs(name: str = "donmoa") -> None:
+    """대기 중인 로그를 모두 출력합니다. (콘솔 결과 출력 전 순서 유지용)"""
+    log_queues = _queues.get(name)
+    if log_queues is not None:
+        log_queues.flush()
+
+
+def get_worker_log_queue(name: str = "donmoa"):
+    """
+    워커 프로세스에 넘길 로그 큐를 반환합니다. (init_worker_logging의 인자)
+
+    워커 프로세스 안에서는 init_worker_logging으로 받은 큐를 반환하므로, 손자 프로세스의
+    로그도 메인 프로세스 리스너로 모입니다.
+    """
+    if name in _worker_queues:
+        return _worker_queues[name]
+    return _queues[name].get_worker_queue()
+
+
+def init_worker_logging(log_queue, level: int, name: str = "donmoa") -> None:
+    """
+    워커 프로세스의 로거가 메인 프로세스 큐로 로그를 보내도록 설정합니다.
+
+    ProcessPoolExecutor의 initializer로 사용합니다. fork로 물려받은 핸들러는
+    메인 프로세스의 리스너 스레드가 없어 출력되지 않으므로 교체합니다.
+    """
+    logger = logging.getLogger(name)
+    logger.handlers.clear()
+    logger.addHandler(QueueHandler(log_queue))
+    logger.setLevel(level)
+    _worker_queues[name] = log_queue
+
+    # spawn 방식에서는 모듈 import 시 시작된 리스너가 이 프로세스에 있으므로 멈춤
+    log_queues = _queues.pop(name, None)
+    if log_queues is not None and log_queues.listener._thread is not None:
+        if log_queues.listener._thread.is_alive():
+            log_queues.listener.stop()
+
+
+def _shutdown(name: Optional[str] = None) -> None:
+    """리스너를 멈춥니다. name이 없으면 모든 로거를 멈춥니다."""
+    names = [name] if name else list(_queues)
+    for key in names:
+        log_queues = _queues.pop(key, None)
+        if log_queues is not None:
+            log_queues.stop()
+
+
 def get_logger(name: str = "donmoa") -> logging.Logger:
     """
     기존 로거를 반환하거나 새로 생성합니다.
@@ -75,6 +231,7 @@ def get_logger(name: str = "donmoa") -> logging.Logger:
 
 # 기본 로거 인스턴스
 logger = setup_logger()
+atexit.register(_shutdown)
 
 
 class LoggerMixin:
@@ -0,0 +1,165 @@
+"""
+메모리 사용량 측정 유틸리티
+
+파이프라인 단계(Provider 수집, 내보내기, 이력 저장 등)마다 프로세스 RSS와
+tracemalloc 기준 Python 할당 최고치를 기록합니다. `performance.memory_budget_mb`가
+설정되어 있으면 현재 RSS가 예산의 일정 비율(MEMORY_BUDGET_RATIO)을 넘었을 때
+`low_memory`가 참이 되고, Provider는 병렬 파싱 대신 순차 파싱, 읽기 전용(스트리밍)
+워크북, 원본 트리/DataFrame 즉시 해제 같은 메모리 절약 경로를 사용합니다.
+
+tracemalloc은 할당마다 비용이 있으므로 `performance.memory_tracking`이 켜져 있을 때만
+시작합니다. RSS 측정은 /proc 또는 resource 모듈만 사용해 항상 동작합니다.
+"""
+
+import gc
+import os
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Iterator, List, Optional
+
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# 예산 대비 이 비율 이상 사용하면 메모리 절약 경로로 전환
+MEMORY_BUDGET_RATIO = 0.8
+
+_MB = 1024 * 1024
+
+
+def current_rss_mb() -> Optional[float]:
+    """현재 프로세스 RSS(MB). 측정할 수 없으면 None"""
+    try:
+        with open("/proc/self/statm", "r") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / _MB
+    except (OSError, ValueError, IndexError, AttributeError):
+        return peak_rss_mb()
+
+
+def peak_rss_mb() -> Optional[float]:
+    """프로세스 시작 후 최대 RSS(MB). 측정할 수 없으면 None"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 바이트 단위
+    return peak / _MB if sys.platform == "darwin" else peak / 1024
+
+
+@dataclass
+class StageMemory:
+    """단계 하나의 메모리 사용량 (MB)"""
+    stage: str
+    rss_before: Optional[float]
+    rss_after: Optional[float]
+    rss_peak: Optional[float]
+    traced_peak: Optional[float]
+    seconds: float
+    low_memory: bool = False
+
+    @property
+    def rss_delta(self) -> Optional[float]:
+        if self.rss_before is None or self.rss_after is None:
+            return None
+        return self.rss_after - self.rss_before
+
+    def to_dict(self) -> Dict[str, Any]:
+        record = asdict(self)
+        record["rss_delta"] = self.rss_delta
+        return record
+
+
+class MemoryMonitor:
+    """파이프라인 단계별 메모리 측정 및 예산 판단"""
+
+    def __init__(self):
+        self.stages: List[StageMemory] = []
+
+    @property
+    def budget_mb(self) -> Optional[float]:
+        """메모리 예산(MB). 0 또는 미설정이면 None"""
+        from .config import config_manager
+        budget = config_manager.get("performance.memory_budget_mb")
+        return float(budget) if budget else None
+
+    @property
+    def tracking(self) -> bool:
+        from .config import config_manager
+        return bool(config_manager.get("performance.memory_tracking", False))
+
+    @property
+    def low_memory(self) -> bool:
+        """현재 RSS가 예산의 MEMORY_BUDGET_RATIO 이상인지 여부"""
+        budget = self.budget_mb
+        if budget is None:
+            return False
+        rss = current_rss_mb()
+        return rss is not None and rss >= budget * MEMORY_BUDGET_RATIO
+
+    def reset(self) -> None:
+        """기록된 단계를 지웁니다. (실행마다 호출)"""
+        self.stages = []
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """
+        블록 실행 동안의 RSS 변화와 Python 할당 최고치를 기록합니다.
+
+        예산 모드에서는 단계가 끝날 때 가비지 컬렉션을 수행해 해제된 원본 데이터를 바로 회수합니다.
+        """
+        tracing = self.tracking
+        if tracing:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+            tracemalloc.reset_peak()
+
+        rss_before = current_rss_mb()
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            low_memory = self.low_memory
+            if low_memory:
+                gc.collect()
+
+            traced_peak = tracemalloc.get_traced_memory()[1] / _MB if tracing else None
+            self.record(StageMemory(
+                stage=name,
+                rss_before=rss_before,
+                rss_after=current_rss_mb(),
+                rss_peak=peak_rss_mb(),
+                traced_peak=traced_peak,
+                seconds=time.perf_counter() - started,
+                low_memory=low_memory,
+            ))
+
+    def record(self, stage: StageMemory) -> None:
+        """단계 측정값을 추가하고 로그로 남깁니다. (워커 프로세스에서 측정한 값도 여기로 모음)"""
+        self.stages.append(stage)
+        logger.debug(
+            "메모리 %s: RSS %s → %s MB, 할당 최고 %s MB",
+            stage.stage, _format_mb(stage.rss_before), _format_mb(stage.rss_after), _format_mb(stage.traced_peak)
+        )
+
+        budget = self.budget_mb
+        if budget is not None and stage.rss_after is not None and stage.rss_after >= budget:
+            logger.warning(f"⚠️ 메모리 예산 초과: {stage.stage} 후 RSS {stage.rss_after:,.0f}MB / 예산 {budget:,.0f}MB")
+
+    def report(self) -> List[Dict[str, Any]]:
+        """단계별 측정값 목록"""
+        return [stage.to_dict() for stage in self.stages]
+
+
+def _format_mb(value: Optional[float]) -> str:
+    return "-" if value is None else f"{value:,.1f}"
+
+
+memory_monitor = MemoryMonitor()
@@ -0,0 +1,128 @@
+"""
+정수 고정소수점 금액/수량 유틸리티
+
+서버 DB(migration 003)와 같은 정수 표현을 사용합니다.
+- amount_minor: 통화별 최소 단위 정수 (KRW ₩1,000 = 1000, USD $10.50 = 1050)
+- qty_nano / price_nano: 수량/단가 × 10^9
+
+반올림은 packages/shared의 toMoneyMinor/toQtyNano(Math.round)와 같이 0.5를 올립니다.
+정수 값끼리는 합계가 정확하므로 집계는 int64 배열로 벡터화할 수 있습니다.
+"""
+
+import math
+from typing import Any, Iterable, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+# 통화별 최소 단위 배수 (packages/shared CURRENCY_SCALES와 동일)
+CURRENCY_SCALES = {
+    "KRW": 1,
+    "USD": 100,
+    "EUR": 100,
+    "GBP": 100,
+    "JPY": 1,
+    "CNY": 100,
+}
+
+# 목록에 없는 통화의 기본 배수
+DEFAULT_CURRENCY_SCALE = 100
+
+# 수량/단가 배수
+NANO_SCALE = 1_000_000_000
+
+
+def currency_scale(currency: Optional[str]) -> int:
+    """통화의 최소 단위 배수를 반환합니다."""
+    if not currency:
+        return DEFAULT_CURRENCY_SCALE
+    return CURRENCY_SCALES.get(str(currency).upper(), DEFAULT_CURRENCY_SCALE)
+
+
+def currency_digits(currency: Optional[str]) -> int:
+    """통화의 소수 자릿수를 반환합니다. (KRW 0, USD 2)"""
+    return len(str(currency_scale(currency))) - 1
+
+
+def format_amount(amount: Any, currency: Optional[str], sign: bool = False) -> str:
+    """금액을 통화의 최소 단위 자릿수에 맞춰 천 단위 구분 기호와 함께 표시합니다."""
+    return f"{float(amount):{'+' if sign else ''},.{currency_digits(currency)}f}"
+
+
+def to_minor(amount: Any, currency: Optional[str]) -> Optional[int]:
+    """금액을 통화별 최소 단위 정수로 변환합니다. 값이 없으면 None입니다."""
+    return _round_scaled(amount, currency_scale(currency))
+
+
+def to_nano(value: Any) -> Optional[int]:
+    """수량/단가를 nano 단위 정수로 변환합니다. 값이 없으면 None입니다."""
+    return _round_scaled(value, NANO_SCALE)
+
+
+def from_minor(amount_minor: Optional[int], currency: Optional[str]) -> Optional[float]:
+    """최소 단위 정수를 금액으로 변환합니다."""
+    if amount_minor is None:
+        return None
+    return amount_minor / currency_scale(currency)
+
+
+def nano_product_to_minor(qty_nano: Optional[int], price_nano: Optional[int], currency: Optional[str]) -> Optional[int]:
+    """
+    수량 × 단가를 실수 변환 없이 최소 단위 금액으로 계산합니다.
+
+    두 nano 값의 곱은 10^18 배이므로 Python 정수로 계산한 뒤 한 번만 반올림합니다.
+    """
+    if qty_nano is None or price_nano is None:
+        return None
+    denominator = NANO_SCALE * NANO_SCALE
+    # floor(x / d + 0.5) = floor((2x + d) / 2d)
+    return (2 * qty_nano * price_nano * currency_scale(currency) + denominator) // (2 * denominator)
+
+
+def to_minor_array(
+    amounts: Union[pd.Series, np.ndarray, Iterable[float]],
+    currencies: Union[pd.Series, np.ndarray, Iterable[str], str]
+) -> np.ndarray:
+    """
+    금액 배열을 최소 단위 int64 배열로 변환합니다.
+
+    Args:
+        amounts: 금액 배열 (NaN은 0으로 처리)
+        currencies: 통화 배열 또는 모든 값에 적용할 통화 코드
+
+    Returns:
+        int64 NumPy 배열
+    """
+    values = np.asarray(amounts, dtype=np.float64)
+    if isinstance(currencies, str):
+        scales = np.float64(currency_scale(currencies))
+    else:
+        codes = pd.Series(np.asarray(currencies, dtype=object))
+        scales = codes.map(currency_scale).to_numpy(dtype=np.float64)
+    return _round_array(values * scales)
+
+
+def to_nano_array(values: Union[pd.Series, np.ndarray, Iterable[float]]) -> np.ndarray:
+    """수량/단가 배열을 nano 단위 int64 배열로 변환합니다. (NaN은 0으로 처리)"""
+    return _round_array(np.asarray(values, dtype=np.float64) * NANO_SCALE)
+
+
+def _round_scaled(value: Any, scale: int) -> Optional[int]:
+    """값 × 배수를 0.5 올림으로 정수화합니다."""
+    if value is None:
+        return None
+    if isinstance(value, (int, np.integer)) and not isinstance(value, bool):
+        return int(value) * scale
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    if math.isnan(number) or math.isinf(number):
+        return None
+    return math.floor(number * scale + 0.5)
+
+
+def _round_array(scaled: np.ndarray) -> np.ndarray:
+    """배수를 곱한 실수 배열을 0.5 올림으로 int64 배열로 변환합니다."""
+    scaled = np.nan_to_num(scaled, nan=0.0, posinf=0.0, neginf=0.0)
+    return np.floor(scaled + 0.5).astype(np.int64)
@@ -0,0 +1,267 @@
+"""
+숫자/금액 문자열 파싱 유틸리티
+
+"1,234원", "1.2만", "3억 5,000만원", "△500", "(1,000)" 같은 한국식 표기를 숫자로
+변환합니다. parse_numbers는 값 하나씩 정규식을 돌리지 않고, 문자열 배열을 NumPy
+고정 폭 유니코드 배열로 바꾼 뒤 코드 포인트 행렬(행 = 값, 열 = 글자 위치)에서
+숫자/소수점/단위/부호 위치를 한 번에 계산합니다.
+
+규칙
+- 숫자, 소수점, 단위(조/억/만/천)를 제외한 글자(쉼표, 공백, 원, ₩, $, % 등)는 무시
+- 단위는 왼쪽 숫자에 곱해짐: "3억 5,000만" = 3 × 10^8 + 5000 × 10^4
+- 첫 숫자 앞의 -, −, △, ▼ 또는 숫자 전체를 감싼 괄호는 음수
+- 숫자가 없거나, 한 단위 구간에 소수점이 둘 이상이거나, 숫자 뒤에 음수 기호가
+  있는 값(예: 날짜 "2024-01-01")은 변환 실패로 보고 기본값을 사용
+"""
+
+import math
+import re
+from numbers import Real
+from typing import Any, Iterable, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+# 단위 접미사 배수
+UNIT_MULTIPLIERS = {"조": 1e12, "억": 1e8, "만": 1e4, "천": 1e3}
+
+# 음수 표기: 마이너스 기호, 전일 대비 하락 표시(△, ▼)
+NEGATIVE_MARKERS = "-−－△▼"
+
+# 이보다 긴 문자열은 행렬 폭을 키우지 않도록 값 단위로 처리
+MAX_VECTOR_WIDTH = 48
+
+# 행렬 메모리를 제한하기 위한 처리 단위 (행 수)
+CHUNK_ROWS = 1 << 13
+
+_UNIT_CODES = [ord(unit) for unit in UNIT_MULTIPLIERS]
+_UNIT_VALUES = list(UNIT_MULTIPLIERS.values()) + [1.0]
+_NO_UNIT = len(_UNIT_CODES)
+_NEGATIVE_CODES = np.array([ord(marker) for marker in NEGATIVE_MARKERS], dtype=np.uint32)
+_POW10 = 10.0 ** np.arange(MAX_VECTOR_WIDTH + 1)
+
+_DIGIT_REGEX = re.compile(r"[0-9]")
+_LAST_DIGIT_REGEX = re.compile(r"[0-9](?!.*[0-9])", re.S)
+_IGNORED_REGEX = re.compile("[^0-9." + "".join(UNIT_MULTIPLIERS) + "]")
+_SEGMENT_REGEX = re.compile("([0-9.]+)([" + "".join(UNIT_MULTIPLIERS) + "]?)")
+# 부호와 소수점만 있는 일반 숫자 문자열 (ASCII 숫자만, float()로 바로 변환 가능)
+_PLAIN_NUMBER_REGEX = re.compile(r"-?\d+(\.\d+)?", re.ASCII)
+
+
+def parse_number(value: Any, default: float = 0.0) -> float:
+    """
+    값 하나를 숫자로 변환합니다.
+
+    Args:
+        value: 숫자 또는 숫자 표기 문자열
+        default: 변환할 수 없을 때 반환할 값
+
+    Returns:
+        변환된 숫자
+    """
+    if value is None:
+        return default
+    if isinstance(value, Real):
+        return default if math.isnan(value) else float(value)
+    if not isinstance(value, str):
+        return default
+
+    # 부호와 소수점만 있는 일반 숫자 문자열은 바로 변환
+    if _PLAIN_NUMBER_REGEX.fullmatch(value):
+        return float(value)
+
+    number = _parse_text(value)
+    return default if number is None else number
+
+
+def _parse_text(text: str) -> Optional[float]:
+    """문자열 하나를 parse_numbers와 같은 규칙으로 변환합니다. 변환할 수 없으면 None입니다."""
+    first = _DIGIT_REGEX.search(text)
+    if first is None:
+        return None
+    last = _LAST_DIGIT_REGEX.search(text)
+
+    head, tail = text[:first.start()], text[first.start():]
+    if any(marker in tail for marker in NEGATIVE_MARKERS):
+        return None
+    negative = any(marker in head for marker in NEGATIVE_MARKERS) or (
+        "(" in head and ")" in text[last.end():]
+    )
+
+    number = 0.0
+    for digits, unit in _SEGMENT_REGEX.findall(_IGNORED_REGEX.sub("", text)):
+        if digits.count(".") > 1:
+            return None
+        if digits.strip("."):
+            number += float(digits) * UNIT_MULTIPLIERS.get(unit, 1.0)
+    return -number if negative else number
+
+
+def parse_numbers(values: Union[pd.Series, np.ndarray, Iterable[Any]], default: float = 0.0) -> np.ndarray:
+    """
+    값 배열 전체를 숫자로 변환합니다.
+
+    Args:
+        values: pandas Series, NumPy 배열 또는 값 목록
+        default: 비어 있거나 변환할 수 없는 값에 채울 값
+
+    Returns:
+        float64 NumPy 배열 (입력과 같은 순서)
+    """
+    if isinstance(values, pd.Series):
+        series = values.reset_index(drop=True)
+    elif isinstance(values, np.ndarray):
+        series = pd.Series(values)
+    else:
+        series = pd.Series(list(values), dtype=object)
+
+    if pd.api.types.is_numeric_dtype(series.dtype):
+        return series.astype(np.float64).fillna(default).to_numpy()
+
+    result = np.full(len(series), np.nan)
+
+    # 문자열과 그 외 값(숫자, None, NaN)을 나눠 처리
+    if pd.api.types.infer_dtype(series, skipna=False) == "string":
+        is_text = np.ones(len(series), dtype=bool)
+    else:
+        is_text = (series.map(type) == str).to_numpy()
+        if not is_text.all():
+            result[~is_text] = pd.to_numeric(series[~is_text], errors="coerce").astype(np.float64)
+
+    if is_text.any():
+        result[is_text] = _parse_texts(series[is_text].to_numpy())
+
+    result[np.isnan(result)] = default
+    return result
+
+
+def _parse_texts(texts: np.ndarray) -> np.ndarray:
+    """문자열 배열을 변환합니다. 변환할 수 없으면 NaN입니다."""
+    result = np.empty(len(texts))
+    for start in range(0, len(texts), CHUNK_ROWS):
+        chunk = texts[start:start + CHUNK_ROWS]
+        array = chunk.astype(str)
+
+        # 긴 문자열(드문 경우)은 행렬 폭을 키우지 않도록 값 단위로 처리
+        long_idx = np.empty(0, dtype=np.intp)
+        if array.dtype.itemsize // 4 > MAX_VECTOR_WIDTH:
+            long_idx = np.flatnonzero(np.char.str_len(array) > MAX_VECTOR_WIDTH)
+            array[long_idx] = ""
+
+        if array.dtype.itemsize == 0:
+            result[start:start + len(chunk)] = np.nan
+        else:
+            codes = array.view(np.uint32).reshape(len(array), -1)[:, :MAX_VECTOR_WIDTH]
+            numbers, valid = _parse_code_matrix(np.ascontiguousarray(codes))
+            result[start:start + len(chunk)] = np.where(valid, numbers, np.nan)
+
+        for i in long_idx:
+            number = _parse_text(chunk[i])
+            result[start + i] = np.nan if number is None else number
+    return result
+
+
+def _parse_code_matrix(codes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    코드 포인트 행렬(n × w)에서 숫자 값과 유효 여부를 계산합니다.
+
+    각 숫자는 오른쪽으로 가장 가까운 단위 글자의 구간에 속하며, 구간 안의 숫자를
+    하나의 정수(가수)로 모은 뒤 구간의 소수 자릿수와 단위 배수를 적용합니다.
+    가수는 정수로 정확히 누적되므로 결과는 float(문자열)과 같은 값으로 반올림됩니다.
+    단위나 소수점이 없는 묶음은 해당 계산을 건너뜁니다.
+    """
+    n, width = codes.shape
+    positions = np.arange(width, dtype=np.int8)
+
+    digit_values = codes - np.uint32(48)
+    is_digit = digit_values < 10
+    is_dot = codes == 46
+
+    # digits_right[:, p] = p 이후(자신 포함) 숫자 개수, 마지막 열은 0
+    digits_right = np.zeros((n, width + 1), dtype=np.int8)
+    np.cumsum(is_digit[:, ::-1], axis=1, dtype=np.int8, out=digits_right[:, width - 1::-1])
+
+    # 글자별 단위 번호 (단위가 아니면 _NO_UNIT)
+    unit_slot = None
+    if (codes >= min(_UNIT_CODES)).any():
+        unit_slot = np.full((n, width + 1), _NO_UNIT, dtype=np.int8)
+        for slot, code in enumerate(_UNIT_CODES):
+            unit_slot[:, :width][codes == code] = slot
+        if not (unit_slot < _NO_UNIT).any():
+            unit_slot = None
+
+    if unit_slot is None:
+        next_unit = np.full((n, width), width, dtype=np.int8)
+        prev_unit = np.full((n, width), -1, dtype=np.int8)
+        seg_end_digits = np.zeros((n, width), dtype=np.int8)
+        digit_slot = None
+    else:
+        is_unit = unit_slot[:, :width] < _NO_UNIT
+        next_unit = _next_position(is_unit)
+        prev_unit = _prev_position(is_unit)
+        seg_end_digits = np.take_along_axis(digits_right, next_unit.astype(np.intp), axis=1)
+        digit_slot = np.take_along_axis(unit_slot, next_unit.astype(np.intp), axis=1)
+
+    # 구간 안에서 오른쪽에 있는 숫자 개수 = 가수에서의 자릿수
+    exponent = digits_right[:, 1:] - seg_end_digits
+    terms = np.where(is_digit, digit_values * _POW10[exponent], 0.0)
+
+    # 구간 안의 소수점 (오른쪽 우선, 없으면 왼쪽)과 소수 자릿수
+    has_dot = is_dot.any()
+    if has_dot:
+        next_dot = _next_position(is_dot)
+        prev_dot = _prev_position(is_dot)
+        segment_dot = np.where(next_dot < next_unit, next_dot, np.where(prev_dot > prev_unit, prev_dot, -1))
+        after_dot = np.take_along_axis(digits_right, (segment_dot + 1).astype(np.intp), axis=1)
+        fraction_digits = np.where(segment_dot >= 0, after_dot - seg_end_digits, 0)
+
+    numbers = np.zeros(n)
+    for slot, multiplier in enumerate(_UNIT_VALUES):
+        if digit_slot is None:
+            if slot != _NO_UNIT:
+                continue
+            in_slot = is_digit
+        else:
+            in_slot = is_digit & (digit_slot == slot)
+            if not in_slot.any():
+                continue
+        mantissa = np.where(in_slot, terms, 0.0).sum(axis=1)
+        if has_dot:
+            mantissa /= _POW10[np.where(in_slot, fraction_digits, 0).max(axis=1)]
+        numbers += mantissa * multiplier
+
+    # 부호: 첫 숫자 앞의 음수 기호 또는 숫자 전체를 감싼 괄호
+    first_digit = np.argmax(is_digit, axis=1).astype(np.int8)[:, None]
+    is_negative_marker = codes == 45
+    if (codes > 127).any():
+        for code in _NEGATIVE_CODES[1:]:
+            is_negative_marker |= codes == code
+    before_digits = positions < first_digit
+    negative = (is_negative_marker & before_digits).any(axis=1)
+
+    open_paren = (codes == 40) & before_digits
+    if open_paren.any():
+        last_digit = (width - 1 - np.argmax(is_digit[:, ::-1], axis=1)).astype(np.int8)[:, None]
+        negative |= open_paren.any(axis=1) & ((codes == 41) & (positions > last_digit)).any(axis=1)
+
+    # 유효성: 숫자 존재, 구간당 소수점 하나, 숫자 뒤 음수 기호 없음
+    valid = is_digit.any(axis=1) & ~(is_negative_marker & ~before_digits).any(axis=1)
+    if has_dot:
+        following_dot = np.full((n, width), width, dtype=np.int8)
+        following_dot[:, :-1] = next_dot[:, 1:]
+        valid &= ~(is_dot & (following_dot < next_unit)).any(axis=1)
+
+    return np.where(negative, -numbers, numbers), valid
+
+
+def _next_position(mask: np.ndarray) -> np.ndarray:
+    """각 위치에서 오른쪽(자신 포함)으로 mask가 참인 가장 가까운 위치를 반환합니다. 없으면 폭(w)입니다."""
+    width = mask.shape[1]
+    candidates = np.where(mask, np.arange(width, dtype=np.int8), np.int8(width))
+    return np.minimum.accumulate(candidates[:, ::-1], axis=1)[:, ::-1]
+
+
+def _prev_position(mask: np.ndarray) -> np.ndarray:
+    """각 위치에서 왼쪽(자신 포함)으로 mask가 참인 가장 가까운 위치를 반환합니다. 없으면 -1입니다."""
+    candidates = np.where(mask, np.arange(mask.shape[1], dtype=np.int8), np.int8(-1))
+    return np.maximum.accumulate(candidates, axis=1)
@@ -0,0 +1,88 @@
+"""
+parse_numbers 벤치마크 (pytest 수집 대상 아님)
+
+기존 Provider의 값 단위 정규식 변환(_convert_to_number)과 parse_numbers / parse_number를
+같은 열에 대해 비교합니다. 정규식 경로는 단위/부호 표기를 잘못 변환하므로 속도만
+비교합니다.
+
+사용법 (cli 디렉토리에서):
+    python tests/bench_number_utils.py              # 100만 행
+    python tests/bench_number_utils.py --rows 200000 --repeat 5
+"""
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from donmoa.utils.number_utils import parse_number, parse_numbers  # noqa: E402
+
+_NON_NUMBER = re.compile(r"[^\d.-]")
+
+
+def regex_convert(value):
+    """user-036 이전 BaseProvider._convert_to_number (값 하나씩 정규식)"""
+    try:
+        if pd.isna(value) or value is None:
+            return 0.0
+        if isinstance(value, (int, float)):
+            return float(value)
+        if isinstance(value, str):
+            cleaned = _NON_NUMBER.sub("", value.replace(",", ""))
+            return float(cleaned) if cleaned else 0.0
+        return 0.0
+    except (ValueError, TypeError):
+        return 0.0
+
+
+def make_columns(rows: int, seed: int = 0):
+    """벤치마크용 문자열 열 (정수, 원 단위 금액, 단위/부호가 섞인 값)"""
+    rng = np.random.default_rng(seed)
+    amounts = rng.integers(0, 10_000_000, rows)
+    mixed = np.array(["△{:,}", "({:,})", "{}만", "{}억 {:,}만원", "-{}"], dtype=object)
+    templates = mixed[rng.integers(0, len(mixed), rows)]
+    return {
+        "plain ints": pd.Series(amounts.astype(str), dtype=object),
+        "'1,234원'": pd.Series([f"{amount:,}원" for amount in amounts], dtype=object),
+        "mixed △/()/만/억": pd.Series(
+            [template.format(amount % 1000, amount) for template, amount in zip(templates, amounts)], dtype=object
+        ),
+    }
+
+
+def best_of(repeat: int, func, column) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(column)
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=1_000_000, help="열의 행 수 (기본 100만)")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수 (최솟값 사용)")
+    args = parser.parse_args()
+
+    paths = {
+        "per-value regex": lambda column: [regex_convert(value) for value in column],
+        "parse_number": lambda column: [parse_number(value) for value in column],
+        "parse_numbers": parse_numbers,
+    }
+
+    print(f"{args.rows:,}행, {args.repeat}회 중 최솟값 (초)")
+    print(f"{'열':<20}" + "".join(f"{name:>18}" for name in paths))
+    for label, column in make_columns(args.rows).items():
+        timings = [best_of(args.repeat, func, column) for func in paths.values()]
+        print(f"{label:<20}" + "".join(f"{seconds:>18.3f}" for seconds in timings))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""
+테스트 공통 설정
+
+config_manager는 모듈 전역 싱글톤이므로 테스트마다 설정 딕셔너리를 바꿔 끼우고,
+데이터 파일 경로는 모두 tmp_path 아래로 보냅니다.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from donmoa.utils.config import config_manager  # noqa: E402
+from donmoa.utils.input_index import InputIndex  # noqa: E402
+
+
+@pytest.fixture
+def config(monkeypatch, tmp_path):
+    """테스트용 설정. 반환한 딕셔너리를 고치면 config_manager.get에 바로 반영됩니다."""
+    values = {
+        "export": {"output_dir": str(tmp_path / "export")},
+        "history": {"enabled": True, "db_path": str(tmp_path / "history" / "donmoa.db")},
+        "dedup": {"transactions": True, "index_path": str(tmp_path / "history" / "transactions_index.db")},
+        "outbox": {"enabled": True, "db_path": str(tmp_path / "history" / "outbox.db")},
+        "checkpoint": {"enabled": True, "dir": str(tmp_path / "checkpoints"), "keep_runs": 3},
+        "input_index": {"path": str(tmp_path / "history" / "input_index.json")},
+        "performance": {"isolate_providers": False},
+    }
+    monkeypatch.setattr(config_manager, "config", values)
+
+    # 전역 입력 인덱스도 테스트 디렉토리의 새 인덱스로 교체
+    index = InputIndex(tmp_path / "history" / "input_index.json")
+    for module in ("donmoa.utils.input_index", "donmoa.providers.base", "donmoa.core.data_collector",
+                   "donmoa.core.checkpoint", "donmoa.utils.date_utils"):
+        monkeypatch.setattr(f"{module}.input_index", index)
+    return values
@@ -0,0 +1,72 @@
+"""
+압축 입력(zip/tar 멤버) 읽기 테스트
+"""
+
+import io
+import tarfile
+import zipfile
+from types import SimpleNamespace
+
+import pytest
+
+from donmoa.providers.base import BaseProvider
+from donmoa.utils.archive import open_input, open_seekable, split_archive_path
+
+
+@pytest.fixture
+def zip_folder(tmp_path):
+    path = tmp_path / "input" / "2025-01-10.zip"
+    path.parent.mkdir(parents=True)
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr("a/domino.mhtml", b"from a")
+        zf.writestr("b/domino.mhtml", b"from b")
+        zf.writestr("b/manual.xlsx", b"manual")
+    return path
+
+
+def read(path):
+    with open_input(path) as f:
+        return f.read()
+
+
+def test_members_with_same_name_are_opened_by_full_path(zip_folder):
+    assert read(zip_folder / "a" / "domino.mhtml") == b"from a"
+    assert read(zip_folder / "b" / "domino.mhtml") == b"from b"
+
+
+def test_ambiguous_basename_is_rejected(zip_folder):
+    with pytest.raises(ValueError, match="여러 개"):
+        read(zip_folder / "domino.mhtml")
+
+    assert open_seekable(zip_folder / "manual.xlsx").read() == b"manual"
+    with pytest.raises(FileNotFoundError):
+        read(zip_folder / "missing.xlsx")
+
+
+def test_plain_paths_are_not_archive_members(tmp_path):
+    path = tmp_path / "2025-01-10" / "domino.mhtml"
+    path.parent.mkdir()
+    path.write_bytes(b"plain")
+
+    assert split_archive_path(path) is None
+    assert read(path) == b"plain"
+
+
+def test_tar_members_with_dot_prefix(tmp_path):
+    path = tmp_path / "2025-01-10.tar.gz"
+    with tarfile.open(path, "w:gz") as tf:
+        for name, data in (("./a/domino.mhtml", b"from a"), ("./b/domino.mhtml", b"from b")):
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            tf.addfile(info, io.BytesIO(data))
+
+    assert split_archive_path(path / "b" / "domino.mhtml") == (path, "./b/domino.mhtml")
+    assert read(path / "b" / "domino.mhtml") == b"from b"
+
+
+def test_provider_finds_each_member_separately(config, zip_folder):
+    provider = SimpleNamespace(get_supported_names=lambda: ["domino*.mhtml"])
+
+    files = BaseProvider._find_input_files(provider, zip_folder)
+
+    assert [read(path) for path in files] == [b"from a", b"from b"]
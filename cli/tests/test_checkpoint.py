@@ -0,0 +1,120 @@
+"""
+워크플로우 체크포인트(CheckpointStore)와 재개(--resume) 테스트
+"""
+
+import os
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+
+from donmoa.core import checkpoint
+from donmoa.core.checkpoint import COMPLETED, PARTIAL, CheckpointStore, provider_fingerprint
+from donmoa.core.donmoa import Donmoa
+from donmoa.schemas import CashSchema, TransactionSchema
+
+DATE = "2025-01-10"
+OLD = 1_700_000_000
+
+
+@pytest.fixture
+def store(config, tmp_path):
+    return CheckpointStore()
+
+
+@pytest.fixture
+def folder(tmp_path):
+    folder = tmp_path / "input" / DATE
+    folder.mkdir(parents=True)
+    return folder
+
+
+def sample_data():
+    return {
+        "cash": [CashSchema(date=DATE, category="예금", account="신한은행", balance=1000.0)],
+        "positions": [],
+        "transactions": [
+            TransactionSchema(date=DATE, account="신한카드", transaction_type="지출", amount=-4500.0, category="식비"),
+        ],
+    }
+
+
+def test_resume_continues_unfinished_run_only(store, folder):
+    first = store.open_run(DATE, folder)
+    first.save_provider("manual", "abc", sample_data())
+
+    resumed = store.open_run(DATE, folder, resume=True)
+    assert resumed.run_id == first.run_id
+    assert resumed.load_provider("manual", "abc")["cash"][0].balance == 1000.0
+    assert resumed.load_provider("manual", "changed") is None
+
+    resumed.finish()
+    assert resumed.manifest["status"] == COMPLETED
+    assert not list(resumed.path.glob("*.pkl"))
+    assert store.open_run(DATE, folder, resume=True).run_id != first.run_id
+
+
+def test_partial_run_keeps_provider_results_and_drops_stages(store, folder):
+    run = store.open_run(DATE, folder)
+    run.save_provider("manual", "abc", sample_data())
+    run.record_failure("domino", "timeout")
+    run.complete_stage("export", {"files": {}}, data={"collected": sample_data(), "exported": sample_data()})
+
+    run.finish()
+
+    resumed = store.open_run(DATE, folder, resume=True)
+    assert resumed.run_id == run.run_id
+    assert resumed.manifest["status"] == PARTIAL
+    assert resumed.stage("export") is None
+    assert resumed.load_provider("manual", "abc") is not None
+    assert resumed.manifest["failed_providers"] == {"domino": "timeout"}
+
+
+def test_old_runs_are_pruned(store, folder, config):
+    config["checkpoint"]["keep_runs"] = 2
+    runs = [store.open_run(DATE, folder).path for _ in range(4)]
+
+    assert [path.exists() for path in runs] == [False, False, True, True]
+
+
+def test_fingerprint_changes_when_file_is_edited_in_place(config, folder):
+    provider = SimpleNamespace(
+        get_supported_names=lambda: ["manual*.xlsx"], account_mapping={"계좌": ["계좌"]}, provider_config={},
+    )
+    path = folder / "manual.xlsx"
+    path.write_bytes(b"a")
+    os.utime(path, (OLD, OLD))
+    os.utime(folder, (OLD, OLD))
+    before = provider_fingerprint(provider, folder)
+
+    # 같은 이름으로 다시 저장: 디렉토리 mtime은 그대로, 다음 실행에서 다시 확인
+    path.write_bytes(b"edited")
+    os.utime(path, (OLD + 100, OLD + 100))
+    os.utime(folder, (OLD, OLD))
+    checkpoint.input_index.refresh()
+    edited = provider_fingerprint(provider, folder)
+
+    provider.account_mapping = {"계좌": ["다른 계좌"]}
+
+    assert edited != before
+    assert provider_fingerprint(provider, folder) != edited
+
+
+def test_completed_export_stage_is_reused(store, folder):
+    donmoa = Donmoa()
+    run = store.open_run(DATE, folder)
+
+    files = donmoa.export_stage(sample_data(), run=run)
+    stage_data = run.stage_data("export")
+    assert len(stage_data["collected"]["transactions"]) == 1
+    assert len(stage_data["exported"]["transactions"]) == 1
+
+    # 재개: 같은 파일을 그대로 사용하고 거래를 다시 기록하지 않음
+    assert donmoa.export_stage(sample_data(), run=run) == files
+
+    # 내보낸 파일이 없어졌으면 저장한 데이터로 다시 씀 (이미 인덱스에 있는 거래도 포함)
+    for path in files.values():
+        path.unlink()
+    rewritten = donmoa.export_stage({"cash": [], "positions": [], "transactions": []}, run=run)
+    assert len(pd.read_csv(rewritten["transactions"])) == 1
+    assert len(pd.read_csv(rewritten["cash"])) == 1
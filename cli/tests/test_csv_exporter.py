@@ -0,0 +1,108 @@
+"""
+CSV 내보내기(내용 주소 저장, 거래 파티션) 테스트
+"""
+
+import json
+from datetime import datetime
+
+import pandas as pd
+import pytest
+
+from donmoa.core.csv_exporter import MANIFEST_FILE, CSVExporter, read_partition_index, read_transactions
+from donmoa.schemas import CashSchema, TransactionSchema
+
+
+def sample_data():
+    return {
+        "cash": [CashSchema(date="2025-01-10", category="예금", account="신한은행", balance=1000.0)],
+        "positions": [],
+        "transactions": [
+            TransactionSchema(date="2025-01-03", account="신한카드", transaction_type="지출", amount=-4500.0,
+                              category="식비", note="커피"),
+            TransactionSchema(date="2025-02-01", account="신한카드", transaction_type="지출", amount=-9000.0,
+                              category="식비", note="점심"),
+            TransactionSchema(date="2025-02-02", account="국민은행", transaction_type="입금", amount=100.0,
+                              category="이자"),
+        ],
+    }
+
+
+@pytest.fixture
+def exporter(config, tmp_path):
+    config["export"].update({"content_addressed": True, "partition_by": ["account", "month"]})
+    return CSVExporter(tmp_path / "export")
+
+
+def export(exporter, second=0):
+    return exporter.export_to_csv(sample_data(), timestamp=datetime(2025, 1, 10, 9, 0, second))
+
+
+def snapshot_tree(path):
+    return {p.relative_to(path).as_posix(): p.stat().st_mtime_ns for p in path.rglob("*")}
+
+
+def test_same_content_reuses_run_without_writing_into_it(exporter):
+    first = export(exporter)
+    run_dir = first["cash"].parent
+    exporter.export_summary(pd.DataFrame({"account": ["신한은행"], "value": [1000.0]}), run_dir)
+    before = snapshot_tree(run_dir)
+
+    second = export(exporter, second=1)
+    summary = exporter.export_summary(pd.DataFrame({"account": ["신한은행"], "value": [1.0]}), run_dir)
+
+    assert second == first
+    assert exporter.reused_dir == run_dir
+    assert summary == {"csv": run_dir / "summary.csv"}
+    assert snapshot_tree(run_dir) == before
+
+
+def test_run_with_missing_files_is_not_reused(exporter):
+    first = export(exporter)
+    first["cash"].unlink()
+
+    second = export(exporter, second=1)
+
+    assert second["cash"].parent != first["cash"].parent
+    assert all(path.exists() for path in second.values())
+    assert exporter.reused_dir is None
+
+
+def test_content_addressed_is_on_by_default(config, tmp_path):
+    assert "content_addressed" not in config["export"]
+    assert CSVExporter(tmp_path / "export").content_addressed
+
+
+def test_manifest_lists_derived_files(exporter):
+    run_dir = export(exporter)["cash"].parent
+    exporter.export_summary(pd.DataFrame({"value": [1.0]}), run_dir)
+
+    manifest = json.loads((run_dir / MANIFEST_FILE).read_text(encoding="utf-8"))
+
+    assert manifest["partition_by"] == ["account", "month"]
+    assert "transactions/_index.json" in manifest["derived"]
+    assert "summary.csv" in manifest["derived"]
+    assert all((run_dir / path).exists() for path in manifest["derived"])
+
+
+def test_changed_partition_keys_create_new_run(exporter, config):
+    first_dir = export(exporter)["cash"].parent
+    config["export"]["partition_by"] = ["account"]
+
+    second_dir = export(exporter, second=1)["cash"].parent
+
+    assert second_dir != first_dir
+    assert read_partition_index(first_dir)["partition_by"] == ["account", "month"]
+    assert read_partition_index(second_dir)["partition_by"] == ["account"]
+
+
+def test_partitions_read_back_with_filters(exporter):
+    run_dir = export(exporter)["cash"].parent
+
+    index = read_partition_index(run_dir)
+    february = read_transactions(run_dir, filters={"month": ["2025-02"]})
+    card = read_transactions(run_dir, filters={"account": ["신한카드"]}, start="2025-02-01")
+
+    assert index["rows"] == 3 and len(index["partitions"]) == 3
+    assert sorted(february["note"]) == ["", "점심"]
+    assert card["note"].tolist() == ["점심"]
+    assert len(read_transactions(run_dir)) == 3
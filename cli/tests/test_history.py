@@ -0,0 +1,87 @@
+"""
+이력 컬럼 캐시(HistoryEngine) 증분 갱신 테스트
+"""
+
+import pytest
+
+from donmoa.core.history import HistoryEngine
+from donmoa.core.history_store import HistoryStore
+from donmoa.schemas import CashSchema, PositionSchema
+
+
+def save(store, date, balance):
+    return store.save_snapshot(date, {"cash": [CashSchema(date=date, category="예금", account="신한은행", balance=balance)]})
+
+
+@pytest.fixture
+def store(config, tmp_path):
+    return HistoryStore(tmp_path / "history.db")
+
+
+def engine(store, tmp_path):
+    return HistoryEngine(store, tmp_path / "cache")
+
+
+def test_newer_snapshots_are_appended_in_place(store, tmp_path):
+    save(store, "2025-01-01", 100.0)
+    engine(store, tmp_path).refresh()
+    inodes = {p.name: p.stat().st_ino for p in (tmp_path / "cache").glob("*.npy")}
+
+    save(store, "2025-01-02", 200.0)
+    save(store, "2025-01-03", 300.0)
+    assert engine(store, tmp_path).refresh() == 2
+
+    # 추가 경로는 파일을 교체하지 않고 기존 파일에 덧붙임
+    assert {p.name: p.stat().st_ino for p in (tmp_path / "cache").glob("*.npy")} == inodes
+    assert engine(store, tmp_path).net_worth().tolist() == [100.0, 200.0, 300.0]
+
+
+def test_replaced_same_date_snapshot_is_rewritten(store, tmp_path):
+    save(store, "2025-01-01", 100.0)
+    save(store, "2025-01-02", 200.0)
+    engine(store, tmp_path).refresh()
+
+    save(store, "2025-01-02", 250.0)
+    history = engine(store, tmp_path)
+
+    assert history.refresh() == 1
+    assert history.net_worth().tolist() == [100.0, 250.0]
+
+
+def test_backfilled_older_snapshot_keeps_dates_sorted(store, tmp_path):
+    save(store, "2025-01-03", 300.0)
+    engine(store, tmp_path).refresh()
+
+    save(store, "2025-01-01", 100.0)
+    history = engine(store, tmp_path)
+    history.refresh()
+
+    assert history.net_worth().index.strftime("%Y-%m-%d").tolist() == ["2025-01-01", "2025-01-03"]
+
+
+def test_interrupted_append_is_repaired(store, tmp_path):
+    save(store, "2025-01-01", 100.0)
+    history = engine(store, tmp_path)
+    history.refresh()
+
+    # 컬럼에는 덧붙었지만 메타데이터 저장 전에 중단된 상황을 흉내냄
+    snapshot_id = save(store, "2025-01-02", 200.0)
+    history._append_columns("cash", history._encode_snapshots("cash", [snapshot_id]))
+
+    history = engine(store, tmp_path)
+    assert history.refresh() == 1
+    assert history.net_worth().tolist() == [100.0, 200.0]
+    assert history.refresh() == 0
+
+
+def test_positions_are_valued_at_cost_basis(store, tmp_path):
+    store.save_snapshot("2025-01-01", {
+        "cash": [CashSchema(date="2025-01-01", category="예수금", account="키움증권", balance=100.0)],
+        "positions": [PositionSchema(date="2025-01-01", account="키움증권", name="삼성전자", ticker="005930",
+                                     quantity=10, average_price=70000)],
+    })
+    history = engine(store, tmp_path)
+    history.refresh()
+
+    assert history.position_cost_by_ticker()["005930"].tolist() == [700000.0]
+    assert history.net_worth().tolist() == [700100.0]
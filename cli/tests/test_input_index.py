@@ -0,0 +1,95 @@
+"""
+입력 폴더 탐색 인덱스(InputIndex) 테스트
+"""
+
+import os
+import tarfile
+from pathlib import Path
+
+from donmoa.utils.input_index import InputIndex
+
+OLD = 1_700_000_000  # 안전 구간(MTIME_SAFETY_SECONDS)보다 충분히 오래된 시각
+
+
+def age(path: Path, seconds: float = OLD) -> None:
+    os.utime(path, (seconds, seconds))
+
+
+def reopen(index: InputIndex) -> InputIndex:
+    """저장 후 다음 실행처럼 새 인스턴스로 다시 엽니다."""
+    index.save()
+    return InputIndex(index.index_path)
+
+
+def make_folder(tmp_path: Path) -> Path:
+    folder = tmp_path / "input" / "2025-01-10"
+    folder.mkdir(parents=True)
+    (folder / "manual.xlsx").write_bytes(b"a")
+    (folder / "domino.mhtml").write_bytes(b"bb")
+    age(folder / "manual.xlsx")
+    age(folder)
+    return folder
+
+
+def test_lists_files_with_size_and_pattern_match(tmp_path):
+    folder = make_folder(tmp_path)
+    index = InputIndex(tmp_path / "index.json")
+
+    files = {file.name: file.size for file in index.list_files(folder)}
+
+    assert files == {"manual.xlsx": 1, "domino.mhtml": 2}
+    assert [file.name for file in index.find_files(folder, ["manual*.xlsx"])] == ["manual.xlsx"]
+
+
+def test_date_folders_include_archives_and_prefer_plain_folders(tmp_path):
+    root = tmp_path / "input"
+    make_folder(tmp_path)
+    (root / "2025-01-10.zip").write_bytes(b"")
+    with tarfile.open(root / "20250109.tar.gz", "w:gz"):
+        pass
+    (root / "notes").mkdir()
+
+    folders = InputIndex(tmp_path / "index.json").date_folders(root)
+
+    assert [(date, path.name) for date, path in folders] == [
+        ("2025-01-09", "20250109.tar.gz"), ("2025-01-10", "2025-01-10"),
+    ]
+
+
+def test_file_edited_in_place_is_restatted(tmp_path):
+    folder = make_folder(tmp_path)
+    index = InputIndex(tmp_path / "index.json")
+    index.list_files(folder)
+
+    # 같은 이름으로 다시 저장: 디렉토리 mtime은 그대로
+    (folder / "manual.xlsx").write_bytes(b"edited")
+    age(folder / "manual.xlsx", OLD + 100)
+    age(folder)
+
+    index = reopen(index)
+    manual = index.find_files(folder, ["manual.xlsx"])[0]
+
+    assert (manual.size, manual.mtime) == (6, OLD + 100)
+    assert reopen(index).find_files(folder, ["manual.xlsx"])[0].size == 6
+
+
+def test_removed_file_triggers_rescan(tmp_path):
+    folder = make_folder(tmp_path)
+    index = InputIndex(tmp_path / "index.json")
+    index.list_files(folder)
+
+    (folder / "domino.mhtml").unlink()
+    age(folder)
+
+    assert [file.name for file in reopen(index).list_files(folder)] == ["manual.xlsx"]
+
+
+def test_new_file_in_folder_is_found_after_refresh(tmp_path):
+    folder = make_folder(tmp_path)
+    index = InputIndex(tmp_path / "index.json")
+    index.list_files(folder)
+
+    (folder / "banksalad.xlsx").write_bytes(b"")
+    index.refresh()
+
+    assert "banksalad.xlsx" in {file.name for file in index.list_files(folder)}
@@ -0,0 +1,125 @@
+"""
+Provider 격리 실행(run_isolated)과 격리 워커 안의 병렬 파싱 테스트
+"""
+
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from donmoa.core.data_collector import DataCollector
+from donmoa.core import data_collector
+from donmoa.core.isolation import run_isolated
+from donmoa.providers.base import BaseProvider
+from donmoa.schemas import CashSchema
+from donmoa.utils.config import config_manager
+
+pytestmark = pytest.mark.skipif(not hasattr(os, "fork"), reason="fork 방식 워커가 필요합니다")
+
+
+class PidProvider(BaseProvider):
+    """파일마다 파싱한 프로세스의 pid와 부모 pid를 현금 행으로 돌려주는 Provider"""
+
+    def __init__(self, behaviour: str = "ok"):
+        super().__init__("pid", {})
+        self.behaviour = behaviour
+        self.add_account_mapping({"계좌": ["계좌"]})
+
+    def get_supported_names(self):
+        return ["pid*.txt"]
+
+    def parse_raw(self, file_path: Path):
+        if self.behaviour == "hang":
+            time.sleep(60)
+        if self.behaviour == "crash":
+            os._exit(3)
+        if self.behaviour == "memory":
+            raise MemoryError
+        return {"pid": os.getpid(), "ppid": os.getppid()}
+
+    def parse_cash(self, data):
+        return [CashSchema(date="2025-01-10", category=str(data["ppid"]), account="계좌", balance=data["pid"])]
+
+    def parse_positions(self, data):
+        return []
+
+    def parse_transactions(self, data):
+        return []
+
+
+class ConfigProvider(PidProvider):
+    """워커에서 읽은 설정 값을 현금 행으로 돌려주는 Provider"""
+
+    def parse_cash(self, data):
+        marker = config_manager.get("providers.pid.marker")
+        return [CashSchema(date="2025-01-10", category=marker, account="계좌", balance=0)]
+
+
+@pytest.fixture
+def input_dir(config, tmp_path):
+    config["performance"].update({"isolate_providers": True, "max_parse_workers": 2})
+    folder = tmp_path / "input" / "2025-01-10"
+    folder.mkdir(parents=True)
+    for name in ("pid_a.txt", "pid_b.txt", "pid_c.txt"):
+        (folder / name).write_text("x", encoding="utf-8")
+    return folder
+
+
+def test_multiple_files_are_parsed_in_parallel_inside_isolated_worker(input_dir, caplog):
+    result = run_isolated(PidProvider(), input_dir, timeout=60)
+
+    assert result.ok, result.message
+    cash = result.data["cash"]
+    assert [record.source_file for record in cash] == ["pid_a.txt", "pid_b.txt", "pid_c.txt"]
+    # 병렬 파싱이면 파일은 격리 워커의 자식 프로세스에서 파싱됨 (부모가 테스트 프로세스가 아님)
+    assert all(record.category != str(os.getpid()) for record in cash)
+    assert "병렬 파싱 실패" not in caplog.text
+
+
+def test_timeout_kills_worker(input_dir):
+    started = time.perf_counter()
+    result = run_isolated(PidProvider("hang"), input_dir, timeout=1)
+
+    assert result.status == "timeout"
+    assert time.perf_counter() - started < 30
+
+
+def test_crashed_worker_is_reported(input_dir):
+    result = run_isolated(PidProvider("crash"), input_dir, timeout=60)
+
+    assert result.status == "error"
+    assert "exit code" in result.message
+
+
+def test_memory_error_is_reported(input_dir):
+    result = run_isolated(PidProvider("memory"), input_dir, timeout=60)
+
+    assert result.status == "memory"
+
+
+def test_failed_provider_is_excluded_and_recorded(input_dir):
+    collector = DataCollector()
+    provider = PidProvider("crash")
+
+    assert collector._collect_provider(provider, input_dir) is None
+    assert "pid" in collector.failed_providers
+
+
+def test_collects_in_process_without_fork(input_dir, monkeypatch, caplog):
+    monkeypatch.setattr(data_collector, "fork_context", lambda: None)
+    collector = DataCollector()
+
+    data = collector._collect_provider(PidProvider(), input_dir)
+    collector._collect_provider(PidProvider(), input_dir)
+
+    assert len(data["cash"]) == 3
+    assert caplog.text.count("격리 없이 수집") == 1
+
+
+def test_worker_uses_config_passed_from_parent(input_dir, config):
+    config["providers"] = {"pid": {"marker": "from-parent"}}
+
+    result = run_isolated(ConfigProvider(), input_dir, timeout=60)
+
+    assert {record.category for record in result.data["cash"]} == {"from-parent"}
@@ -0,0 +1,53 @@
+"""
+마이그레이션 제약 조건 생성 스크립트(migration_constraints) 테스트
+"""
+
+from pathlib import Path
+
+import pytest
+
+from donmoa.schemas.migration_constraints import main
+
+MIGRATIONS = Path(__file__).resolve().parents[2] / "packages" / "database" / "migrations"
+
+
+@pytest.fixture
+def output(tmp_path):
+    path = tmp_path / "server_constraints.py"
+    path.write_text("ORIGINAL", encoding="utf-8")
+    return path
+
+
+def test_help_does_not_write(output):
+    with pytest.raises(SystemExit) as exc:
+        main(["--help", "--output", str(output)])
+
+    assert exc.value.code == 0
+    assert output.read_text(encoding="utf-8") == "ORIGINAL"
+
+
+def test_invalid_directory_is_rejected(tmp_path, output):
+    assert main([str(tmp_path / "missing"), "--output", str(output)]) == 1
+    assert main([str(tmp_path), "--output", str(output)]) == 1
+    assert output.read_text(encoding="utf-8") == "ORIGINAL"
+
+
+def test_missing_upload_tables_are_rejected(tmp_path, output):
+    (tmp_path / "001_users.sql").write_text(
+        "CREATE TABLE IF NOT EXISTS users (\n  email TEXT NOT NULL\n);", encoding="utf-8"
+    )
+
+    assert main([str(tmp_path), "--output", str(output)]) == 1
+    assert output.read_text(encoding="utf-8") == "ORIGINAL"
+
+
+@pytest.mark.skipif(not MIGRATIONS.is_dir(), reason="마이그레이션 디렉토리가 필요합니다")
+def test_generates_all_upload_tables(output):
+    assert main([str(MIGRATIONS), "--output", str(output)]) == 0
+
+    namespace = {}
+    exec(output.read_text(encoding="utf-8"), namespace)
+    assert {"snapshots", "snapshot_cash", "snapshot_positions", "snapshot_transactions"} <= set(
+        namespace["TABLE_CONSTRAINTS"]
+    )
+    assert not list(output.parent.glob("*.tmp"))
@@ -0,0 +1,37 @@
+"""
+통화별 최소 단위 금액 유틸리티와 요약 총액 표시 테스트
+"""
+
+import pytest
+
+from donmoa.core.data_collector import DataCollector
+from donmoa.schemas import CashSchema
+from donmoa.utils.money import currency_digits, format_amount, to_minor
+
+
+@pytest.mark.parametrize("currency, digits", [("KRW", 0), ("JPY", 0), ("usd", 2), ("EUR", 2), (None, 2)])
+def test_currency_digits_follow_minor_units(currency, digits):
+    assert currency_digits(currency) == digits
+
+
+def test_format_amount_keeps_minor_units():
+    assert format_amount(1234567.4, "KRW") == "1,234,567"
+    assert format_amount(1234.5, "USD") == "1,234.50"
+    assert format_amount(-0.05, "USD", sign=True) == "-0.05"
+    assert format_amount(10, "JPY", sign=True) == "+10"
+    assert to_minor(1234.5, "USD") == 123450
+
+
+def test_portfolio_totals_log_cents(config, caplog):
+    data = {
+        "cash": [
+            CashSchema(date="2025-01-10", category="예수금", account="키움증권", balance=10.25, currency="USD"),
+            CashSchema(date="2025-01-10", category="예금", account="신한은행", balance=1000.0),
+        ],
+        "positions": [],
+    }
+
+    DataCollector().summarize_portfolio(data)
+
+    assert "USD 총액: 10.25" in caplog.text
+    assert "KRW 총액: 1,000 " in caplog.text
@@ -0,0 +1,69 @@
+"""
+한국식 숫자 표기 파싱(parse_number / parse_numbers) 테스트
+"""
+
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from donmoa.utils.number_utils import MAX_VECTOR_WIDTH, parse_number, parse_numbers
+
+EXPECTED = [
+    ("1234", 1234.0),
+    ("-1234.5", -1234.5),
+    ("1,234원", 1234.0),
+    ("₩ 12,000", 12000.0),
+    ("1.2만", 12000.0),
+    ("3억 5,000만원", 350_000_000.0),
+    ("1조 2억", 1_000_200_000_000.0),
+    ("△500", -500.0),
+    ("▼1,000", -1000.0),
+    ("(1,000)", -1000.0),
+    ("12.5%", 12.5),
+    ("--5", -5.0),
+    ("1e5", 15.0),
+    ("5.", 5.0),
+    (".5", 0.5),
+    ("0.1", 0.1),
+    ("１２３", 0.0),
+    ("١٢٣", 0.0),
+    ("2024-01-01", 0.0),
+    ("1.2.3", 0.0),
+    ("", 0.0),
+    ("abc", 0.0),
+    ("-", 0.0),
+]
+
+# 행렬 폭 제한보다 긴 문자열은 값 단위 경로로 처리됨
+LONG_TEXT = "메모 " * MAX_VECTOR_WIDTH + "1,500원"
+
+
+@pytest.mark.parametrize("text, expected", EXPECTED)
+def test_parse_number(text, expected):
+    assert parse_number(text) == pytest.approx(expected)
+
+
+def test_scalar_and_vector_parsers_agree():
+    texts = [text for text, _ in EXPECTED] + [LONG_TEXT]
+
+    vector = parse_numbers(pd.Series(texts, dtype=object))
+    scalar = np.array([parse_number(text) for text in texts])
+
+    np.testing.assert_array_equal(vector, scalar)
+    assert vector[-1] == 1500.0
+
+
+def test_invalid_values_use_default():
+    assert parse_number("2024-01-01", default=-1.0) == -1.0
+    assert math.isnan(parse_number("abc", default=float("nan")))
+    assert parse_numbers(["abc", None, "7"], default=-1.0).tolist() == [-1.0, -1.0, 7.0]
+
+
+def test_mixed_and_numeric_inputs():
+    assert parse_number(None) == 0.0
+    assert parse_number(float("nan")) == 0.0
+    assert parse_number(3) == 3.0
+    assert parse_numbers([1, "2만", None, 2.5]).tolist() == [1.0, 20000.0, 0.0, 2.5]
+    assert parse_numbers(pd.Series([1, 2], index=[5, 6])).tolist() == [1.0, 2.0]
@@ -0,0 +1,171 @@
+"""
+업로드 대기열(UploadOutbox) 테스트
+"""
+
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+import requests
+
+from donmoa.core.csv_exporter import CSVExporter
+from donmoa.core.outbox import UploadOutbox
+from donmoa.schemas import CashSchema, TransactionSchema
+
+HEADER = "date,account,transaction_type,amount,category,note\n"
+
+
+def write_export(path: Path, *transactions: str, cash: str = "2025-01-10,현금,신한,1000.0,KRW\n") -> Path:
+    path.mkdir(parents=True)
+    (path / "cash.csv").write_text("date,category,account,balance,currency\n" + cash, encoding="utf-8")
+    (path / "transactions.csv").write_text(HEADER + "".join(transactions), encoding="utf-8")
+    return path
+
+
+class FakeResponse:
+    def __init__(self, status_code: int, body=None):
+        self.status_code = status_code
+        self.text = ""
+        self._body = body or {}
+
+    def json(self):
+        return self._body
+
+
+class FakeUploader:
+    """post 호출을 기록하고 미리 정한 결과를 돌려주는 업로더"""
+
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = []
+
+    def is_configured(self) -> bool:
+        return True
+
+    def post(self, export_path, snapshot_date, notes=None, extra_headers=None):
+        self.calls.append((Path(export_path).name, dict(extra_headers or {})))
+        outcome = self.outcomes.pop(0) if self.outcomes else FakeResponse(201, {"snapshot_id": 1})
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+COFFEE = "2025-01-10,신한카드,지출,-4500.0,식비,커피\n"
+LUNCH = "2025-01-10,신한카드,지출,-9000.0,식비,점심\n"
+
+
+@pytest.fixture
+def outbox(config, tmp_path):
+    return UploadOutbox(tmp_path / "outbox.db", uploader=FakeUploader())
+
+
+def test_same_content_is_queued_once(outbox, tmp_path):
+    export = write_export(tmp_path / "run1", COFFEE)
+
+    key = outbox.enqueue(export, "2025-01-10")
+
+    assert outbox.enqueue(export, "2025-01-10") == key
+    assert outbox.counts() == {"pending": 1}
+
+
+def test_reexport_of_same_data_gets_same_key(config, tmp_path):
+    config["export"]["content_addressed"] = False
+    exporter = CSVExporter(tmp_path / "export")
+
+    def collect(collected_at):
+        return {
+            "cash": [CashSchema(date="2025-01-10", category="예금", account="신한은행", balance=1000.0,
+                                collected_at=collected_at)],
+            "positions": [],
+            "transactions": [TransactionSchema(date="2025-01-10", account="신한카드", transaction_type="지출",
+                                               amount=-4500.0, category="식비", collected_at=collected_at)],
+        }
+
+    first = exporter.export_to_csv(collect("2025-01-10T09:00:00"), timestamp=datetime(2025, 1, 10, 9))
+    second = exporter.export_to_csv(collect("2025-01-10T10:00:00"), timestamp=datetime(2025, 1, 10, 10))
+    first_dir, second_dir = first["cash"].parent, second["cash"].parent
+
+    assert first_dir != second_dir
+    assert (first_dir / "cash.csv").read_bytes() != (second_dir / "cash.csv").read_bytes()
+    assert UploadOutbox.idempotency_key(first_dir, "2025-01-10") == UploadOutbox.idempotency_key(second_dir, "2025-01-10")
+    assert UploadOutbox.idempotency_key(first_dir, "2025-01-10") != UploadOutbox.idempotency_key(first_dir, "2025-01-11")
+
+
+def test_newer_export_with_all_transactions_supersedes(outbox, tmp_path):
+    first = outbox.enqueue(write_export(tmp_path / "run1", COFFEE), "2025-01-10")
+    second = outbox.enqueue(write_export(tmp_path / "run2", COFFEE, LUNCH), "2025-01-10")
+
+    assert outbox.get(first)["status"] == "superseded"
+    assert outbox.get(second)["status"] == "pending"
+
+
+def test_deduped_export_keeps_previous_item(outbox, tmp_path):
+    first = outbox.enqueue(write_export(tmp_path / "run1", COFFEE), "2025-01-10")
+    # 두 번째 실행: 거래는 중복 제거로 빠지고 잔액만 바뀜
+    second = outbox.enqueue(
+        write_export(tmp_path / "run2", cash="2025-01-10,현금,신한,2000.0,KRW\n"), "2025-01-10"
+    )
+
+    assert [item["idempotency_key"] for item in outbox.pending()] == [first, second]
+
+
+def test_identical_transactions_are_compared_by_count(outbox, tmp_path):
+    first = outbox.enqueue(write_export(tmp_path / "run1", COFFEE, COFFEE), "2025-01-10")
+    outbox.enqueue(write_export(tmp_path / "run2", COFFEE, LUNCH), "2025-01-10")
+
+    assert outbox.get(first)["status"] == "pending"
+
+
+def test_drain_sends_in_order_with_idempotency_key(outbox, tmp_path):
+    first = outbox.enqueue(write_export(tmp_path / "run1", COFFEE), "2025-01-10")
+    second = outbox.enqueue(write_export(tmp_path / "run2", LUNCH), "2025-01-10")
+
+    result = outbox.drain()
+
+    assert result["sent"] == 2
+    assert outbox.uploader.calls == [
+        ("run1", {"Idempotency-Key": first}),
+        ("run2", {"Idempotency-Key": second}),
+    ]
+
+
+def test_offline_drain_schedules_retry_and_skips_rest(outbox, tmp_path):
+    outbox.uploader.outcomes = [requests.exceptions.ConnectionError("offline")]
+    first = outbox.enqueue(write_export(tmp_path / "run1", COFFEE), "2025-01-10")
+    outbox.enqueue(write_export(tmp_path / "run2", LUNCH), "2025-01-11")
+
+    result = outbox.drain()
+
+    assert result == {"sent": 0, "retry": 1, "failed": 0, "skipped": 1}
+    assert outbox.get(first)["attempts"] == 1
+    assert outbox.pending(due_only=True)[0]["snapshot_date"] == "2025-01-11"
+
+
+def test_client_error_marks_failed(outbox, tmp_path):
+    outbox.uploader.outcomes = [FakeResponse(422)]
+    key = outbox.enqueue(write_export(tmp_path / "run1", COFFEE), "2025-01-10")
+
+    assert outbox.drain() == {"sent": 0, "retry": 0, "failed": 1, "skipped": 0}
+    assert outbox.get(key)["status"] == "failed"
+    assert outbox.retry_failed() == 1
+
+
+def test_upload_command_sends_outbox_idempotency_key(config, tmp_path, monkeypatch):
+    from click.testing import CliRunner
+
+    from donmoa.cli.main import cli
+    from donmoa.core import uploader as uploader_module
+
+    config["api"] = {"url": "http://localhost", "token": "token"}
+    config["upload_validation"] = {"enabled": False}
+    export = write_export(tmp_path / "run1", COFFEE)
+    sent = {}
+
+    def fake_post(url, files, data, headers, timeout):
+        sent.update(headers)
+        return FakeResponse(500)
+
+    monkeypatch.setattr(uploader_module.requests, "post", fake_post)
+    CliRunner().invoke(cli, ["upload", "-e", str(export), "-d", "2025-01-10"])
+
+    assert sent["Idempotency-Key"] == UploadOutbox.idempotency_key(export, "2025-01-10")
@@ -0,0 +1,82 @@
+"""
+Provider/파일 간 현금·포지션 중복 조정(reconcile) 테스트
+"""
+
+from donmoa.core.reconcile import cash_key, position_key, reconcile_providers
+from donmoa.schemas import CashSchema, PositionSchema
+
+
+def cash(provider, account="키움증권", balance=1000.0, currency="KRW", source_file=None):
+    return CashSchema(
+        date="2025-01-10", category="예수금", account=account, balance=balance,
+        currency=currency, provider=provider, source_file=source_file,
+    )
+
+
+def position(provider, ticker="005930", name="삼성전자", account="키움증권", source_file=None):
+    return PositionSchema(
+        date="2025-01-10", account=account, name=name, ticker=ticker, quantity=10,
+        average_price=70000, provider=provider, source_file=source_file,
+    )
+
+
+def test_higher_precedence_provider_wins_regardless_of_order():
+    data = {"cash": [cash("banksalad", balance=999.0), cash("domino", balance=1000.0)], "positions": []}
+
+    report = reconcile_providers(data, ["domino", "banksalad"])
+
+    assert [(c.provider, c.balance) for c in data["cash"]] == [("domino", 1000.0)]
+    assert report.counts == {"cash": {"banksalad": 1}}
+    assert report.kept_by["cash"] == [("domino", None)]
+
+
+def test_unlisted_providers_rank_by_collection_order():
+    data = {"cash": [cash("b"), cash("a")]}
+
+    reconcile_providers(data, [])
+
+    assert [c.provider for c in data["cash"]] == ["b"]
+
+
+def test_rows_from_the_same_source_are_kept_together():
+    data = {"cash": [cash("domino", balance=1.0), cash("domino", balance=2.0), cash("banksalad")]}
+
+    reconcile_providers(data, ["domino"])
+
+    assert [c.balance for c in data["cash"]] == [1.0, 2.0]
+
+
+def test_keys_separate_currency_and_account():
+    data = {"cash": [
+        cash("domino"), cash("banksalad", currency="USD"), cash("banksalad", account="신한은행"),
+    ]}
+
+    report = reconcile_providers(data, ["domino", "banksalad"])
+
+    assert report.total == 0
+    assert len(data["cash"]) == 3
+
+
+def test_positions_match_normalized_ticker_or_name():
+    assert position_key(position("a", ticker="A005930")) == position_key(position("b", ticker="005930"))
+    assert position_key(position("a", ticker="")) == position_key(position("b", ticker="", name="삼성전자 "))
+    assert cash_key(cash("a", currency="usd")) == cash_key(cash("b", currency="USD"))
+
+
+def test_same_account_in_two_files_of_one_provider_is_counted_once():
+    data = {
+        "cash": [
+            cash("manual", balance=1.0, source_file="manual.xlsx"),
+            cash("manual", balance=2.0, source_file="manual_b.xlsx"),
+        ],
+        "positions": [
+            position("manual", source_file="manual.xlsx"),
+            position("manual", ticker="AAPL", source_file="manual_b.xlsx"),
+        ],
+    }
+
+    report = reconcile_providers(data, ["manual"])
+
+    assert [c.balance for c in data["cash"]] == [1.0]
+    assert len(data["positions"]) == 2
+    assert report.file_conflicts == {"manual": [("manual_b.xlsx", "manual.xlsx")]}
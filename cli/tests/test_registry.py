@@ -0,0 +1,31 @@
+"""
+Provider 레지스트리(파일 패턴 기반 선택) 테스트
+"""
+
+from donmoa.providers import DominoProvider
+from donmoa.providers.registry import BUILTIN_PROVIDERS, select_providers
+
+SPECS = {spec.name: spec for spec in BUILTIN_PROVIDERS}
+
+
+def selected(file_names):
+    return [spec.name for spec in select_providers(BUILTIN_PROVIDERS, file_names)]
+
+
+def test_default_patterns_come_from_the_spec(config):
+    provider = SPECS["banksalad"].create(config)
+
+    assert provider.get_supported_names() == ["banksalad*.xlsx"]
+    assert DominoProvider().get_supported_names() == ["domino*.mhtml"]
+    assert selected(["banksalad_2025.xlsx", "manual.xlsx"]) == ["banksalad", "manual"]
+
+
+def test_configured_patterns_drive_selection_and_discovery(config):
+    config["providers"] = {"banksalad": {"file_patterns": "bank_*.xlsx"}, "manual": {"file_patterns": ["수동*.xlsx"]}}
+    banksalad = SPECS["banksalad"].create(config)
+    manual = SPECS["manual"].create(config)
+
+    assert selected(["bank_2025.xlsx"]) == ["banksalad"]
+    assert selected(["banksalad.xlsx", "수동입력.xlsx"]) == ["manual"]
+    assert banksalad.get_supported_names() == ["bank_*.xlsx"]
+    assert manual.get_supported_names() == ["수동*.xlsx"]
@@ -0,0 +1,67 @@
+"""
+sync 파이프라인 업로드 단계 테스트
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from donmoa.core import sync_pipeline
+from donmoa.core.sync_pipeline import SyncPipeline
+
+
+class FakeResponse:
+    def __init__(self, status_code: int, body=None):
+        self.status_code = status_code
+        self._body = body
+
+    def json(self):
+        if self._body is None:
+            raise ValueError("JSON이 아닙니다")
+        return self._body
+
+
+class FakeUploader:
+    def __init__(self, response):
+        self.response = response
+
+    def post(self, export_path, snapshot_date, notes=None):
+        return self.response
+
+
+def upload(response, tmp_path):
+    """대기열 없이(enqueue_upload가 None) 직접 업로드 경로로 한 폴더를 보냅니다."""
+    donmoa = SimpleNamespace(data_collector=SimpleNamespace(), enqueue_upload=lambda *args: None)
+    pipeline = SyncPipeline(donmoa=donmoa, upload=False)
+    pipeline.uploader = FakeUploader(response)
+    results = [{"folder": "2025-01-10", "status": "exported"}]
+
+    async def run():
+        queue = asyncio.Queue()
+        await queue.put((0, "2025-01-10", tmp_path))
+        await queue.put(sync_pipeline._DONE)
+        await pipeline._upload_stage(results, queue, None)
+
+    asyncio.run(run())
+    return results[0]
+
+
+@pytest.mark.parametrize("status_code", [200, 201])
+def test_direct_upload_accepts_created(config, tmp_path, status_code):
+    result = upload(FakeResponse(status_code, {"snapshot_id": 7}), tmp_path)
+
+    assert result["upload"] == "success"
+    assert result["snapshot_id"] == 7
+    assert result["status"] == "exported"
+
+
+def test_direct_upload_without_json_body_is_still_success(config, tmp_path):
+    assert upload(FakeResponse(201), tmp_path)["upload"] == "success"
+
+
+def test_direct_upload_error_status(config, tmp_path):
+    result = upload(FakeResponse(500, {}), tmp_path)
+
+    assert result["status"] == "error"
+    assert result["upload"] == "HTTP 500"
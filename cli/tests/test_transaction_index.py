@@ -0,0 +1,105 @@
+"""
+거래 중복 제거 인덱스(TransactionIndex)와 내보내기 단계의 중복 제거 테스트
+"""
+
+import sqlite3
+
+from donmoa.core.donmoa import Donmoa
+from donmoa.core.history_store import HistoryStore
+from donmoa.core.transaction_index import TransactionIndex
+from donmoa.schemas import TransactionSchema
+
+
+def txn(amount=-12000.0, note="커피", provider="banksalad", date="2025-01-10"):
+    return TransactionSchema(
+        date=date, account="신한카드", transaction_type="지출", amount=amount,
+        category="식비", note=note, provider=provider,
+    )
+
+
+def test_new_transactions_pass_and_recorded_ones_are_dropped(tmp_path):
+    index = TransactionIndex(tmp_path / "index.db")
+    first = [txn(), txn(amount=-5000.0)]
+
+    assert index.filter_new(first) == first
+    assert index.add(first) == 2
+    assert index.filter_new([txn(), txn(amount=-7000.0)]) == [txn(amount=-7000.0)]
+
+
+def test_identical_transactions_from_one_provider_are_kept(tmp_path):
+    index = TransactionIndex(tmp_path / "index.db")
+    batch = [txn(), txn()]
+
+    assert len(index.filter_new(batch)) == 2
+
+
+def test_only_unrecorded_copies_pass(tmp_path):
+    index = TransactionIndex(tmp_path / "index.db")
+    index.add([txn(), txn()])
+
+    assert index.filter_new([txn(), txn()]) == []
+    assert len(index.filter_new([txn(), txn(), txn()])) == 1
+
+    index.add(index.filter_new([txn(), txn(), txn()]))
+    assert index.filter_new([txn(), txn(), txn()]) == []
+
+
+def test_same_transaction_from_different_providers_is_kept_once(tmp_path):
+    index = TransactionIndex(tmp_path / "index.db")
+    batch = [txn(provider="manual"), txn(provider="banksalad"), txn(provider="banksalad")]
+
+    kept = index.filter_new(batch)
+
+    assert [t.provider for t in kept] == ["banksalad", "banksalad"]
+
+
+def test_index_without_occurrences_column_is_migrated(tmp_path):
+    db_path = tmp_path / "index.db"
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            "CREATE TABLE seen_transactions (fingerprint BLOB PRIMARY KEY, date TEXT NOT NULL, "
+            "first_seen_at TEXT NOT NULL) WITHOUT ROWID"
+        )
+        conn.execute(
+            "INSERT INTO seen_transactions VALUES (?, ?, ?)",
+            (TransactionIndex.fingerprint(txn()), "2025-01-10", "2025-01-10T00:00:00")
+        )
+
+    index = TransactionIndex(db_path)
+
+    assert len(index.filter_new([txn(), txn()])) == 1
+
+
+def test_rerun_keeps_full_transactions_in_history(config):
+    donmoa = Donmoa()
+    donmoa.data_collector.snapshot_date = "2025-01-10"
+    data = {"cash": [], "positions": [], "transactions": [txn(), txn(amount=-5000.0)]}
+
+    for _ in range(2):
+        donmoa.export_stage(data)
+        donmoa.history_stage(data)
+
+    assert len(data["transactions"]) == 2
+    history = HistoryStore()
+    snapshot_id = history.list_snapshots()[0]["id"]
+    assert len(history.get_snapshot_rows("transactions", [snapshot_id])) == 2
+
+
+def test_export_stage_exports_only_new_transactions(config):
+    donmoa = Donmoa()
+    data = {"cash": [], "positions": [], "transactions": [txn()]}
+
+    donmoa.export_stage(data)
+    exported = donmoa.data_collector.dedup_transactions(dict(data, transactions=[txn(), txn(amount=-1.0)]))
+
+    assert exported["transactions"] == [txn(amount=-1.0)]
+
+
+def test_dedup_is_on_by_default(config):
+    config["dedup"].pop("transactions")
+    collector = Donmoa().data_collector
+    data = {"transactions": [txn()]}
+
+    collector.commit_transactions(collector.dedup_transactions(data))
+
+    assert collector.dedup_transactions(data)["transactions"] == []